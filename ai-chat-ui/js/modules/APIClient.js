@@ -2,6 +2,12 @@
 class APIClient {
     constructor(baseUrl = 'http://localhost:8000/api') {
         this.baseUrl = baseUrl;
+        this.gameId = null;  // 현재 게임 세션 ID
+    }
+
+    // 게임 세션 ID가 포함된 URL 생성
+    gameUrl(path) {
+        return `${this.baseUrl}${path}?game_id=${encodeURIComponent(this.gameId)}`;
     }
 
     // 서버 연결 상태 확인
@@ -39,6 +45,9 @@ class APIClient {
             console.log('게임 시작 응답:', response.status, response.statusText);
             const data = await response.json();
             console.log('게임 시작 데이터:', data);
+            if (data.success) {
+                this.gameId = data.game_id;
+            }
             
             return data;
         } catch (error) {
@@ -50,7 +59,7 @@ class APIClient {
     // 게임 상태 조회
     async getGameState() {
         try {
-            const response = await fetch(`${this.baseUrl}/game/state`);
+            const response = await fetch(this.gameUrl('/game/state'));
             const data = await response.json();
             return data;
         } catch (error) {
@@ -62,7 +71,7 @@ class APIClient {
     // 자기소개 완료
     async completeIntroduction() {
         try {
-            const response = await fetch(`${this.baseUrl}/game/complete-introduction`, {
+            const response = await fetch(this.gameUrl('/game/complete-introduction'), {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
@@ -80,7 +89,7 @@ class APIClient {
     // AI 자기소개
     async getAIIntroduction() {
         try {
-            const response = await fetch(`${this.baseUrl}/game/ai-introduction`, {
+            const response = await fetch(this.gameUrl('/game/ai-introduction'), {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
@@ -97,7 +106,7 @@ class APIClient {
     // AI 순차 자기소개
     async getAIIntroductionSequential() {
         try {
-            const response = await fetch(`${this.baseUrl}/game/ai-introduction-sequential`, {
+            const response = await fetch(this.gameUrl('/game/ai-introduction-sequential'), {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
@@ -114,7 +123,7 @@ class APIClient {
     // 채팅 메시지 전송
     async sendMessage(message) {
         try {
-            const response = await fetch(`${this.baseUrl}/chat`, {
+            const response = await fetch(this.gameUrl('/chat'), {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
@@ -133,7 +142,7 @@ class APIClient {
     // 투표 제출
     async submitVote(voter, target) {
         try {
-            const response = await fetch(`${this.baseUrl}/vote`, {
+            const response = await fetch(this.gameUrl('/vote'), {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
@@ -154,7 +163,7 @@ class APIClient {
     // AI 먼저 말하기
     async aiSpeakFirst() {
         try {
-            const response = await fetch(`${this.baseUrl}/game/ai-speak-first`, {
+            const response = await fetch(this.gameUrl('/game/ai-speak-first'), {
                 method: 'POST'
             });
             
@@ -169,7 +178,7 @@ class APIClient {
     // AI 순차 발화
     async aiSpeakSequential() {
         try {
-            const response = await fetch(`${this.baseUrl}/game/ai-speak-sequential`, {
+            const response = await fetch(this.gameUrl('/game/ai-speak-sequential'), {
                 method: 'POST'
             });
             
@@ -184,7 +193,7 @@ class APIClient {
     // AI 투표
     async aiVote() {
         try {
-            const response = await fetch(`${this.baseUrl}/game/ai-vote`, {
+            const response = await fetch(this.gameUrl('/game/ai-vote'), {
                 method: 'POST'
             });
             
@@ -199,11 +208,17 @@ class APIClient {
     // 자동 진행 (밤/투표)
     async autoProgress() {
         try {
-            const response = await fetch(`${this.baseUrl}/game/auto-progress`, {
+            const response = await fetch(this.gameUrl('/game/auto-progress'), {
                 method: 'POST'
             });
             
-            const data = await response.json();
+            let data = await response.json();
+            // 서버가 진행을 예약한 경우 예약 시각이 지난 뒤 상태를 다시 조회
+            if (data.scheduled) {
+                await this.waitForScheduled(data);
+                const state = await this.getGameState();
+                data = { success: true, phase: state.phase, turn: state.turn };
+            }
             return data;
         } catch (error) {
             console.error('자동 진행 오류:', error);
@@ -211,10 +226,15 @@ class APIClient {
         }
     }
 
+    // 서버에 예약된 자동 진행 시각까지 대기
+    async waitForScheduled(progress) {
+        await new Promise(resolve => setTimeout(resolve, progress.delay * 1000 + 300));
+    }
+
     // 다음 페이즈 (수동)
     async nextPhase() {
         try {
-            const response = await fetch(`${this.baseUrl}/game/next-phase`, {
+            const response = await fetch(this.gameUrl('/game/next-phase'), {
                 method: 'POST'
             });
 
@@ -521,6 +521,10 @@ class EventHandler {
             if (data.success) {
                 // 자동 진행 처리
                 if (data.auto_progress) {
+                    // 서버가 예약한 턴 진행 시각까지 대기
+                    if (data.auto_progress.scheduled) {
+                        await this.gameManager.apiClient.waitForScheduled(data.auto_progress);
+                    }
                     gameState.phase = data.auto_progress.phase;
                     gameState.turn = data.auto_progress.turn;
                     
@@ -0,0 +1,39 @@
+from typing import Dict, List
+from agents.ai_agent import AIAgent
+from models.game_state import GameState
+
+# 게임 하나의 AI 에이전트 풀
+# 게임 시작 때 한 번 만들어 자기소개/토론/투표/밤 행동에서 계속 재사용하므로
+# 개성과 메모리가 게임 내내 유지됨
+class AgentPool:
+    def __init__(self, game_state: GameState):
+        self.game_state = game_state
+        self._agents: Dict[str, AIAgent] = {}
+
+    def create_all(self):
+        """역할이 배정된 모든 AI 플레이어의 에이전트 생성"""
+        self._agents = {}
+        for player in self.game_state.players:
+            if player.startswith("플레이어") and player in self.game_state.roles:
+                self._agents[player] = AIAgent(player, self.game_state.roles[player], game_state=self.game_state)
+
+    def get(self, player: str) -> AIAgent:
+        """플레이어의 에이전트 반환 (풀에 없으면 새로 만들어 등록)"""
+        agent = self._agents.get(player)
+        if agent is None:
+            agent = AIAgent(player, self.game_state.roles[player], game_state=self.game_state)
+            self._agents[player] = agent
+        return agent
+
+    def players(self) -> List[str]:
+        """풀에 있는 플레이어 목록"""
+        return list(self._agents.keys())
+
+    def release(self):
+        """게임 종료 시 에이전트와 메모리 해제"""
+        if self._agents:
+            print(f"🧹 에이전트 풀 해제 - 게임 {self.game_state.game_id} ({len(self._agents)}명)")
+        self._agents = {}
+
+    def __len__(self) -> int:
+        return len(self._agents)
@@ -1,32 +1,130 @@
-import os
-import re
+import asyncio
+import json
 import random
+import textwrap
+import time
 from datetime import datetime
 from agents.agent_configs import AGENT_CONFIGS
-from models.game_state import game_state
+from models.game_state import GameState
 from agents.ai_memory import AIMemory
-from utils.config import AI_MODEL, MODEL_PRICING
-
-import httpx
-from openai import AsyncOpenAI  # ✅ 비동기 클라이언트 사용
+from agents.context_builder import ContextBuilder
+from agents import heuristics
+from llm.base import LLMRequest, LLMResponse
+from llm.circuit_breaker import CircuitOpenError, llm_breaker
+from llm.provider import get_llm
+from utils.config import AI_MODEL, AI_TEMPERATURE, MODEL_PRICING, AI_DECISION_MODE, AI_DEADLINES
+
+# --- 사용량 통계 ----------------------------------------------------------------
+# 가격 추적을 위한 전역 변수
+_total_tokens_used = {"input": 0, "output": 0, "cached": 0, "reused": 0}
+_total_cost = 0.0
+_saved_cost = 0.0  # 응답 캐시/중복 호출 제거로 아낀 비용
+_hedge_overhead = {"hedges": 0, "input": 0, "output": 0, "cost": 0.0}  # 진 헤지 요청의 사용량과 비용 (_total_cost에 포함)
 
-# --- OpenAI/HTTPX 클라이언트(비동기) 전역 준비 ---------------------------------
-API_KEY = os.getenv("OPENAI_API_KEY")
-# 표준 프록시 환경변수 사용 (있으면 자동 적용)
-_proxy = os.getenv("HTTPS_PROXY") or os.getenv("HTTP_PROXY") or None
+# 투표/밤 행동 결정 통계 (결정 수, 응답 해석 실패 수, 랜덤 대체 수)
+_decision_stats = {
+    call_type: {"decisions": 0, "parse_failures": 0, "fallbacks": 0}
+    for call_type in ("vote", "night")
+}
 
-# httpx 0.28+ : proxies 인자 대신 transport에서 proxy 지정
-_transport = httpx.AsyncHTTPTransport(proxy=_proxy) if _proxy else httpx.AsyncHTTPTransport()
-_http_client = httpx.AsyncClient(transport=_transport, timeout=60.0)
+# 호출 종류별 경로 통계: LLM 응답을 받은 수와 휴리스틱으로 대체된 이유별 수
+# (deadline: 마감 시간 초과, circuit_open: 회로 차단으로 호출하지 않음, error: 호출 오류)
+_CALL_PATHS = ("llm", "deadline", "circuit_open", "error")
+_call_paths = {}
 
-# openai>=1.0 API (Responses/Chat Completions 지원)
-_openai = AsyncOpenAI(api_key=API_KEY, http_client=_http_client)
+def _count_path(call_type: str, path: str):
+    _call_paths.setdefault(call_type, dict.fromkeys(_CALL_PATHS, 0))[path] += 1
 
-# 가격 추적을 위한 전역 변수
-_total_tokens_used = {"input": 0, "output": 0}
-_total_cost = 0.0
+# 숫자 "0"~"9"의 토큰 ID (cl100k_base, o200k_base 공통). logit_bias로 이 토큰만 허용해 한 토큰으로 답하게 함
+_DIGIT_TOKEN_IDS = {digit: 15 + digit for digit in range(10)}
 # -----------------------------------------------------------------------------
 
+def track_usage(response: LLMResponse):
+    """응답의 토큰 사용량과 비용을 전역 통계에 누적
+
+    응답 캐시나 진행 중인 같은 호출에서 받은 응답은 API를 따로 호출하지 않았으므로
+    비용에 넣지 않고 아낀 비용으로만 기록.
+    헤지에서 진 호출의 사용량(extra_usage)도 비용에 넣고 헤지 비용으로 따로 집계
+    """
+    global _total_tokens_used, _total_cost, _saved_cost
+    usage = response.usage
+    if usage and response.reused:
+        _total_tokens_used["reused"] += usage.input_tokens + usage.output_tokens
+        _saved_cost += AIAgent.calculate_cost(usage.input_tokens, usage.output_tokens, usage.cached_tokens)
+        source = "응답 캐시" if response.from_cache else "진행 중인 같은 호출"
+        print(f"💰 {source} 재사용: 입력 {usage.input_tokens}, 출력 {usage.output_tokens} (비용 없음)")
+    elif usage:
+        _total_tokens_used["input"] += usage.input_tokens
+        _total_tokens_used["output"] += usage.output_tokens
+        _total_tokens_used["cached"] += usage.cached_tokens
+        cost = AIAgent.calculate_cost(usage.input_tokens, usage.output_tokens, usage.cached_tokens)
+        _total_cost += cost
+        print(f"💰 토큰 사용량: 입력 {usage.input_tokens} (캐시 {usage.cached_tokens}), 출력 {usage.output_tokens}, 비용 ${cost:.6f}")
+    extra = response.extra_usage
+    if extra and not response.reused:
+        _total_tokens_used["input"] += extra.input_tokens
+        _total_tokens_used["output"] += extra.output_tokens
+        _total_tokens_used["cached"] += extra.cached_tokens
+        cost = AIAgent.calculate_cost(extra.input_tokens, extra.output_tokens, extra.cached_tokens)
+        _total_cost += cost
+        _hedge_overhead["hedges"] += 1
+        _hedge_overhead["input"] += extra.input_tokens
+        _hedge_overhead["output"] += extra.output_tokens
+        _hedge_overhead["cost"] += cost
+        print(f"💰 헤지 요청 사용량: 입력 {extra.input_tokens}, 출력 {extra.output_tokens}, 비용 ${cost:.6f}")
+
+def phase_deadline(call_type: str):
+    """지금부터 call_type의 마감 시간(AI_DEADLINES)이 지나는 시각 (time.monotonic 기준, 마감 시간이 없으면 None)
+
+    라우트에서 한 번 정해 그 페이즈의 모든 AI 호출에 같은 값을 넘김
+    """
+    budget = AI_DEADLINES.get(call_type, 0)
+    return time.monotonic() + budget if budget > 0 else None
+
+async def complete(messages: list, max_tokens: int, temperature: float = 0.7, params: dict = None,
+                   deadline: float = None, **metadata) -> LLMResponse:
+    """현재 LLM 제공자로 채팅 완성 요청 후 사용량 기록
+
+    metadata(call_type, game_id, player 등)는 제공자 계층에서만 쓰이고 API로는 보내지 않음.
+    AI_TEMPERATURE가 설정되어 있으면 호출 종류별 온도 대신 그 값을 사용.
+    deadline(phase_deadline)까지 스케줄러/속도 제한 대기를 포함해 응답이 없으면 asyncio.TimeoutError,
+    회로가 열려 있으면 CircuitOpenError (호출한 쪽에서 휴리스틱으로 대체).
+    회로는 캐시/중복 호출 제거 계층 안쪽(CircuitBreakerProvider)에서 확인하므로 회로가 열려 있어도 캐시된 응답은 받음
+    """
+    call_type = metadata.get("call_type", "unknown")
+    remaining = None if deadline is None else deadline - time.monotonic()
+    if remaining is not None and remaining <= 0:
+        _count_path(call_type, "deadline")
+        raise asyncio.TimeoutError()
+    if deadline is not None:
+        metadata["deadline"] = deadline
+    request = LLMRequest(
+        model=AI_MODEL,
+        messages=messages,
+        max_tokens=max_tokens,
+        temperature=AI_TEMPERATURE if AI_TEMPERATURE is not None else temperature,
+        params=params or {},
+        metadata=metadata,
+    )
+    try:
+        if remaining is not None:
+            response = await asyncio.wait_for(get_llm().complete(request), remaining)
+        else:
+            response = await get_llm().complete(request)
+    except asyncio.TimeoutError:
+        _count_path(call_type, "deadline")
+        print(f"⏱️ {call_type} 호출 마감 시간 초과 ({metadata.get('player', '-')})")
+        raise
+    except CircuitOpenError:
+        _count_path(call_type, "circuit_open")
+        raise
+    except Exception:
+        _count_path(call_type, "error")
+        raise
+    _count_path(call_type, "llm")
+    track_usage(response)
+    return response
+
 # AI 개성 프롬프트 정의
 PERSONALITY_PROMPTS = {
     "aggressive": "당신은 공격적이고 직설적인 성격입니다. 의심스러운 플레이어를 적극적으로 지적하고, 논리적이지만 때로는 감정적으로 반응합니다. 마피아라면 적극적으로 시민을 의심받게 만들고, 시민이라면 마피아를 찾기 위해 적극적으로 추적합니다.",
@@ -36,11 +134,52 @@ PERSONALITY_PROMPTS = {
     "neutral": "당신은 균형잡힌 성격입니다. 논리와 직감을 적절히 조합하여 행동하며, 상황에 따라 유연하게 대응합니다. 마피아라면 적당히 시민을 의심받게 만들고, 시민이라면 균형잡힌 관점으로 마피아를 찾습니다."
 }
 
+# 호출 종류별 지시문 (정적 텍스트, 시스템 메시지에서 prompt_prefix 바로 뒤에 붙음)
+TASK_RULES = {
+    "discussion": """토론 규칙:
+- 이전에 말한 내용을 반복하지 말고, 새로운 의견이나 관찰을 제시
+- 메모리의 관찰 기록을 바탕으로 논리적인 분석 제시
+- 자신의 역할에 맞는 전략적 발언
+- 응답은 두 문장 이내로 간결하게 작성
+- 자신의 개성에 맞는 말투와 행동을 유지""",
+    "introduction": """자기소개 규칙:
+- 간단하고 자연스러운 한 문장으로 소개
+- 자신의 직업을 언급
+- 게임에 대한 기대감이나 의지를 표현
+- 너무 길지 않게 간결하게
+- 자신이 몇 번째 플레이어인지 언급하지 말고 자신의 역할을 언급
+- 자신의 개성에 맞는 말투로 소개""",
+    "vote": """투표 규칙:
+메모리의 관찰 기록과 전략을 바탕으로 가장 적절한 투표 대상을 선택하세요.
+마피아라면 시민을 의심받게 만들기 위해 전략적으로 투표하세요.
+시민이라면 마피아를 찾기 위해 논리적으로 분석해서 투표하세요.
+당신의 개성에 맞는 투표 전략을 사용하세요.""",
+    "night": """밤 행동 규칙 (마피아):
+- 지금까지의 대화와 투표 패턴을 분석
+- 가장 위험한 플레이어 (마피아를 찾을 가능성이 높은 플레이어)를 우선적으로 제거
+- 시민들이 의심하지 않을 플레이어를 선택하여 의심을 분산
+- 자신의 정체를 숨기기 위해 전략적으로 선택
+- 당신의 개성에 맞는 전략을 사용하세요""",
+}
+
+# 후보 중 하나를 고르는 호출(vote/night)의 결정 방식별 출력 지시문 (시스템 메시지 끝)과 사용자 메시지 끝 응답 유도 문구
+DECISION_OUTPUT_RULES = {
+    "logit_bias": "OUTPUT: 반드시 선택한 플레이어의 번호 숫자 하나만 출력하세요 (예: 1, 2, 3, 4)",
+    "json_schema": 'OUTPUT: 반드시 {"target": "선택한 플레이어 이름"} 형식의 JSON 객체만 출력하세요 (이름은 목록에 적힌 그대로)',
+}
+DECISION_ANSWER_CUES = {
+    "logit_bias": "선택한 번호:",
+    "json_schema": "선택 결과 (JSON):",
+}
+# json_schema 응답에서 후보 이름 외에 {"target": ""} 부분과 공백에 쓰이는 토큰 여유분
+_DECISION_JSON_OVERHEAD_TOKENS = 10
+
 # AI 에이전트 클래스
 class AIAgent:
-    def __init__(self, name: str, role: str, personality: str = None):
+    def __init__(self, name: str, role: str, personality: str = None, game_state: GameState = None):
         self.name = name
         self.role = role
+        self.game_state = game_state  # 에이전트가 참여 중인 게임
         self.config = AGENT_CONFIGS[role]
         self.conversation_history = []
         
@@ -51,7 +190,23 @@ class AIAgent:
         self.personality_prompt = PERSONALITY_PROMPTS.get(personality, PERSONALITY_PROMPTS["neutral"])
         
         # AI 메모리 시스템 초기화 (개성 포함)
-        self.memory = AIMemory(name, role, personality)
+        self.memory = AIMemory(
+            name, role, personality,
+            message_log=game_state.chat_history if game_state is not None else None,
+            summarizer=game_state.summarizer if game_state is not None else None
+        )
+        # 시스템 메시지 앞부분: 게임 규칙 -> 역할 -> 개성 순서의 정적 텍스트
+        # 메모리나 게임 상황 같은 동적인 내용은 모두 사용자 메시지에 넣어 시스템 메시지는 턴마다 같게 유지함.
+        # 이 접두사는 600토큰 안팎으로 제공자의 프롬프트 캐시 최소 길이(1024토큰)보다 짧아 캐시 적중은 기대하지 않음
+        # (usage의 cached_tokens는 제공자가 보고할 때만 비용 계산에 반영)
+        self.prompt_prefix = "\n\n".join([
+            textwrap.dedent(self.memory.game_rules).strip(),
+            textwrap.dedent(self.config["system_prompt"]).strip(),
+            self.personality_prompt,
+        ])
+        
+        # 호출 종류별 토큰 예산에 맞춰 메모리/대화에서 프롬프트 컨텍스트를 고름
+        self.context_builder = ContextBuilder(self.memory)
         
         print(f"🎭 AI 에이전트 생성 - {name} ({role}, {personality})")
         print(f"   개성 프롬프트: {self.personality_prompt[:100]}...")
@@ -62,189 +217,217 @@ class AIAgent:
         """토큰 사용량과 비용 통계 반환"""
         return {
             "total_input_tokens": _total_tokens_used["input"],
+            "total_cached_tokens": _total_tokens_used["cached"],
+            "cached_token_ratio": round(_total_tokens_used["cached"] / _total_tokens_used["input"], 4) if _total_tokens_used["input"] else 0.0,
             "total_output_tokens": _total_tokens_used["output"],
             "total_cost_usd": round(_total_cost, 6),
+            "reused_response_tokens": _total_tokens_used["reused"],
+            "reused_response_saved_usd": round(_saved_cost, 6),
+            "hedge_overhead": {
+                "hedges": _hedge_overhead["hedges"],
+                "input_tokens": _hedge_overhead["input"],
+                "output_tokens": _hedge_overhead["output"],
+                "cost_usd": round(_hedge_overhead["cost"], 6),
+            },
             "current_model": AI_MODEL,
-            "model_pricing": MODEL_PRICING[AI_MODEL]
+            "llm": get_llm().get_metrics(),
+            "model_pricing": MODEL_PRICING[AI_MODEL],
+            "decision_mode": AI_DECISION_MODE,
+            "decisions": {call_type: dict(stats) for call_type, stats in _decision_stats.items()},
+            "call_paths": {call_type: dict(paths) for call_type, paths in _call_paths.items()},
+            "circuit_breaker": llm_breaker.get_metrics()
         }
     
     @staticmethod
     def reset_usage_stats():
         """사용량 통계 초기화"""
-        global _total_tokens_used, _total_cost
-        _total_tokens_used = {"input": 0, "output": 0}
+        global _total_tokens_used, _total_cost, _saved_cost
+        _total_tokens_used = {"input": 0, "output": 0, "cached": 0, "reused": 0}
         _total_cost = 0.0
+        _saved_cost = 0.0
+        _hedge_overhead.update(hedges=0, input=0, output=0, cost=0.0)
+        for stats in _decision_stats.values():
+            stats.update(decisions=0, parse_failures=0, fallbacks=0)
+        _call_paths.clear()
         print("📊 사용량 통계가 초기화되었습니다.")
     
     @staticmethod
-    def calculate_cost(input_tokens: int, output_tokens: int) -> float:
-        """토큰 사용량에 따른 비용 계산"""
+    def calculate_cost(input_tokens: int, output_tokens: int, cached_tokens: int = 0) -> float:
+        """토큰 사용량에 따른 비용 계산 (캐시된 입력 토큰은 할인 가격)"""
         model_pricing = MODEL_PRICING[AI_MODEL]
-        input_cost = (input_tokens / 1000) * model_pricing["input"]
+        input_cost = ((input_tokens - cached_tokens) / 1000) * model_pricing["input"]
+        input_cost += (cached_tokens / 1000) * model_pricing.get("cached_input", model_pricing["input"])
         output_cost = (output_tokens / 1000) * model_pricing["output"]
         return input_cost + output_cost
     
-    async def get_action(self, game_context: str, current_phase: str) -> str:
-        """AI 에이전트의 행동 결정 (비동기)"""
+    def _call_metadata(self, call_type: str) -> dict:
+        """LLM 요청 메타데이터 (호출 종류, 게임, 플레이어)"""
+        return {
+            "call_type": call_type,
+            "game_id": self.game_state.game_id if self.game_state is not None else None,
+            "player": self.name,
+        }
+    
+    def _system_message(self, call_type: str, decision_mode: str = None) -> dict:
+        """정적 시스템 메시지 (공통 접두사 + 호출 종류별 지시문 + 결정 방식별 출력 지시문)"""
+        content = f"{self.prompt_prefix}\n\n{TASK_RULES[call_type]}"
+        if decision_mode is not None:
+            content += f"\n\n{DECISION_OUTPUT_RULES[decision_mode]}"
+        return {"role": "system", "content": content}
+    
+    async def get_action(self, game_context: str, current_phase: str, deadline: float = None) -> str:
+        """AI 에이전트의 행동 결정 (비동기, deadline이 지나면 휴리스틱 발언)"""
         try:
             # 메모리 업데이트
-            self.memory.update_phase(current_phase)
-            
-            # 최근 대화 기록을 메모리에 추가
-            recent_messages = [
-                msg["content"]
-                for msg in game_state.chat_history[-5:]
-                if msg["sender"] != self.name
-            ]
+            self.memory.update_phase(current_phase, self.game_state.turn)
             
-            # 다른 플레이어들의 발언을 메모리에 기록
-            for msg in game_state.chat_history[-5:]:
-                if msg["sender"] != self.name:
-                    self.memory.add_conversation(msg["sender"], msg["content"], msg.get("role"))
-
-            if not API_KEY or API_KEY == "your_openai_api_key_here":
-                return f"[{self.name}] OpenAI API 키가 설정되지 않았습니다."
+            # 게임 메시지 로그 중 아직 읽지 않은 것만 메모리에 기록 (순번만 저장)
+            self.memory.ingest_messages()
 
-            # 메모리에서 토론 컨텍스트 가져오기
-            memory_context = self.memory.get_discussion_context()
+            # 토큰 예산에 맞춘 토론 컨텍스트 (관찰 기록, 전략 노트, 최근 대화 포함)
+            memory_context = self.memory.get_discussion_context(self.context_builder.build("discussion"))
 
             messages = [
-                {
-                    "role": "system",
-                    "content": f"""당신은 마피아 게임의 플레이어입니다.
-
-{self.personality_prompt}
-
-{memory_context}
-
-토론 규칙:
-- 이전에 말한 내용을 반복하지 말고, 새로운 의견이나 관찰을 제시
-- 메모리의 관찰 기록을 바탕으로 논리적인 분석 제시
-- 자신의 역할에 맞는 전략적 발언
-- 응답은 두 문장 이내로 간결하게 작성
-- 자신의 개성에 맞는 말투와 행동을 유지
-""",
-                },
+                self._system_message("discussion"),
                 {
                     "role": "user",
                     "content": (
+                        f"{memory_context}\n\n"
                         f"현재 게임 상황: {game_context}\n"
                         f"현재 페이즈: {current_phase}\n"
                         f"당신의 역할: {self.role}\n"
                         f"당신의 개성: {self.personality}\n\n"
-                        f"최근 다른 플레이어들의 발언: {' | '.join(recent_messages)}\n\n"
                         f"메모리의 정보를 바탕으로 전략적인 의견을 두 문장 이내로 제시해주세요."
                     ),
                 },
             ]
 
             # ✅ 비동기 호출
-            resp = await _openai.chat.completions.create(
-                model=AI_MODEL,
-                messages=messages,
-                max_tokens=120,
-                temperature=0.7,
-            )
-            
-            response = (resp.choices[0].message.content or "").strip()
-            
-            # 토큰 사용량 추적
-            global _total_tokens_used, _total_cost
-            if hasattr(resp, 'usage') and resp.usage:
-                input_tokens = resp.usage.prompt_tokens
-                output_tokens = resp.usage.completion_tokens
-                _total_tokens_used["input"] += input_tokens
-                _total_tokens_used["output"] += output_tokens
-                cost = self.calculate_cost(input_tokens, output_tokens)
-                _total_cost += cost
-                print(f"💰 토큰 사용량: 입력 {input_tokens}, 출력 {output_tokens}, 비용 ${cost:.6f}")
-            
-            # 메모리에 자신의 발언 기록
-            self.memory.add_conversation(self.name, response, self.role)
-            
-            return response
+            response = await complete(messages, max_tokens=120, temperature=0.7, deadline=deadline,
+                                      **self._call_metadata("discussion"))
+            return response.text
 
         except Exception as e:
-            print(f"AI 에이전트 오류: {e}")
-            return f"[{self.name}] 시스템 오류로 인해 응답할 수 없습니다."
+            print(f"AI 에이전트 오류 ({type(e).__name__}): {e} - 휴리스틱 발언으로 대체")
+            return heuristics.discussion_line(self)
     
-    async def get_introduction(self, intro_prompt: str) -> str:
-        """AI 에이전트의 자기소개 생성 (비동기)"""
+    async def get_introduction(self, intro_prompt: str, deadline: float = None) -> str:
+        """AI 에이전트의 자기소개 생성 (비동기, deadline이 지나면 기본 자기소개)"""
         try:
-            if not API_KEY or API_KEY == "your_openai_api_key_here":
-                return f"[{self.name}] 안녕하세요! 저는 {self.name}입니다."
-
             # 메모리에서 자기소개 컨텍스트 가져오기
             memory_context = self.memory.get_introduction_context()
             
             messages = [
-                {
-                    "role": "system",
-                    "content": f"""당신은 마피아 게임의 플레이어입니다. 
-                    
-{self.personality_prompt}
-
-{memory_context}
-
-자기소개 규칙:
-- 간단하고 자연스러운 한 문장으로 소개
-- 자신의 직업을 언급
-- 게임에 대한 기대감이나 의지를 표현
-- 너무 길지 않게 간결하게
-- 자신이 몇 번째 플레이어인지 언급하지 말고 자신의 역할을 언급
-- 자신의 개성에 맞는 말투로 소개
-"""
-                },
+                self._system_message("introduction"),
                 {
                     "role": "user",
-                    "content": intro_prompt
+                    "content": f"{memory_context}\n\n{intro_prompt}"
                 }
             ]
 
             # ✅ 비동기 호출
-            resp = await _openai.chat.completions.create(
-                model=AI_MODEL,
-                messages=messages,
-                max_tokens=80,
-                temperature=0.7,
-            )
-            
-            introduction = (resp.choices[0].message.content or "").strip()
-            
-            # 토큰 사용량 추적
-            global _total_tokens_used, _total_cost
-            if hasattr(resp, 'usage') and resp.usage:
-                input_tokens = resp.usage.prompt_tokens
-                output_tokens = resp.usage.completion_tokens
-                _total_tokens_used["input"] += input_tokens
-                _total_tokens_used["output"] += output_tokens
-                cost = self.calculate_cost(input_tokens, output_tokens)
-                _total_cost += cost
-                print(f"💰 토큰 사용량: 입력 {input_tokens}, 출력 {output_tokens}, 비용 ${cost:.6f}")
-            
-            # 메모리에 자기소개 기록
-            self.memory.add_conversation(self.name, introduction, self.role)
-            
-            return introduction
+            response = await complete(messages, max_tokens=80, temperature=0.7, deadline=deadline,
+                                      **self._call_metadata("introduction"))
+            return response.text
 
         except Exception as e:
-            print(f"AI 자기소개 오류: {e}")
-            return f"[{self.name}] 안녕하세요! 저는 {self.name}입니다."
-
-    async def get_vote_target(self, game_context: str, alive_players: list) -> str:
-        """AI 에이전트의 투표 대상 결정 (비동기)"""
-        try:
-            if not API_KEY or API_KEY == "your_openai_api_key_here":
-                return random.choice(alive_players)  # 키 없으면 랜덤
+            print(f"AI 자기소개 오류 ({type(e).__name__}): {e}")
+            return heuristics.introduction_line(self)
 
-            # 메모리에서 투표 컨텍스트 가져오기
-            memory_context = self.memory.get_vote_context()
+    @staticmethod
+    def _decision_mode(candidates: list) -> str:
+        """후보 중 하나를 고르는 호출의 결정 방식 (logit_bias는 후보가 9명 이하일 때만 가능)"""
+        if AI_DECISION_MODE == "logit_bias" and len(candidates) <= 9:
+            return "logit_bias"
+        return "json_schema"
 
-            vote_prompt = f"""당신은 마피아 게임에서 투표를 해야 합니다.
+    @staticmethod
+    def _decision_params(decision_mode: str, candidates: list) -> dict:
+        """후보 중 하나를 고르는 호출의 제약 파라미터
+
+        - logit_bias: 1~len(candidates) 숫자 토큰만 허용하고 한 토큰으로 답함
+        - json_schema: {"target": 후보 이름} 형식만 허용, max_tokens는 가장 긴 후보 이름이 잘리지 않게 잡음
+          (토큰 하나는 최소 1바이트이므로 이름의 UTF-8 바이트 수가 토큰 수의 상한)
+        """
+        if decision_mode == "logit_bias":
+            return {
+                "max_tokens": 1,
+                "logit_bias": {str(_DIGIT_TOKEN_IDS[n]): 100 for n in range(1, len(candidates) + 1)},
+            }
+        longest_name = max(len(candidate.encode("utf-8")) for candidate in candidates)
+        return {
+            "max_tokens": longest_name + _DECISION_JSON_OVERHEAD_TOKENS,
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "decision",
+                    "strict": True,
+                    "schema": {
+                        "type": "object",
+                        "properties": {"target": {"type": "string", "enum": candidates}},
+                        "required": ["target"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+        }
+    
+    @staticmethod
+    def _parse_decision(text: str, candidates: list):
+        """제약된 응답에서 후보 이름 반환 (해석할 수 없으면 None)"""
+        text = (text or "").strip()
+        if text.isdigit():
+            n = int(text)
+            return candidates[n - 1] if 1 <= n <= len(candidates) else None
+        try:
+            target = json.loads(text).get("target")
+        except (ValueError, AttributeError):
+            return None
+        return target if target in candidates else None
+    
+    async def _decide(self, call_type: str, prompt: str, candidates: list, deadline: float = None):
+        """후보 중 하나를 고르는 제약된 호출 (응답을 해석할 수 없으면 None)
+
+        prompt 끝에는 결정 방식에 맞는 응답 유도 문구(DECISION_ANSWER_CUES)를 붙임
+        """
+        decision_mode = self._decision_mode(candidates)
+        decision_params = self._decision_params(decision_mode, candidates)
+        max_tokens = decision_params.pop("max_tokens")
+        response = await complete(
+            [
+                self._system_message(call_type, decision_mode),
+                {"role": "user", "content": f"{prompt}\n\n{DECISION_ANSWER_CUES[decision_mode]}"},
+            ],
+            max_tokens=max_tokens,
+            temperature=0.3,
+            params=decision_params,
+            deadline=deadline,
+            **self._call_metadata(call_type),
+        )
+        
+        target = self._parse_decision(response.text, candidates)
+        if target is None:
+            _decision_stats[call_type]["parse_failures"] += 1
+            print(f"DEBUG: {self.name} {call_type} 응답 해석 실패 - {response.text!r}")
+        return target
+    
+    def _fallback_choice(self, call_type: str, candidates: list):
+        """결정을 얻지 못했을 때 휴리스틱으로 선택 (통계에 기록)"""
+        _decision_stats[call_type]["fallbacks"] += 1
+        return heuristics.choose_target(self, candidates) if candidates else None
+    
+    async def get_vote_target(self, game_context: str, alive_players: list, deadline: float = None) -> str:
+        """AI 에이전트의 투표 대상 결정 (비동기, deadline이 지나면 휴리스틱으로 선택)"""
+        _decision_stats["vote"]["decisions"] += 1
+        try:
+            # 메모리 업데이트 (게임 메시지 로그 중 아직 읽지 않은 것만 기록)
+            self.memory.update_phase(self.game_state.phase, self.game_state.turn)
+            self.memory.ingest_messages()
 
-{self.personality_prompt}
+            # 토큰 예산에 맞춘 투표 컨텍스트 (전체 대화 로그 대신 최근 대화만 포함)
+            memory_context = self.memory.get_vote_context(self.context_builder.build("vote"))
 
-{memory_context}
+            vote_prompt = f"""{memory_context}
 
 게임 상황 분석:
 {game_context}
@@ -253,143 +436,57 @@ class AIAgent:
 {', '.join([f"{i+1}. {player}" for i, player in enumerate(alive_players)])}
 
 당신의 역할: {self.role}
-당신의 개성: {self.personality}
-
-메모리의 관찰 기록과 전략을 바탕으로 가장 적절한 투표 대상을 선택하세요.
-마피아라면 시민을 의심받게 만들기 위해 전략적으로 투표하세요.
-시민이라면 마피아를 찾기 위해 논리적으로 분석해서 투표하세요.
-당신의 개성에 맞는 투표 전략을 사용하세요.
+당신의 개성: {self.personality}"""
 
-OUTPUT: 반드시 숫자만 출력하세요 (예: 1, 2, 3, 4)
-선택한 번호:"""
-
-            messages = [
-                {"role": "system", "content": "당신은 마피아 게임의 투표 시스템입니다. 메모리의 정보를 바탕으로 전략적으로 투표하세요. 반드시 숫자만 출력하세요."},
-                {"role": "user", "content": vote_prompt},
-            ]
-
-            # ✅ 비동기 호출
-            resp = await _openai.chat.completions.create(
-                model=AI_MODEL,
-                messages=messages,
-                max_tokens=10,
-                temperature=0.3,
-            )
-
-            text = (resp.choices[0].message.content or "").strip()
+            target = await self._decide("vote", vote_prompt, alive_players, deadline)
+            if target is None:
+                return self._fallback_choice("vote", alive_players)
             
-            # 토큰 사용량 추적
-            global _total_tokens_used, _total_cost
-            if hasattr(resp, 'usage') and resp.usage:
-                input_tokens = resp.usage.prompt_tokens
-                output_tokens = resp.usage.completion_tokens
-                _total_tokens_used["input"] += input_tokens
-                _total_tokens_used["output"] += output_tokens
-                cost = self.calculate_cost(input_tokens, output_tokens)
-                _total_cost += cost
-                print(f"💰 토큰 사용량: 입력 {input_tokens}, 출력 {output_tokens}, 비용 ${cost:.6f}")
-            
-            nums = re.findall(r"\d+", text)
-            if nums:
-                n = int(nums[0])
-                if 1 <= n <= len(alive_players):
-                    target = alive_players[n - 1]
-                    
-                    # 메모리에 투표 기록
-                    self.memory.add_vote(self.name, target)
-                    
-                    return target
-
-            return random.choice(alive_players)
+            # 메모리에 투표 기록
+            self.memory.add_vote(self.name, target)
+            return target
 
         except Exception as e:
-            print(f"AI 투표 오류: {e}")
-            return random.choice(alive_players)
+            print(f"AI 투표 오류 ({type(e).__name__}): {e} - 휴리스틱으로 대체")
+            return self._fallback_choice("vote", alive_players)
 
-    async def get_night_action(self, alive_players: list) -> str:
-        """AI 마피아의 밤 행동 결정 (비동기)"""
+    async def get_night_action(self, alive_players: list, deadline: float = None) -> str:
+        """AI 마피아의 밤 행동 결정 (비동기, deadline이 지나면 휴리스틱으로 선택)"""
+        print(f"DEBUG: get_night_action 호출됨 - 플레이어: {self.name}, 역할: {self.role}")
+        print(f"DEBUG: 살아있는 플레이어들: {alive_players}")
+        
+        if self.role != "mafia":
+            print(f"DEBUG: 마피아가 아님 - 밤 행동 없음")
+            return None  # 마피아가 아니면 밤 행동 없음
+        
+        _decision_stats["night"]["decisions"] += 1
+        candidates = [p for p in alive_players if p != self.name]
+        # 휴리스틱으로 고를 때는 AI 플레이어만 대상
+        fallback_candidates = [p for p in candidates if p.startswith("플레이어")]
         try:
-            print(f"DEBUG: get_night_action 호출됨 - 플레이어: {self.name}, 역할: {self.role}")
-            print(f"DEBUG: 살아있는 플레이어들: {alive_players}")
-            
-            if self.role != "mafia":
-                print(f"DEBUG: 마피아가 아님 - 밤 행동 없음")
-                return None  # 마피아가 아니면 밤 행동 없음
-                
-            if not API_KEY or API_KEY == "your_openai_api_key_here":
-                print(f"DEBUG: API 키 없음 - 랜덤 선택")
-                return random.choice(alive_players)  # 키 없으면 랜덤
+            # 메모리 업데이트 (게임 메시지 로그 중 아직 읽지 않은 것만 기록)
+            self.memory.update_phase(self.game_state.phase, self.game_state.turn)
+            self.memory.ingest_messages()
 
-            # 메모리에서 밤 행동 컨텍스트 가져오기
-            memory_context = self.memory.get_night_context()
+            # 토큰 예산에 맞춘 밤 행동 컨텍스트
+            memory_context = self.memory.get_night_context(self.context_builder.build("night"))
 
-            night_prompt = f"""당신은 마피아 게임의 마피아입니다. 밤에 누군가를 살해해야 합니다.
-
-{self.personality_prompt}
-
-{memory_context}
+            night_prompt = f"""{memory_context}
 
 살아있는 플레이어들 (당신 제외):
-{', '.join([f"{i+1}. {player}" for i, player in enumerate(alive_players) if player != self.name])}
+{', '.join([f"{i+1}. {player}" for i, player in enumerate(candidates)])}
 
-게임 상황 분석:
-- 지금까지의 대화와 투표 패턴을 분석
-- 가장 위험한 플레이어 (마피아를 찾을 가능성이 높은 플레이어)를 우선적으로 제거
-- 시민들이 의심하지 않을 플레이어를 선택하여 의심을 분산
-- 자신의 정체를 숨기기 위해 전략적으로 선택
-- 당신의 개성에 맞는 전략을 사용하세요
+밤에 살해할 대상을 선택하세요."""
 
-OUTPUT: 반드시 숫자만 출력하세요 (예: 1, 2, 3, 4)
-선택한 번호:"""
-
-            messages = [
-                {"role": "system", "content": "당신은 마피아 게임의 마피아입니다. 밤에 살해할 대상을 선택하세요. 반드시 숫자만 출력하세요."},
-                {"role": "user", "content": night_prompt},
-            ]
+            target = await self._decide("night", night_prompt, candidates, deadline) if candidates else None
+            if target is None:
+                target = self._fallback_choice("night", fallback_candidates)
 
-            # ✅ 비동기 호출
-            resp = await _openai.chat.completions.create(
-                model=AI_MODEL,
-                messages=messages,
-                max_tokens=10,
-                temperature=0.3,
-            )
-
-            text = (resp.choices[0].message.content or "").strip()
-            
-            # 토큰 사용량 추적
-            global _total_tokens_used, _total_cost
-            if hasattr(resp, 'usage') and resp.usage:
-                input_tokens = resp.usage.prompt_tokens
-                output_tokens = resp.usage.completion_tokens
-                _total_tokens_used["input"] += input_tokens
-                _total_tokens_used["output"] += output_tokens
-                cost = self.calculate_cost(input_tokens, output_tokens)
-                _total_cost += cost
-                print(f"💰 토큰 사용량: 입력 {input_tokens}, 출력 {output_tokens}, 비용 ${cost:.6f}")
-            
-            nums = re.findall(r"\d+", text)
-            if nums:
-                n = int(nums[0])
-                available_targets = [p for p in alive_players if p != self.name]
-                if 1 <= n <= len(available_targets):
-                    target = available_targets[n - 1]
-                    # 메모리에 밤 행동 기록
-                    self.memory.add_night_action(target)
-                    return target
-
-            # 기본값: 랜덤 선택 (AI 플레이어만)
-            available_targets = [p for p in alive_players if p != self.name and p.startswith("플레이어")]
-            if available_targets:
-                target = random.choice(available_targets)
+            if target:
+                # 메모리에 밤 행동 기록
                 self.memory.add_night_action(target)
-                return target
-
-            return None
+            return target
 
         except Exception as e:
-            print(f"AI 밤 행동 오류: {e}")
-            available_targets = [p for p in alive_players if p != self.name and p.startswith("플레이어")]
-            if available_targets:
-                return random.choice(available_targets)
-            return None
+            print(f"AI 밤 행동 오류 ({type(e).__name__}): {e} - 휴리스틱으로 대체")
+            return self._fallback_choice("night", fallback_candidates)
@@ -1,11 +1,21 @@
 import json
+from bisect import bisect_left
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping
+from models.message_log import MessageLog
 
 class AIMemory:
-    """AI 에이전트의 메모리 시스템"""
+    """AI 에이전트의 메모리 시스템
+
+    대화 내용은 게임의 공유 메시지 로그(MessageLog)에만 저장하고,
+    메모리는 메시지 순번과 자신만의 기록(투표, 밤 행동, 전략 노트 등)만 가짐
+    """
+    
+    # 대화 요약 후에도 남겨 두는 페이즈 기록 수
+    GAME_HISTORY_LIMIT = 10
     
-    def __init__(self, player_name: str, actual_role: str, personality: str = "neutral"):
+    def __init__(self, player_name: str, actual_role: str, personality: str = "neutral",
+                 message_log: MessageLog = None, summarizer=None):
         self.player_name = player_name
         self.actual_role = actual_role  # 실제 역할 (citizen/mafia)
         self.personality = personality  # AI 개성
@@ -20,9 +30,12 @@ class AIMemory:
         self.game_history = []
         self.player_observations = {}  # 다른 플레이어 관찰 기록
         self.strategy_notes = []
-        self.conversation_history = []
+        self.message_log = message_log if message_log is not None else MessageLog()
+        self.conversation_seqs = []  # 읽은 메시지 순번 (메시지 자체는 message_log에 있음)
         self.vote_history = []
         self.night_actions = []  # 밤 행동 기록
+        self.last_seen_seq = 0  # 메시지 로그에서 다음에 읽을 순번 (커서)
+        self.summarizer = summarizer  # 게임의 누적 대화 요약 (agents.conversation_summarizer.ConversationSummarizer)
         
         # 전략 상태
         self.current_strategy = None
@@ -69,7 +82,9 @@ class AIMemory:
             return "마피아를 찾아서 시민팀이 승리하도록 해야 합니다. 다른 플레이어들의 행동을 관찰하고 논리적으로 분석하는 것이 중요합니다."
     
     def update_phase(self, phase: str, turn: int = 1):
-        """현재 페이즈 업데이트"""
+        """현재 페이즈 업데이트 (페이즈나 턴이 바뀐 경우에만 기록하고 오래된 대화를 요약)"""
+        if self.game_history and phase == self.current_phase and self.game_history[-1]["turn"] == turn:
+            return
         self.current_phase = phase
         self.game_history.append({
             "timestamp": datetime.now().isoformat(),
@@ -77,59 +92,52 @@ class AIMemory:
             "turn": turn,
             "action": f"페이즈 전환: {phase}"
         })
+        self._compact()
     
-    def add_conversation(self, speaker: str, content: str, role: str = None):
-        """대화 기록 추가"""
-        self.conversation_history.append({
-            "timestamp": datetime.now().isoformat(),
-            "speaker": speaker,
-            "content": content,
-            "role": role,
-            "phase": self.current_phase
-        })
-        
-        # 다른 플레이어 관찰 기록 업데이트
-        if speaker != self.player_name:
-            if speaker not in self.player_observations:
-                self.player_observations[speaker] = {
-                    "messages": [],
-                    "suspicious_actions": [],
-                    "trustworthy_actions": [],
-                    "role_hints": []
-                }
-            
-            self.player_observations[speaker]["messages"].append({
-                "content": content,
-                "phase": self.current_phase,
-                "timestamp": datetime.now().isoformat()
-            })
+    def _compact(self):
+        """오래된 대화 요약을 백그라운드에 요청하고, 이미 요약된 구간의 기록은 버림"""
+        if self.summarizer is None:
+            return
+        self.summarizer.request_compaction()
+        # 요약에 포함된 메시지의 순번은 더 들고 있을 필요 없음
+        del self.conversation_seqs[:bisect_left(self.conversation_seqs, self.summarizer.summarized_seq)]
+        del self.game_history[:-self.GAME_HISTORY_LIMIT]
     
-    def add_vote(self, voter: str, target: str):
-        """투표 기록 추가"""
-        self.vote_history.append({
-            "timestamp": datetime.now().isoformat(),
-            "voter": voter,
-            "target": target,
-            "phase": self.current_phase
-        })
-        
-        # 투표 패턴 분석
-        if voter != self.player_name:
-            if voter not in self.player_observations:
-                self.player_observations[voter] = {
-                    "messages": [],
-                    "suspicious_actions": [],
-                    "trustworthy_actions": [],
-                    "role_hints": []
-                }
-            
-            # 투표 패턴 분석
-            if self._is_suspicious_vote(voter, target):
-                self.player_observations[voter]["suspicious_actions"].append({
-                    "action": "투표",
-                    "target": target,
-                    "reason": "의심스러운 투표 패턴"
-                })
+    @property
+    def conversation_summary(self) -> str:
+        """요약된 이전 대화 (요약이 없으면 빈 문자열)"""
+        return self.summarizer.summary if self.summarizer is not None else ""
+    
+    @property
+    def conversation_history(self) -> List[Mapping]:
+        """읽은 대화 중 아직 요약되지 않은 목록 (메시지 로그에서 조회)"""
+        return [self.message_log[seq] for seq in self.conversation_seqs]
+    
+    def _observe_player(self, speaker: str) -> Dict:
+        """다른 플레이어 관찰 기록 반환 (없으면 생성)"""
+        if speaker not in self.player_observations:
+            self.player_observations[speaker] = {
+                "messages": [],  # 메시지 순번
+                "suspicious_actions": [],
+                "trustworthy_actions": [],
+                "role_hints": [],
+                "votes": []
+            }
+        return self.player_observations[speaker]
+    
+    def ingest_messages(self) -> int:
+        """메시지 로그에서 아직 읽지 않은 메시지의 순번만 메모리에 추가
+
+        새로 읽은 메시지 수 반환
+        """
+        new_messages = self.message_log.since(self.last_seen_seq)
+        for seq, msg in enumerate(new_messages, start=self.last_seen_seq):
+            self.conversation_seqs.append(seq)
+            # 다른 플레이어 관찰 기록 업데이트
+            if msg["sender"] != self.player_name:
+                self._observe_player(msg["sender"])["messages"].append(seq)
+        self.last_seen_seq += len(new_messages)
+        return len(new_messages)
     
     def _is_suspicious_vote(self, voter: str, target: str) -> bool:
         """의심스러운 투표인지 판단"""
@@ -148,7 +156,7 @@ class AIMemory:
     
     def update_suspicious_players(self, player: str, reason: str):
         """의심스러운 플레이어 목록 업데이트"""
-        if player not in self.suspicious_players:
+        if all(p["player"] != player for p in self.suspicious_players):
             self.suspicious_players.append({
                 "player": player,
                 "reason": reason,
@@ -157,45 +165,13 @@ class AIMemory:
     
     def update_trusted_players(self, player: str, reason: str):
         """신뢰할 수 있는 플레이어 목록 업데이트"""
-        if player not in self.trusted_players:
+        if all(p["player"] != player for p in self.trusted_players):
             self.trusted_players.append({
                 "player": player,
                 "reason": reason,
                 "timestamp": datetime.now().isoformat()
             })
     
-    def get_memory_summary(self) -> str:
-        """메모리 요약 정보 반환"""
-        summary = f"""
-=== {self.player_name}의 메모리 요약 ===
-
-📋 기본 정보:
-- 실제 역할: {self.actual_role}
-- 가짜 역할: {self.my_fake_role}
-- 현재 페이즈: {self.current_phase}
-
-🎯 승리 목표:
-{self.victory_goal}
-
-👥 플레이어 관찰:
-"""
-        
-        for player, observations in self.player_observations.items():
-            summary += f"\n- {player}:"
-            summary += f"\n  • 메시지 수: {len(observations['messages'])}"
-            summary += f"\n  • 의심스러운 행동: {len(observations['suspicious_actions'])}"
-            summary += f"\n  • 신뢰할 만한 행동: {len(observations['trustworthy_actions'])}"
-        
-        summary += f"\n\n🔍 의심스러운 플레이어: {[p['player'] for p in self.suspicious_players]}"
-        summary += f"\n🤝 신뢰할 수 있는 플레이어: {[p['player'] for p in self.trusted_players]}"
-        
-        if self.strategy_notes:
-            summary += f"\n\n📝 최근 전략 노트:"
-            for note in self.strategy_notes[-3:]:  # 최근 3개만
-                summary += f"\n- {note['note']}"
-        
-        return summary
-    
     def get_introduction_context(self) -> str:
         """자기소개용 컨텍스트 반환"""
         if self.actual_role == "mafia":
@@ -231,12 +207,12 @@ class AIMemory:
 - 다른 플레이어들과 협력하겠다는 태도 보여줌
 """
     
-    def get_discussion_context(self) -> str:
-        """토론용 컨텍스트 반환"""
+    def get_discussion_context(self, summary: str) -> str:
+        """토론용 컨텍스트 반환 (summary: ContextBuilder가 토큰 예산에 맞춰 만든 메모리 컨텍스트)"""
         context = f"""
 현재 상황: {self.current_phase} 페이즈
 
-{self.get_memory_summary()}
+{summary}
 
 토론 전략:
 """
@@ -260,12 +236,12 @@ class AIMemory:
         
         return context
     
-    def get_vote_context(self) -> str:
-        """투표용 컨텍스트 반환"""
+    def get_vote_context(self, summary: str) -> str:
+        """투표용 컨텍스트 반환 (summary: ContextBuilder가 토큰 예산에 맞춰 만든 메모리 컨텍스트)"""
         context = f"""
 투표 상황 분석:
 
-{self.get_memory_summary()}
+{summary}
 
 투표 전략:
 """
@@ -298,14 +274,7 @@ class AIMemory:
         
         # 전략 분석
         if voter != self.player_name:
-            if voter not in self.player_observations:
-                self.player_observations[voter] = {
-                    "messages": [],
-                    "suspicious_actions": [],
-                    "trustworthy_actions": [],
-                    "role_hints": [],
-                    "votes": []
-                }
+            self._observe_player(voter)
             
             # 투표 패턴 분석
             if target in self.suspicious_players:
@@ -330,14 +299,14 @@ class AIMemory:
             })
             
             # 전략 분석
-            self.strategy_notes.append(f"밤에 {target}를 선택한 이유: 가장 위험한 플레이어로 판단")
+            self.add_strategy_note(f"밤에 {target}를 선택한 이유: 가장 위험한 플레이어로 판단")
 
-    def get_night_context(self) -> str:
-        """밤 행동용 컨텍스트 반환"""
+    def get_night_context(self, summary: str) -> str:
+        """밤 행동용 컨텍스트 반환 (summary: ContextBuilder가 토큰 예산에 맞춰 만든 메모리 컨텍스트)"""
         context = f"""
 밤 행동 상황 분석:
 
-{self.get_memory_summary()}
+{summary}
 
 밤 행동 전략:
 """
@@ -367,7 +336,10 @@ class AIMemory:
             "game_history": self.game_history,
             "player_observations": self.player_observations,
             "strategy_notes": self.strategy_notes,
-            "conversation_history": self.conversation_history,
+            "conversation_history": [dict(msg) for msg in self.conversation_history],
+            "conversation_seqs": self.conversation_seqs,
+            "conversation_summary": self.conversation_summary,
+            "last_seen_seq": self.last_seen_seq,
             "vote_history": self.vote_history,
             "suspicious_players": self.suspicious_players,
             "trusted_players": self.trusted_players
@@ -382,7 +354,8 @@ class AIMemory:
         self.game_history = data.get("game_history", [])
         self.player_observations = data.get("player_observations", {})
         self.strategy_notes = data.get("strategy_notes", [])
-        self.conversation_history = data.get("conversation_history", [])
+        self.conversation_seqs = data.get("conversation_seqs", [])
+        self.last_seen_seq = data.get("last_seen_seq", 0)
         self.vote_history = data.get("vote_history", [])
         self.suspicious_players = data.get("suspicious_players", [])
         self.trusted_players = data.get("trusted_players", [])
@@ -0,0 +1,162 @@
+import re
+from typing import Iterator, List, Tuple
+from agents.ai_memory import AIMemory
+from utils.config import CONTEXT_TOKEN_BUDGETS, SUMMARY_RECENT_TAIL
+from utils.tokens import estimate_tokens
+
+# 토큰 예산 안에서 프롬프트용 메모리 컨텍스트를 만드는 빌더
+# 메모리 요약 전체와 대화 로그 전체를 붙이는 대신, 관련도가 높은 관찰 기록/전략 노트/최근 대화만 골라
+# 호출 종류별 예산(CONTEXT_TOKEN_BUDGETS)에 맞춤. 대화 로그는 최신 메시지부터 거꾸로 읽다가
+# 예산이 차거나 이미 요약된 구간에 닿으면 멈추므로 게임이 길어져도 만드는 비용과 결과 크기가 일정함
+class ContextBuilder:
+    # 예산 중 섹션별 상한 비율 (쓰고 남은 예산은 최근 대화에 사용)
+    SUMMARY_SHARE = 0.3
+    OBSERVATION_SHARE = 0.3
+    NOTES_SHARE = 0.15
+    # 메시지 하나에서 사용하는 최대 글자 수
+    MAX_MESSAGE_CHARS = 200
+    # 대화 요약이 있을 때 그대로 넣는 최근 메시지 수 상한 (나머지는 다음 요약에 포함됨)
+    MAX_TAIL_MESSAGES = SUMMARY_RECENT_TAIL * 2
+    # 섹션 제목
+    SUMMARY_TITLE = "📜 이전 대화 요약:"
+    OBSERVATION_TITLE = "👥 플레이어 관찰:"
+    NOTES_TITLE = "📝 최근 전략 노트:"
+    RECENT_TITLE = "💬 최근 대화 (오래된 순):"
+    # 섹션 제목과 섹션 사이 빈 줄에 드는 토큰 (예산에서 미리 빼 둠)
+    SECTION_OVERHEAD_TOKENS = sum(estimate_tokens(title) + 2 for title in (SUMMARY_TITLE, OBSERVATION_TITLE, NOTES_TITLE, RECENT_TITLE))
+
+    def __init__(self, memory: AIMemory):
+        self.memory = memory
+        self.last_tokens = 0  # 마지막으로 만든 컨텍스트의 추정 토큰 수
+
+    def build(self, call_type: str) -> str:
+        """호출 종류(discussion/vote/night)의 토큰 예산에 맞는 메모리 컨텍스트 반환"""
+        budget = CONTEXT_TOKEN_BUDGETS[call_type]
+        header = self._header()
+        remaining = budget - estimate_tokens(header) - self.SECTION_OVERHEAD_TOKENS
+
+        summary, used = self._fit(self._summary_lines(), min(remaining, int(budget * self.SUMMARY_SHARE)))
+        remaining -= used
+        observations, used = self._fit(self._observation_lines(), min(remaining, int(budget * self.OBSERVATION_SHARE)))
+        remaining -= used
+        notes, used = self._fit(self._note_lines(), min(remaining, int(budget * self.NOTES_SHARE)))
+        remaining -= used
+        recent, used = self._fit(self._message_lines(), remaining)
+        remaining -= used
+
+        sections = [header]
+        if summary:
+            sections.append(self.SUMMARY_TITLE + "\n" + "\n".join(reversed(summary)))
+        if observations:
+            sections.append(self.OBSERVATION_TITLE + "\n" + "\n".join(observations))
+        if notes:
+            # 최신 순으로 골랐으므로 시간 순으로 되돌림
+            sections.append(self.NOTES_TITLE + "\n" + "\n".join(reversed(notes)))
+        if recent:
+            sections.append(self.RECENT_TITLE + "\n" + "\n".join(reversed(recent)))
+
+        self.last_tokens = budget - remaining  # 섹션 제목 몫을 포함한 상한 추정치
+        return "\n\n".join(sections)
+
+    def build_private(self, budget: int) -> str:
+        """앙상블 토론용 에이전트 자신의 컨텍스트 (기본 정보, 관찰 기록, 전략 노트만)"""
+        header = self._header()
+        remaining = budget - estimate_tokens(header) - self.SECTION_OVERHEAD_TOKENS
+        observations, used = self._fit(self._observation_lines(), min(remaining, int(budget * 0.6)))
+        remaining -= used
+        notes, _ = self._fit(self._note_lines(), remaining)
+
+        sections = [header]
+        if observations:
+            sections.append(self.OBSERVATION_TITLE + "\n" + "\n".join(observations))
+        if notes:
+            sections.append(self.NOTES_TITLE + "\n" + "\n".join(reversed(notes)))
+        return "\n\n".join(sections)
+
+    def build_shared(self, budget: int) -> str:
+        """앙상블 토론용 공유 컨텍스트 (대화 요약 + 최근 대화, 발화자 이름 그대로)"""
+        remaining = budget - self.SECTION_OVERHEAD_TOKENS
+        summary, used = self._fit(self._summary_lines(), min(remaining, int(budget * self.SUMMARY_SHARE)))
+        remaining -= used
+        recent, _ = self._fit(self._message_lines(mark_self=False), remaining)
+
+        sections = []
+        if summary:
+            sections.append(self.SUMMARY_TITLE + "\n" + "\n".join(reversed(summary)))
+        if recent:
+            sections.append(self.RECENT_TITLE + "\n" + "\n".join(reversed(recent)))
+        return "\n\n".join(sections)
+
+    def _header(self) -> str:
+        """항상 포함하는 기본 정보"""
+        memory = self.memory
+        return (
+            f"=== {memory.player_name}의 메모리 요약 ===\n"
+            f"- 실제 역할: {memory.actual_role}\n"
+            f"- 가짜 역할: {memory.my_fake_role}\n"
+            f"- 현재 페이즈: {memory.current_phase}\n"
+            f"🎯 승리 목표: {memory.victory_goal}"
+        )
+
+    def _observation_lines(self) -> List[str]:
+        """플레이어 관찰 요약 (의심/신뢰 판단이 있거나 행동 기록이 많은 플레이어 먼저)"""
+        suspicious = {p["player"]: p["reason"] for p in self.memory.suspicious_players}
+        trusted = {p["player"]: p["reason"] for p in self.memory.trusted_players}
+
+        def relevance(item: Tuple[str, dict]) -> tuple:
+            player, obs = item
+            return (
+                player in suspicious or player in trusted,
+                len(obs["suspicious_actions"]) + len(obs["trustworthy_actions"]),
+                len(obs["messages"])
+            )
+
+        lines = []
+        for player, obs in sorted(self.memory.player_observations.items(), key=relevance, reverse=True):
+            line = (f"- {player}: 메시지 {len(obs['messages'])}개, "
+                    f"의심스러운 행동 {len(obs['suspicious_actions'])}, "
+                    f"신뢰할 만한 행동 {len(obs['trustworthy_actions'])}")
+            if player in suspicious:
+                line += f" / 의심: {suspicious[player]}"
+            if player in trusted:
+                line += f" / 신뢰: {trusted[player]}"
+            lines.append(line)
+        return lines
+
+    def _summary_lines(self) -> List[str]:
+        """누적 대화 요약 (최신 문장 순)"""
+        summary = self.memory.conversation_summary
+        if not summary:
+            return []
+        sentences = [s.strip() for s in re.split(r"(?<=[.!?])\s+|\n", summary) if s.strip()]
+        return sentences[::-1]
+
+    def _note_lines(self) -> Iterator[str]:
+        """전략 노트 (최신 순)"""
+        for note in reversed(self.memory.strategy_notes):
+            yield f"- {note['note']}"
+
+    def _message_lines(self, mark_self: bool = True) -> Iterator[str]:
+        """요약되지 않은 대화 로그 메시지 (최신 순, 필요한 만큼만 읽음, mark_self면 자신의 발언을 '나'로 표시)"""
+        log = self.memory.message_log
+        start = 0
+        if self.memory.conversation_summary:
+            start = max(self.memory.summarizer.summarized_seq, len(log) - self.MAX_TAIL_MESSAGES)
+        for index in range(len(log) - 1, start - 1, -1):
+            msg = log[index]
+            sender = msg["sender"]
+            if mark_self and sender == self.memory.player_name:
+                sender = f"나({sender})"
+            yield f"{sender}: {msg['content'][:self.MAX_MESSAGE_CHARS]}"
+
+    @staticmethod
+    def _fit(lines, limit: int) -> Tuple[List[str], int]:
+        """앞에서부터 limit 토큰을 넘지 않는 만큼의 줄과 사용한 토큰 수 반환"""
+        taken, used = [], 0
+        for line in lines:
+            cost = estimate_tokens(line) + 1  # 줄바꿈
+            if used + cost > limit:
+                break
+            taken.append(line)
+            used += cost
+        return taken, used
@@ -0,0 +1,105 @@
+import asyncio
+from collections import Counter
+from typing import List, Mapping, Optional
+from models.message_log import MessageLog
+from agents.ai_agent import complete
+from utils.config import SUMMARY_RECENT_TAIL, SUMMARY_MIN_NEW_MESSAGES, SUMMARY_MAX_TOKENS
+
+# 게임 하나의 누적 대화 요약
+# 메시지 로그의 [0, summarized_seq) 구간을 짧은 요약 하나로 압축해 두고,
+# 프롬프트에는 이 요약과 summarized_seq 이후의 짧은 최근 대화만 넣음.
+# 공개 대화는 모든 AI에게 같으므로 요약은 게임당 하나만 만들어 AI 메모리들이 공유함.
+# 요약 호출은 LLM 스케줄러의 background 등급으로 가므로 AI 토론/투표 호출에 밀려 남는 자리에서만 실행됨
+class ConversationSummarizer:
+    # 요약 하나의 최대 글자 수 (호출 실패 때 만드는 요약 포함)
+    MAX_SUMMARY_CHARS = 600
+    # 요약 입력에서 메시지 하나에 쓰는 최대 글자 수
+    MAX_MESSAGE_CHARS = 200
+
+    def __init__(self, message_log: MessageLog, game_id: str = None):
+        self.message_log = message_log
+        self.game_id = game_id
+        self.summary = ""
+        self.summarized_seq = 0  # 이 순번 이전의 메시지는 summary에 포함됨
+        self.compactions = 0  # 완료된 요약 횟수
+        self._task: Optional[asyncio.Task] = None
+        self._pending_seq = 0  # 실행 중인 요약이 끝난 뒤 이어서 요약할 위치
+
+    def request_compaction(self):
+        """최근 대화(SUMMARY_RECENT_TAIL개)를 제외한 오래된 대화의 요약을 백그라운드에 요청
+
+        새로 요약할 메시지가 SUMMARY_MIN_NEW_MESSAGES개 미만이면 아무것도 하지 않음.
+        이미 요약 중이면 끝난 뒤 이어서 요약함
+        """
+        up_to = len(self.message_log) - SUMMARY_RECENT_TAIL
+        if up_to - self.summarized_seq < SUMMARY_MIN_NEW_MESSAGES:
+            return
+        self._pending_seq = max(self._pending_seq, up_to)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"summary-{self.game_id}")
+
+    async def _run(self):
+        """요청된 위치까지 요약 (요약 중 새 요청이 오면 이어서 진행)"""
+        while self._pending_seq > self.summarized_seq:
+            up_to = self._pending_seq
+            messages = self.message_log[self.summarized_seq:up_to]
+            try:
+                summary = await self._summarize(self.summary, messages)
+            except Exception as e:
+                print(f"대화 요약 오류: {e}")
+                summary = self._fallback_summary(self.summary, messages)
+            self.summary = summary
+            self.summarized_seq = up_to
+            self.compactions += 1
+            print(f"DEBUG: 대화 요약 갱신 - {self.game_id}, {up_to}번 메시지까지 ({len(summary)}자)")
+
+    async def _summarize(self, previous: str, messages: List[Mapping]) -> str:
+        """이전 요약과 새 메시지를 합친 요약 생성"""
+        transcript = "\n".join(
+            f"{msg['sender']}: {msg['content'][:self.MAX_MESSAGE_CHARS]}" for msg in messages
+        )
+        response = await complete(
+            [
+                {
+                    "role": "system",
+                    "content": "당신은 마피아 게임의 기록 담당입니다. 이전 요약과 새 대화를 합쳐 "
+                               "누가 무엇을 주장했는지, 누가 누구를 의심했는지, 투표와 제거 결과를 "
+                               "5문장 이내로 요약하세요. 역할을 추측하지 말고 드러난 사실만 쓰세요."
+                },
+                {
+                    "role": "user",
+                    "content": f"이전 요약: {previous or '없음'}\n\n새 대화:\n{transcript}"
+                },
+            ],
+            max_tokens=SUMMARY_MAX_TOKENS,
+            temperature=0.2,
+            call_type="summary",
+            game_id=self.game_id,
+        )
+        summary = response.text
+        return summary[:self.MAX_SUMMARY_CHARS] or self._fallback_summary(previous, messages)
+
+    def _fallback_summary(self, previous: str, messages: List[Mapping]) -> str:
+        """요약 호출이 실패했을 때 만드는 요약: 사회자 공지와 발언 횟수 (최신 내용 우선으로 길이 제한)"""
+        lines = previous.splitlines() if previous else []
+        lines += [msg["content"].replace("\n", " ") for msg in messages if msg["sender"] == "moderator"]
+        speakers = Counter(msg["sender"] for msg in messages if msg["sender"] != "moderator")
+        if speakers:
+            lines.append("발언 횟수: " + ", ".join(f"{sender} {count}회" for sender, count in speakers.items()))
+        summary = ""
+        for line in reversed(lines):
+            if len(summary) + len(line) + 1 > self.MAX_SUMMARY_CHARS:
+                break
+            summary = line + ("\n" + summary if summary else "")
+        return summary
+
+    async def wait(self):
+        """진행 중인 요약이 끝날 때까지 대기 (요약 시점을 고정해야 하는 벤치마크/재현용)"""
+        if self._task is not None and not self._task.done():
+            await self._task
+
+    def close(self):
+        """진행 중인 요약 작업 취소"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
@@ -0,0 +1,137 @@
+import json
+import textwrap
+from typing import Dict, List
+from models.game_state import GameState
+from agents.ai_agent import complete
+from utils.config import CONTEXT_TOKEN_BUDGETS
+
+# ensemble 토론: 한 번의 JSON 응답으로 이번 턴 모든 AI의 발언 생성
+# 규칙과 대화 컨텍스트를 AI마다 반복해 보내지 않고 한 번만 보내며,
+# AI별로는 역할/개성/관찰 기록만 담은 짧은 캐릭터 카드를 붙임
+
+# 캐릭터 하나당 응답 토큰 상한
+TOKENS_PER_SPEAKER = 120
+# 발언 하나의 최대 글자 수
+MAX_MESSAGE_CHARS = 300
+
+ENSEMBLE_RULES = """앙상블 토론 규칙:
+- 아래 캐릭터들이 이번 턴에 순서대로 한 번씩 발언합니다. 모든 캐릭터의 발언을 한 번에 작성하세요.
+- 각 캐릭터는 자신의 카드에 적힌 역할, 개성, 관찰 기록만 알고 있습니다.
+- 다른 캐릭터 카드의 비밀 정보(실제 역할 등)는 절대 그 캐릭터가 아닌 발언에 쓰지 마세요.
+- 마피아 캐릭터는 정체를 숨기고, 시민 캐릭터는 공개된 대화만 근거로 추리합니다.
+- 이전에 말한 내용을 반복하지 말고, 새로운 의견이나 관찰을 제시
+- 발언은 캐릭터의 개성에 맞는 말투로 두 문장 이내로 간결하게 작성
+- 앞 순서 캐릭터의 발언에 반응해도 됩니다
+
+OUTPUT: {"utterances": [{"speaker": "캐릭터 이름", "message": "발언"}]} 형식의 JSON만 출력"""
+
+def _response_format(speakers: List[str]) -> dict:
+    """발언자 이름을 enum으로 제한한 JSON 스키마"""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "ensemble_discussion",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "utterances": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "speaker": {"type": "string", "enum": speakers},
+                                "message": {"type": "string"}
+                            },
+                            "required": ["speaker", "message"],
+                            "additionalProperties": False
+                        }
+                    }
+                },
+                "required": ["utterances"],
+                "additionalProperties": False
+            }
+        }
+    }
+
+def parse_ensemble_output(text: str, speakers: List[str]) -> Dict[str, str]:
+    """JSON 응답을 검증해 발언자별 발언으로 나눔
+
+    알 수 없는 발언자, 중복 발언, 빈 발언은 버리고 올바른 발언만 반환
+    """
+    try:
+        data = json.loads(text)
+    except (TypeError, ValueError):
+        return {}
+    utterances = data.get("utterances") if isinstance(data, dict) else None
+    if not isinstance(utterances, list):
+        return {}
+
+    lines = {}
+    for item in utterances:
+        if not isinstance(item, dict):
+            continue
+        speaker, message = item.get("speaker"), item.get("message")
+        if speaker not in speakers or speaker in lines or not isinstance(message, str):
+            continue
+        message = message.strip()
+        if message:
+            lines[speaker] = message[:MAX_MESSAGE_CHARS]
+    return lines
+
+async def generate_ensemble_discussion(game_state: GameState, speakers: List[str], game_context: str,
+                                      deadline: float = None) -> Dict[str, str]:
+    """이번 턴 AI 발언을 한 번의 호출로 생성해 {플레이어: 발언} 반환
+
+    호출이 실패하거나 응답에서 빠진 AI는 결과에 없음 (호출한 쪽에서 개별 생성)
+    """
+    agents = [game_state.agents.get(player) for player in speakers]
+    for agent in agents:
+        agent.memory.update_phase(game_state.phase, game_state.turn)
+        agent.memory.ingest_messages()
+
+    if not agents:
+        return {}
+
+    # 공유 대화 컨텍스트는 한 번만 (대화 로그와 요약은 게임의 모든 AI가 공유)
+    shared = agents[0].context_builder.build_shared(CONTEXT_TOKEN_BUDGETS["ensemble_shared"])
+    cards = "\n\n".join(
+        f"### {agent.name}\n개성: {agent.personality_prompt}\n"
+        f"{agent.context_builder.build_private(CONTEXT_TOKEN_BUDGETS['ensemble_agent'])}"
+        for agent in agents
+    )
+
+    messages = [
+        {
+            "role": "system",
+            "content": f"{textwrap.dedent(agents[0].memory.game_rules).strip()}\n\n{ENSEMBLE_RULES}"
+        },
+        {
+            "role": "user",
+            "content": (
+                f"{shared}\n\n"
+                f"현재 게임 상황: {game_context}\n\n"
+                f"캐릭터 (발언 순서: {', '.join(speakers)}):\n\n{cards}"
+            )
+        },
+    ]
+
+    try:
+        response = await complete(
+            messages,
+            max_tokens=TOKENS_PER_SPEAKER * len(speakers),
+            temperature=0.7,
+            params={"response_format": _response_format(speakers)},
+            deadline=deadline,
+            call_type="ensemble",
+            game_id=game_state.game_id,
+        )
+    except Exception as e:
+        print(f"앙상블 토론 오류: {e}")
+        return {}
+
+    lines = parse_ensemble_output(response.text, speakers)
+    missing = [player for player in speakers if player not in lines]
+    if missing:
+        print(f"DEBUG: 앙상블 응답에서 빠진 AI - {missing} (개별 생성으로 대체)")
+    return lines
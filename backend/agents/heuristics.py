@@ -0,0 +1,94 @@
+import random
+from collections import Counter
+from typing import Dict, List, Optional
+
+# LLM 없이 쓰는 로컬 휴리스틱 (마감 시간 초과, 회로 차단, 호출 오류 때 AI 응답 대체)
+# 에이전트가 이미 가진 정보(최근 대화, 투표 기록, 역할)만 보고 바로 답함
+
+RECENT_MESSAGES = 30  # 점수 계산에 쓰는 최근 대화 수
+
+# 개성별 토론 발언 (suspect: 의심하는 플레이어)
+DISCUSSION_TEMPLATES = {
+    "aggressive": "{suspect}님 발언이 계속 걸립니다. 이번엔 {suspect}님을 확실히 짚고 넘어가죠.",
+    "defensive": "저는 떳떳합니다. 다만 {suspect}님 이야기는 조금 더 들어봐야 할 것 같아요.",
+    "logical": "지금까지 나온 이야기를 정리하면 {suspect}님 쪽이 가장 앞뒤가 안 맞습니다.",
+    "chaotic": "감이 왔어요. 왠지 {suspect}님이 수상합니다.",
+    "neutral": "아직 확신은 없지만 {suspect}님을 좀 더 지켜보겠습니다.",
+}
+# 아직 의심할 근거가 없을 때의 개성별 발언
+NO_SUSPECT_LINES = {
+    "aggressive": "다들 너무 조용하네요. 뭔가 숨기는 사람이 있으면 지금 말하는 게 좋을 겁니다.",
+    "defensive": "저는 아직 조심스럽게 지켜보는 중입니다. 섣불리 누굴 몰아가진 않겠습니다.",
+    "logical": "아직은 판단할 근거가 부족합니다. 각자 지금까지의 행동을 설명해 주시면 좋겠네요.",
+    "chaotic": "이상하게 다들 수상해 보이네요. 조금 더 떠들어 보면 드러나겠죠.",
+    "neutral": "아직은 판단할 근거가 부족하네요. 다들 의견을 조금 더 들려주세요.",
+}
+
+def _recent_messages(agent) -> list:
+    log = agent.memory.message_log
+    return [msg for msg in log[-RECENT_MESSAGES:] if msg["sender"] != "moderator"]
+
+def _mafia_team(agent) -> set:
+    if agent.game_state is None:
+        return {agent.name}
+    return {player for player, role in agent.game_state.roles.items() if role == "mafia"}
+
+def suspicion_scores(agent, candidates: List[str]) -> Dict[str, float]:
+    """후보별 의심 점수: 다른 플레이어들이 최근 대화에서 이름을 언급한 횟수 + 받은 표 수"""
+    scores = {candidate: 0.0 for candidate in candidates}
+    for msg in _recent_messages(agent):
+        for candidate in candidates:
+            if candidate != msg["sender"] and candidate in msg.get("content", ""):
+                scores[candidate] += 1
+    votes = Counter(vote["target"] for vote in agent.memory.vote_history if vote["voter"] != agent.name)
+    for candidate in candidates:
+        scores[candidate] += 2 * votes.get(candidate, 0)
+    return scores
+
+def threat_scores(agent, candidates: List[str]) -> Dict[str, float]:
+    """(마피아 입장) 후보별 위협 점수: 마피아 팀을 언급하거나 마피아 팀에 투표한 횟수"""
+    team = _mafia_team(agent)
+    scores = {candidate: 0.0 for candidate in candidates}
+    for msg in _recent_messages(agent):
+        if msg["sender"] in scores:
+            scores[msg["sender"]] += sum(1 for member in team if member in msg.get("content", ""))
+    for vote in agent.memory.vote_history:
+        if vote["voter"] in scores and vote["target"] in team:
+            scores[vote["voter"]] += 2
+    return scores
+
+def _pick(scores: Dict[str, float]) -> Optional[str]:
+    """점수가 가장 높은 후보 (동점이면 랜덤, 후보가 없으면 None)"""
+    if not scores:
+        return None
+    best = max(scores.values())
+    return random.choice([candidate for candidate, score in scores.items() if score == best])
+
+def choose_target(agent, candidates: List[str]) -> Optional[str]:
+    """투표/밤 행동 대상: 시민은 가장 의심받는 후보, 마피아는 팀이 아닌 후보 중 가장 위협적인 후보"""
+    if agent.role == "mafia":
+        team = _mafia_team(agent)
+        outsiders = [candidate for candidate in candidates if candidate not in team] or candidates
+        return _pick(threat_scores(agent, outsiders))
+    return _pick(suspicion_scores(agent, [candidate for candidate in candidates if candidate != agent.name]))
+
+def discussion_line(agent) -> str:
+    """토론 발언 (가장 의심하는 플레이어를 개성에 맞는 말투로 지목)"""
+    no_suspect = NO_SUSPECT_LINES.get(agent.personality, NO_SUSPECT_LINES["neutral"])
+    if agent.game_state is None:
+        return no_suspect
+    alive = [p for p in agent.game_state.players if p not in agent.game_state.eliminated and p != agent.name]
+    if agent.role == "mafia":
+        # 마피아는 팀이 아닌 플레이어 중 많이 언급된 사람에게 의심을 몰아감
+        team = _mafia_team(agent)
+        scores = suspicion_scores(agent, [p for p in alive if p not in team])
+    else:
+        scores = suspicion_scores(agent, alive)
+    if not scores or max(scores.values()) == 0:
+        return no_suspect
+    template = DISCUSSION_TEMPLATES.get(agent.personality, DISCUSSION_TEMPLATES["neutral"])
+    return template.format(suspect=_pick(scores))
+
+def introduction_line(agent) -> str:
+    """자기소개"""
+    return f"안녕하세요! 저는 {agent.name}입니다. 잘 부탁드립니다."
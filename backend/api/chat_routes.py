@@ -1,15 +1,21 @@
-import asyncio
 from datetime import datetime
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from models.pydantic_models import ChatMessage
-from models.game_state import game_state
-from game.game_logic import next_phase_internal
+from models.game_state import GameState
+from models.game_session import GameSession
+from api.dependencies import get_game_session
+from game.game_logic import schedule_next_phase
+from utils.config import DAY_TURN_ADVANCE_DELAY
 
 router = APIRouter()
 
 @router.post("/chat")
-async def chat(message: ChatMessage):
+async def chat(message: ChatMessage, session: GameSession = Depends(get_game_session)):
     """채팅 메시지 처리"""
+    return await session.actor.call(_handle_chat, session.state, message)
+
+async def _handle_chat(game_state: GameState, message: ChatMessage):
+    """채팅 메시지 저장 및 자동 진행 (게임 액터에서 실행)"""
     # 사용자 메시지를 먼저 저장
     game_state.chat_history.append({
         "sender": message.sender,
@@ -24,11 +30,8 @@ async def chat(message: ChatMessage):
     auto_progress_result = None
     if game_state.phase == "day":
         print(f"DEBUG: 사용자 메시지 수신 - 낮 페이즈 턴 {game_state.turn}")
-        # 3초 후 자동으로 다음 턴으로 진행
-        await asyncio.sleep(3)
-        print(f"DEBUG: 자동 진행 시작")
-        auto_progress_result = await next_phase_internal()
-        print(f"DEBUG: 자동 진행 완료 - 결과: {auto_progress_result}")
+        # 잠시 후 자동으로 다음 턴으로 진행 (스케줄러에 예약하고 바로 응답)
+        auto_progress_result = schedule_next_phase(game_state, DAY_TURN_ADVANCE_DELAY)
     
     return {
         "success": True,
@@ -0,0 +1,22 @@
+from fastapi import HTTPException
+from models.game_session import GameSession, game_registry
+from game.admission import AdmissionRejected, admission
+
+def admission_error(error: AdmissionRejected) -> HTTPException:
+    """입장 거절을 503 응답으로 변환 (Retry-After 헤더 포함)"""
+    return HTTPException(status_code=503, detail=error.reason, headers={"Retry-After": str(error.retry_after)})
+
+async def get_game_session(game_id: str) -> GameSession:
+    """요청의 game_id로 게임 세션 조회 (없으면 404)"""
+    session = game_registry.get(game_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="게임을 찾을 수 없습니다.")
+    session.touch()
+    return session
+
+async def check_llm_capacity():
+    """진행 중인 게임의 AI 요청 입장 확인 (LLM 대기열이 가득 차면 기다리지 않고 바로 503)"""
+    try:
+        admission.check_llm_call()
+    except AdmissionRejected as error:
+        raise admission_error(error)
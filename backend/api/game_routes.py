@@ -1,11 +1,23 @@
+import asyncio
 import random
+import time
+import uuid
 from datetime import datetime
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from models.pydantic_models import GameStartRequest, VoteRequest
-from models.game_state import game_state
+from models.game_state import GameState
+from models.message_log import MessageLog
+from models.game_session import GameSession, game_registry
+from api.dependencies import get_game_session, check_llm_capacity, admission_error
+from game.admission import AdmissionRejected, admission
 from game.moderator import moderator
-from game.game_logic import next_phase_internal
-from agents.ai_agent import AIAgent
+from game.game_logic import next_phase_internal, schedule_next_phase
+from agents.ai_agent import AIAgent, phase_deadline
+from agents.agent_pool import AgentPool
+from agents.conversation_summarizer import ConversationSummarizer
+from agents.ensemble_discussion import generate_ensemble_discussion
+from utils.latency import first_ai_message_latency
+from utils.config import VOTING_RESOLUTION_DELAY, AI_MAX_CONCURRENCY, AI_DISCUSSION_MODE
 
 router = APIRouter()
 
@@ -29,10 +41,23 @@ async def reset_usage_stats():
 
 @router.post("/game/start")
 async def start_game(request: GameStartRequest):
-    """게임 시작"""
+    """게임 시작 (새 게임 세션 생성, 서버가 혼잡하면 대기열에서 기다리거나 503)"""
+    game_id = request.game_id or uuid.uuid4().hex
+    game_registry.reap_idle()
+    # 입장이 확정된 뒤에만 이전 세션을 교체 (거절되거나 대기 시간이 초과되면 이전 게임은 그대로 남음)
+    # 같은 game_id로 다시 시작하면 이전 세션의 입장 자리를 그대로 넘겨받음
+    try:
+        await admission.admit_game(game_id)
+    except AdmissionRejected as error:
+        raise admission_error(error)
+    session = game_registry.create(game_id)
+    return await session.actor.call(_start_game, session.state, request.player_name, request.discussion_mode)
+
+async def _start_game(game_state: GameState, player_name: str, discussion_mode: str = None):
+    """게임 초기 설정 (게임 액터에서 실행)"""
     # 플레이어 설정 (사람 1명 + AI 4명)
     game_state.players = [
-        request.player_name,  # 사람 플레이어
+        player_name,  # 사람 플레이어
         "플레이어1",  # AI 에이전트들
         "플레이어2", 
         "플레이어3",
@@ -44,7 +69,7 @@ async def start_game(request: GameStartRequest):
     game_state.roles = {}
     
     # 유저는 무조건 시민
-    game_state.roles[request.player_name] = "citizen"
+    game_state.roles[player_name] = "citizen"
     
     # AI들 중에서 마피아 1명 랜덤 선택
     ai_players = ["플레이어1", "플레이어2", "플레이어3", "플레이어4"]
@@ -58,10 +83,13 @@ async def start_game(request: GameStartRequest):
             game_state.roles[ai_player] = "citizen"
     game_state.phase = "introduction"  # 자기소개 페이즈로 시작
     game_state.turn = 1
-    game_state.chat_history = []
+    game_state.chat_history = MessageLog()
+    game_state.summarizer = ConversationSummarizer(game_state.chat_history, game_state.game_id)
     game_state.votes = {}
+    game_state.vote_context = None
     game_state.eliminated = []
     game_state.introduction_complete = False  # 자기소개 완료 여부
+    game_state.discussion_mode = discussion_mode or AI_DISCUSSION_MODE
     
     # 게임 시작 공지
     start_message = moderator.announce_game_start(game_state.players)
@@ -81,17 +109,27 @@ async def start_game(request: GameStartRequest):
         "role": "moderator"
     })
     
+    # AI 에이전트 풀 생성 (게임 끝까지 재사용)
+    game_state.agents = AgentPool(game_state)
+    game_state.agents.create_all()
+    
+    # AI 자기소개를 백그라운드에서 미리 생성
+    _prefetch_introductions(game_state)
+    
     return {
         "success": True,
         "message": "게임이 시작되었습니다.",
+        "game_id": game_state.game_id,
         "players": game_state.players,
         "roles": game_state.roles,
-        "phase": game_state.phase
+        "phase": game_state.phase,
+        "discussion_mode": game_state.discussion_mode
     }
 
 @router.get("/game/state")
-async def get_game_state():
-    """게임 상태 조회"""
+async def get_game_state(session: GameSession = Depends(get_game_session)):
+    """게임 상태 조회 (읽기 전용이므로 게임 액터를 거치지 않음)"""
+    game_state = session.state
     # 사망 메시지 확인
     death_messages = [msg for msg in game_state.chat_history if 
                      msg.get('content') and (
@@ -115,7 +153,7 @@ async def get_game_state():
         "turn": game_state.turn,
         "players": game_state.players,
         "roles": game_state.roles,
-        "chat_history": game_state.chat_history,
+        "chat_history": game_state.chat_history.to_list(),
         "eliminated": game_state.eliminated,
         "debug": {
             "death_messages_count": len(death_messages),
@@ -124,27 +162,43 @@ async def get_game_state():
         }
     }
 
+@router.delete("/game")
+async def end_game(session: GameSession = Depends(get_game_session)):
+    """게임 세션 종료 및 정리"""
+    game_registry.remove(session.game_id)
+    return {
+        "success": True,
+        "message": "게임 세션이 종료되었습니다.",
+        "game_id": session.game_id
+    }
+
 @router.post("/game/next-phase")
-async def next_phase():
+async def next_phase(session: GameSession = Depends(get_game_session)):
     """다음 페이즈로 진행 (수동 버튼용)"""
-    return await next_phase_internal()
+    return await session.actor.call(next_phase_internal, session.state)
 
 @router.post("/game/auto-progress")
-async def auto_progress():
+async def auto_progress(session: GameSession = Depends(get_game_session)):
     """자동 진행 (밤 페이즈용)"""
+    return await session.actor.call(_auto_progress, session.state)
+
+async def _auto_progress(game_state: GameState):
+    """자동 진행 처리 (게임 액터에서 실행)"""
     if game_state.phase == "night":
-        return await next_phase_internal()
+        return await next_phase_internal(game_state)
     elif game_state.phase == "voting":
-        # 투표 페이즈에서 5초 후 자동으로 결과 처리
-        import asyncio
-        await asyncio.sleep(5)
-        return await next_phase_internal()
+        # 투표 페이즈에서 잠시 후 자동으로 결과 처리 (스케줄러에 예약하고 바로 응답)
+        return schedule_next_phase(game_state, VOTING_RESOLUTION_DELAY)
     else:
         return {"success": False, "message": "자동 진행 가능한 페이즈가 아닙니다."}
 
 @router.post("/game/complete-introduction")
-async def complete_introduction():
+async def complete_introduction(session: GameSession = Depends(get_game_session)):
     """자기소개 완료 후 밤으로 전환"""
+    return await session.actor.call(_complete_introduction, session.state)
+
+async def _complete_introduction(game_state: GameState):
+    """자기소개 완료 처리 (게임 액터에서 실행)"""
     if game_state.phase != "introduction":
         return {"success": False, "message": "자기소개 페이즈가 아닙니다."}
     
@@ -170,18 +224,14 @@ async def complete_introduction():
         "announcement": night_message
     }
 
-@router.post("/game/ai-introduction")
-async def ai_introduction():
-    """AI들이 자기소개를 하도록 하는 엔드포인트"""
-    if game_state.phase != "introduction":
-        return {"success": False, "message": "자기소개 페이즈가 아닙니다."}
-    
-    # AI 에이전트들의 자기소개 생성 (순차적으로)
-    ai_introductions = []
+def _prefetch_introductions(game_state: GameState):
+    """AI 자기소개 생성을 백그라운드에서 동시에 시작"""
+    game_state.intro_tasks = {}
+    deadline = phase_deadline("introduction")
     for player in game_state.players:
         if player.startswith("플레이어"):  # AI 플레이어만
             role = game_state.roles[player]
-            agent = AIAgent(player, role)
+            agent = game_state.agents.get(player)
             
             # 자기소개용 프롬프트
             intro_prompt = f"""당신은 마피아 게임의 {role}입니다. 
@@ -189,16 +239,48 @@ async def ai_introduction():
             예시: "안녕하세요! 저는 {player}입니다. 오늘 밤이 기대되네요!"
             """
             
-            ai_intro = await agent.get_introduction(intro_prompt)
-            ai_introductions.append({
-                "sender": player,
-                "content": ai_intro,
-                "timestamp": datetime.now().isoformat(),
-                "role": role,
-                "phase": game_state.phase
-            })
-            
-            game_state.chat_history.append(ai_introductions[-1])
+            game_state.intro_tasks[player] = asyncio.create_task(
+                agent.get_introduction(intro_prompt, deadline), name=f"intro-{game_state.game_id}-{player}"
+            )
+
+async def _collect_introductions(game_state: GameState) -> list:
+    """미리 시작한 AI 자기소개 결과를 모아 채팅 기록에 추가
+
+    이미 끝난 결과는 바로 쓰고, 아직 생성 중인 것만 기다림
+    """
+    if not game_state.intro_tasks:
+        _prefetch_introductions(game_state)
+    tasks = game_state.intro_tasks
+    game_state.intro_tasks = {}
+    
+    results = await asyncio.gather(*tasks.values())
+    
+    ai_introductions = []
+    for player, ai_intro in zip(tasks.keys(), results):
+        ai_introductions.append({
+            "sender": player,
+            "content": ai_intro,
+            "timestamp": datetime.now().isoformat(),
+            "role": game_state.roles[player],
+            "phase": game_state.phase
+        })
+        
+        game_state.chat_history.append(ai_introductions[-1])
+    
+    return ai_introductions
+
+@router.post("/game/ai-introduction")
+async def ai_introduction(session: GameSession = Depends(get_game_session)):
+    """AI들이 자기소개를 하도록 하는 엔드포인트"""
+    return await session.actor.call(_ai_introduction, session.state)
+
+async def _ai_introduction(game_state: GameState):
+    """AI 자기소개 처리 (게임 액터에서 실행)"""
+    if game_state.phase != "introduction":
+        return {"success": False, "message": "자기소개 페이즈가 아닙니다."}
+    
+    # 게임 시작 때 미리 생성해 둔 AI 자기소개
+    ai_introductions = await _collect_introductions(game_state)
     
     return {
         "success": True,
@@ -207,34 +289,17 @@ async def ai_introduction():
     }
 
 @router.post("/game/ai-introduction-sequential")
-async def ai_introduction_sequential():
+async def ai_introduction_sequential(session: GameSession = Depends(get_game_session)):
     """AI들이 순차적으로 자기소개를 하도록 하는 엔드포인트"""
+    return await session.actor.call(_ai_introduction_sequential, session.state)
+
+async def _ai_introduction_sequential(game_state: GameState):
+    """AI 순차 자기소개 처리 (게임 액터에서 실행)"""
     if game_state.phase != "introduction":
         return {"success": False, "message": "자기소개 페이즈가 아닙니다."}
     
-    # AI 에이전트들의 자기소개 생성 (순차적으로)
-    ai_introductions = []
-    for player in game_state.players:
-        if player.startswith("플레이어"):  # AI 플레이어만
-            role = game_state.roles[player]
-            agent = AIAgent(player, role)
-            
-            # 자기소개용 프롬프트
-            intro_prompt = f"""당신은 마피아 게임의 {role}입니다. 
-            간단하고 자연스러운 자기소개를 한 문장으로 해주세요.
-            예시: "안녕하세요! 저는 {player}입니다. 오늘 밤이 기대되네요!"
-            """
-            
-            ai_intro = await agent.get_introduction(intro_prompt)
-            ai_introductions.append({
-                "sender": player,
-                "content": ai_intro,
-                "timestamp": datetime.now().isoformat(),
-                "role": role,
-                "phase": game_state.phase
-            })
-            
-            game_state.chat_history.append(ai_introductions[-1])
+    # 게임 시작 때 미리 생성해 둔 AI 자기소개 (클라이언트가 순차적으로 표시)
+    ai_introductions = await _collect_introductions(game_state)
     
     return {
         "success": True,
@@ -242,37 +307,88 @@ async def ai_introduction_sequential():
         "message": "AI들이 자기소개를 했습니다."
     }
 
-@router.post("/game/ai-speak-first")
-async def ai_speak_first():
+def _alive_players(game_state: GameState) -> list:
+    """살아있는 플레이어 목록"""
+    return [p for p in game_state.players if p not in game_state.eliminated]
+
+async def _generate_ai_discussion(game_state: GameState, deadline: float = None) -> list:
+    """살아있는 AI들의 토론 발언 생성 후 채팅 기록에 추가
+
+    deadline은 라우트에서 정한 이번 토론 전체의 마감 시각으로, 지나면 남은 AI는 휴리스틱 발언으로 대체
+
+    - sequential: 한 명씩 차례로 생성 (앞 사람의 발언을 보고 말함)
+    - concurrent: 모든 AI 발언을 동시에 생성 (동시 호출 수 제한) 후 발언 순서대로 추가
+    - ensemble: 한 번의 JSON 응답으로 모든 AI 발언 생성 (빠지거나 잘못된 발언은 concurrent 방식으로 생성)
+    """
+    speakers = [
+        player for player in game_state.players
+        if (player.startswith("플레이어") and
+            player not in game_state.eliminated and
+            player in game_state.roles)  # 역할이 있는지 확인
+    ]
+    
+    start = time.perf_counter()
+    
+    def build_context() -> str:
+        # 게임 상황 요약 (최근 대화는 각 에이전트가 토큰 예산에 맞춰 대화 로그에서 직접 고름)
+        return f"{game_state.turn}턴 토론, 생존자: {', '.join(_alive_players(game_state))}"
+    
+    def record(player: str, ai_response: str) -> dict:
+        if not ai_responses:
+            first_ai_message_latency.record(time.perf_counter() - start)
+        message = {
+            "sender": player,
+            "content": ai_response,
+            "timestamp": datetime.now().isoformat(),
+            "role": game_state.roles[player],
+            "turn": game_state.turn,
+            "phase": game_state.phase
+        }
+        game_state.chat_history.append(message)
+        return message
+    
+    async def speak_concurrently(players: list, context: str) -> dict:
+        semaphore = asyncio.Semaphore(AI_MAX_CONCURRENCY)
+        
+        async def speak(player: str) -> str:
+            async with semaphore:
+                agent = game_state.agents.get(player)
+                return await agent.get_action(context, game_state.phase, deadline)
+        
+        results = await asyncio.gather(*[speak(player) for player in players])
+        return dict(zip(players, results))
+    
+    ai_responses = []
+    if game_state.discussion_mode in ("concurrent", "ensemble"):
+        context = build_context()
+        lines = {}
+        if game_state.discussion_mode == "ensemble":
+            lines = await generate_ensemble_discussion(game_state, speakers, context, deadline)
+        missing = [player for player in speakers if player not in lines]
+        if missing:
+            lines.update(await speak_concurrently(missing, context))
+        for player in speakers:
+            ai_responses.append(record(player, lines[player]))
+    else:
+        for player in speakers:
+            agent = game_state.agents.get(player)
+            ai_response = await agent.get_action(build_context(), game_state.phase, deadline)
+            ai_responses.append(record(player, ai_response))
+    
+    return ai_responses
+
+@router.post("/game/ai-speak-first", dependencies=[Depends(check_llm_capacity)])
+async def ai_speak_first(session: GameSession = Depends(get_game_session)):
     """AI들이 먼저 말하도록 하는 엔드포인트"""
+    return await session.actor.call(_ai_speak_first, session.state, phase_deadline("discussion"))
+
+async def _ai_speak_first(game_state: GameState, deadline: float = None):
+    """AI 먼저 말하기 처리 (게임 액터에서 실행)"""
     if game_state.phase != "day":
         return {"success": False, "message": "낮 페이즈가 아닙니다."}
     
     # AI 에이전트들의 응답 생성 (사망한 AI 제외)
-    ai_responses = []
-    for player in game_state.players:
-        if (player.startswith("플레이어") and 
-            player not in game_state.eliminated and
-            player in game_state.roles):  # 역할이 있는지 확인
-            
-            role = game_state.roles[player]
-            agent = AIAgent(player, role)
-            
-            # 게임 컨텍스트 생성
-            recent_messages = game_state.chat_history[-10:]  # 최근 10개 메시지
-            context = f"최근 대화: {[msg['content'] for msg in recent_messages]}"
-            
-            ai_response = await agent.get_action(context, game_state.phase)
-            ai_responses.append({
-                "sender": player,
-                "content": ai_response,
-                "timestamp": datetime.now().isoformat(),
-                "role": role,
-                "turn": game_state.turn,
-                "phase": game_state.phase
-            })
-            
-            game_state.chat_history.append(ai_responses[-1])
+    ai_responses = await _generate_ai_discussion(game_state, deadline)
     
     return {
         "success": True,
@@ -280,37 +396,18 @@ async def ai_speak_first():
         "message": "AI들이 먼저 말했습니다."
     }
 
-@router.post("/game/ai-speak-sequential")
-async def ai_speak_sequential():
+@router.post("/game/ai-speak-sequential", dependencies=[Depends(check_llm_capacity)])
+async def ai_speak_sequential(session: GameSession = Depends(get_game_session)):
     """AI들이 순차적으로 말하도록 하는 엔드포인트"""
+    return await session.actor.call(_ai_speak_sequential, session.state, phase_deadline("discussion"))
+
+async def _ai_speak_sequential(game_state: GameState, deadline: float = None):
+    """AI 순차 발화 처리 (게임 액터에서 실행)"""
     if game_state.phase != "day":
         return {"success": False, "message": "낮 페이즈가 아닙니다."}
     
-    # AI 에이전트들의 응답 생성 (순차적으로, 사망한 AI 제외)
-    ai_responses = []
-    for player in game_state.players:
-        if (player.startswith("플레이어") and 
-            player not in game_state.eliminated and
-            player in game_state.roles):  # 역할이 있는지 확인
-            
-            role = game_state.roles[player]
-            agent = AIAgent(player, role)
-            
-            # 게임 컨텍스트 생성
-            recent_messages = game_state.chat_history[-10:]  # 최근 10개 메시지
-            context = f"최근 대화: {[msg['content'] for msg in recent_messages]}"
-            
-            ai_response = await agent.get_action(context, game_state.phase)
-            ai_responses.append({
-                "sender": player,
-                "content": ai_response,
-                "timestamp": datetime.now().isoformat(),
-                "role": role,
-                "turn": game_state.turn,
-                "phase": game_state.phase
-            })
-            
-            game_state.chat_history.append(ai_responses[-1])
+    # AI 에이전트들의 응답 생성 (사망한 AI 제외, 클라이언트가 순차적으로 표시)
+    ai_responses = await _generate_ai_discussion(game_state, deadline)
     
     return {
         "success": True,
@@ -319,8 +416,12 @@ async def ai_speak_sequential():
     }
 
 @router.post("/vote")
-async def submit_vote(vote_request: VoteRequest):
+async def submit_vote(vote_request: VoteRequest, session: GameSession = Depends(get_game_session)):
     """투표 제출"""
+    return await session.actor.call(_submit_vote, session.state, vote_request)
+
+async def _submit_vote(game_state: GameState, vote_request: VoteRequest):
+    """투표 제출 처리 (게임 액터에서 실행)"""
     if game_state.phase != "voting":
         return {"success": False, "message": "투표 페이즈가 아닙니다."}
     
@@ -350,51 +451,68 @@ async def submit_vote(vote_request: VoteRequest):
         }
     }
 
-@router.post("/game/ai-vote")
-async def ai_vote():
+@router.post("/game/ai-vote", dependencies=[Depends(check_llm_capacity)])
+async def ai_vote(session: GameSession = Depends(get_game_session)):
     """AI들이 투표하도록 하는 엔드포인트"""
+    return await session.actor.call(_ai_vote, session.state, phase_deadline("vote"))
+
+def _get_vote_context(game_state: GameState) -> str:
+    """투표 페이즈용 게임 컨텍스트 (투표 페이즈마다 한 번만 생성해 모든 AI가 공유)"""
+    if game_state.vote_context is None:
+        # 게임 상황 요약 (대화 내용은 각 에이전트가 토큰 예산에 맞춰 대화 로그에서 직접 고름)
+        eliminated = ', '.join(game_state.eliminated) or "없음"
+        game_state.vote_context = (
+            f"투표 페이즈, 생존자: {', '.join(_alive_players(game_state))}, 제거된 플레이어: {eliminated}"
+        )
+    return game_state.vote_context
+
+async def _ai_vote(game_state: GameState, deadline: float = None):
+    """AI 투표 처리 (게임 액터에서 실행)"""
     if game_state.phase != "voting":
         return {"success": False, "message": "투표 페이즈가 아닙니다."}
     
-    # AI 에이전트들의 투표 생성 (사망한 AI 제외)
-    ai_votes = []
-    
+    # 아직 투표하지 않은 살아있는 AI와 각자의 투표 대상 후보 (살아있는 다른 플레이어)
+    ballots = []
     for player in game_state.players:
         if (player.startswith("플레이어") and 
             player not in game_state.eliminated and
             player in game_state.roles and
             player not in game_state.votes):  # 아직 투표하지 않은 AI만
             
-            # AI가 투표할 대상 선택 (살아있는 다른 플레이어 중에서)
             alive_targets = [p for p in game_state.players 
                            if p != player and p not in game_state.eliminated]
-            
             if alive_targets:
-                # AI 에이전트 생성
-                role = game_state.roles[player]
-                agent = AIAgent(player, role)
-                
-                # 게임 컨텍스트 생성 (전체 대화 로그 포함)
-                all_messages = [msg['content'] for msg in game_state.chat_history]
-                context = f"전체 대화 로그: {' | '.join(all_messages)}"
-                
-                # AI가 지능적으로 투표 대상 선택
-                target = await agent.get_vote_target(context, alive_targets)
-                game_state.votes[player] = target
-                
-                ai_votes.append({
-                    "voter": player,
-                    "target": target
-                })
-                
-                # 투표 메시지 추가
-                vote_message = f"🗳️ {player}님이 {target}님에게 투표했습니다."
-                game_state.chat_history.append({
-                    "sender": "moderator",
-                    "content": vote_message,
-                    "timestamp": datetime.now().isoformat(),
-                    "role": "moderator"
-                })
+                ballots.append((player, alive_targets))
+    
+    context = _get_vote_context(game_state)
+    semaphore = asyncio.Semaphore(AI_MAX_CONCURRENCY)
+    
+    async def cast(player: str, alive_targets: list) -> str:
+        async with semaphore:
+            agent = game_state.agents.get(player)
+            # AI가 지능적으로 투표 대상 선택
+            return await agent.get_vote_target(context, alive_targets, deadline)
+    
+    # 모든 AI 투표를 동시에 받은 뒤 플레이어 순서대로 반영
+    targets = await asyncio.gather(*[cast(player, alive_targets) for player, alive_targets in ballots])
+    
+    ai_votes = []
+    for (player, _), target in zip(ballots, targets):
+        game_state.votes[player] = target
+        
+        ai_votes.append({
+            "voter": player,
+            "target": target
+        })
+        
+        # 투표 메시지 추가
+        vote_message = f"🗳️ {player}님이 {target}님에게 투표했습니다."
+        game_state.chat_history.append({
+            "sender": "moderator",
+            "content": vote_message,
+            "timestamp": datetime.now().isoformat(),
+            "role": "moderator"
+        })
     
     return {
         "success": True,
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+과부하 입장 제어 벤치마크
+
+이미 진행 중인 게임들이 AI 토론을 이어 가는 동안 새 게임이 한꺼번에 몰려올 때,
+진행 중인 게임의 AI 토론 응답 시간(p50/p95)과 새 게임의 입장 결과(입장/503)를 측정합니다.
+입장 제어를 끈 경우(모든 새 게임을 받음)와 켠 경우를 비교합니다.
+OpenAI 키 없이 지연 시간을 설정한 스텁 제공자로 실행됩니다.
+
+실행: cd backend && python benchmarks/bench_admission.py --existing 6 --flood 40 --max-games 12
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.chdir(BACKEND_DIR)
+
+async def play(client, name: str, rounds: int, speak_latency) -> bool:
+    """게임 하나를 시작해 낮 토론을 rounds번 진행 (입장 거절되면 False)"""
+    response = await client.post("/game/start", json={"player_name": name})
+    if response.status_code == 503:
+        return False
+    params = {"game_id": response.json()["game_id"]}
+    await client.post("/game/ai-introduction", params=params)
+    await client.post("/game/complete-introduction", params=params)
+    await client.post("/game/auto-progress", params=params)
+    for i in range(rounds):
+        start = time.perf_counter()
+        response = await client.post("/game/ai-speak-first", params=params)
+        if response.status_code == 200:
+            speak_latency.record(time.perf_counter() - start)
+        await client.post("/chat", params=params, json={
+            "sender": name, "content": f"제 생각은 {i}", "timestamp": "2024-01-01T00:00:00"
+        })
+    await client.delete("/game", params=params)
+    return True
+
+async def run_load(client, args):
+    from utils.latency import LatencyTracker
+    existing_latency = LatencyTracker()
+    new_latency = LatencyTracker()
+
+    async def flood(i: int) -> bool:
+        await asyncio.sleep(args.flood_start_ms / 1000 + i * args.arrival_ms / 1000)
+        return await play(client, f"새사람{i}", args.rounds, new_latency)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *[play(client, f"사람{i}", args.rounds, existing_latency) for i in range(args.existing)],
+        *[flood(i) for i in range(args.flood)],
+    )
+    admitted = sum(1 for ok in results[args.existing:] if ok)
+    return {
+        "elapsed": time.perf_counter() - start,
+        "existing": existing_latency.to_dict(),
+        "new": new_latency.to_dict(),
+        "admitted": admitted,
+    }
+
+async def run(args):
+    import httpx
+    from main import app
+    from game.admission import admission
+
+    settings = {
+        "제한 없음": {"max_active_games": 0, "new_game_max_llm_queue": 0, "max_llm_queue": 0},
+        "입장 제어": {"max_active_games": args.max_games, "new_game_max_llm_queue": args.new_game_llm_queue,
+                   "max_llm_queue": args.llm_queue},
+    }
+    print(f"동시 LLM 호출 {args.concurrency}, 응답 지연 {args.latency_ms:.0f}ms, 진행 중인 게임 {args.existing}, "
+          f"몰려오는 새 게임 {args.flood} ({args.arrival_ms:.0f}ms 간격), 게임당 토론 {args.rounds}번, 대기열 모드 {args.mode}")
+    print(f"{'방식':<8} | {'기존 게임 p50':>12} | {'p95':>9} | {'새 게임 입장':>10} | {'새 게임 p95':>10} | 전체")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench/api", timeout=None) as client:
+        for name, limits in settings.items():
+            for key, value in limits.items():
+                setattr(admission, key, value)
+            admission.mode = args.mode
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = await run_load(client, args)
+            existing = result["existing"]
+            print(f"{name:<8} | {existing['p50_ms']:>9.0f} ms | {existing['p95_ms']:>6.0f} ms | "
+                  f"{result['admitted']:>5}/{args.flood:<5} | {result['new']['p95_ms']:>7.0f} ms | {result['elapsed']:.1f}s")
+        print(f"입장 제어 통계: {admission.get_status()}")
+
+def main():
+    parser = argparse.ArgumentParser(description="과부하 입장 제어 벤치마크")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 LLM 호출 수 상한")
+    parser.add_argument("--latency-ms", type=float, default=200, help="스텁 응답 지연 (ms)")
+    parser.add_argument("--existing", type=int, default=6, help="먼저 진행 중인 게임 수")
+    parser.add_argument("--flood", type=int, default=40, help="한꺼번에 몰려오는 새 게임 수")
+    parser.add_argument("--flood-start-ms", type=float, default=1500, help="새 게임이 몰려오기 시작하는 시각 (ms)")
+    parser.add_argument("--arrival-ms", type=float, default=5, help="새 게임 도착 간격 (ms)")
+    parser.add_argument("--rounds", type=int, default=3, help="게임당 AI 토론 라운드 수")
+    parser.add_argument("--max-games", type=int, default=12, help="입장 제어: 동시 게임 수 상한")
+    parser.add_argument("--new-game-llm-queue", type=int, default=8, help="입장 제어: 새 게임을 받는 LLM 대기열 한도")
+    parser.add_argument("--llm-queue", type=int, default=64, help="입장 제어: 진행 중인 게임 AI 요청의 LLM 대기열 한도")
+    parser.add_argument("--mode", choices=["queue", "reject"], default="reject", help="자리가 없을 때 새 게임 처리")
+    parser.add_argument("--queue-timeout", type=float, default=2, help="queue 모드: 대기열에서 기다리는 최대 시간 (초)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("LLM_PROVIDER", "stub")
+    os.environ["LLM_STUB_LATENCY_MS"] = str(args.latency_ms)
+    os.environ["LLM_MAX_CONCURRENT_CALLS"] = str(args.concurrency)
+    os.environ["ADMISSION_QUEUE_TIMEOUT"] = str(args.queue_timeout)
+    # 동시 호출 수 상한이 병목이 되도록 속도 제한은 끔
+    os.environ["LLM_RATE_LIMIT_RPM"] = "0"
+    os.environ["LLM_RATE_LIMIT_TPM"] = "0"
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+게임당 AI 에이전트 메모리 사용량 벤치마크
+
+N개의 게임을 진행하며 (자기소개 -> 밤 -> 낮 토론 반복) 게임당 메모리 사용량을 측정합니다.
+tracemalloc으로 측정한 파이썬 힙 증가량과 에이전트 메모리 항목 수를 함께 출력합니다.
+비교 기준으로, 에이전트마다 읽은 메시지를 conversation_history와 player_observations[...]["messages"]에
+dict로 복사해 두던 이전 방식의 메모리도 같은 게임에서 만들어 공유 로그 방식과 나란히 출력합니다.
+OpenAI 키 없이 실행되며 AI 발언은 스텁 LLM 제공자(LLM_PROVIDER=stub)가 만듭니다.
+
+실행: cd backend && python benchmarks/bench_agent_memory.py --games 50 --speaks 10
+"""
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import io
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.chdir(BACKEND_DIR)
+os.environ.setdefault("LLM_PROVIDER", "stub")
+os.environ.setdefault("ADMISSION_MAX_ACTIVE_GAMES", "0")  # 동시 게임 수 자체를 재므로 입장 제한 없음
+# 메모리만 재므로 요청/토큰 속도 제한 끔 (llm.provider를 불러오기 전에 설정해야 적용됨)
+os.environ.setdefault("LLM_RATE_LIMIT_RPM", "0")
+os.environ.setdefault("LLM_RATE_LIMIT_TPM", "0")
+
+import httpx
+from main import app
+from models.game_session import game_registry
+
+def deep_sizeof(obj, seen: set = None) -> int:
+    """객체가 참조하는 컨테이너/문자열까지 포함한 크기 (같은 객체는 한 번만 셈)"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, MappingProxyType):
+        size += sys.getsizeof(dict(obj))  # 읽기 전용 뷰가 감싼 dict
+    if isinstance(obj, (dict, MappingProxyType)):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(obj[k], seen) for k in obj.keys())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+        size += deep_sizeof(vars(obj), seen)
+    return size
+
+def agent_memory_bytes(game_state) -> tuple:
+    """(채팅 기록 크기, 채팅 기록을 제외한 에이전트 메모리 크기)
+
+    채팅 기록을 먼저 세므로 에이전트 메모리가 공유 로그를 참조해도 중복으로 세지 않음
+    """
+    seen = set()
+    transcript = deep_sizeof(game_state.chat_history, seen)
+    memories = 0
+    if game_state.agents is not None:
+        for player in game_state.agents.players():
+            memories += deep_sizeof(vars(game_state.agents.get(player).memory), seen)
+    return transcript, memories
+
+def copied_memory(memory) -> dict:
+    """메시지를 복사해 두던 이전 방식의 에이전트 메모리 재현
+
+    자신의 발언을 뺀 읽은 메시지마다 대화 기록 dict 하나와 발언자 관찰 기록 dict 하나를 새로 만듦
+    (내용 문자열은 채팅 기록과 같은 객체를 참조). 나머지 항목은 현재 메모리를 그대로 씀
+    """
+    copied = dict(vars(memory))
+    conversation_history = []
+    observations = {player: dict(observation, messages=[])
+                    for player, observation in memory.player_observations.items()}
+    for seq in memory.conversation_seqs:
+        msg = memory.message_log[seq]
+        if msg["sender"] == memory.player_name:
+            continue
+        conversation_history.append({
+            "timestamp": datetime.now().isoformat(),
+            "speaker": msg["sender"],
+            "content": msg["content"],
+            "role": msg.get("role"),
+            "phase": memory.current_phase,
+        })
+        observation = observations.setdefault(msg["sender"], {"messages": []})
+        observation["messages"].append({
+            "content": msg["content"],
+            "phase": memory.current_phase,
+            "timestamp": datetime.now().isoformat(),
+        })
+    copied.pop("message_log", None)
+    copied.pop("conversation_seqs", None)
+    copied["conversation_history"] = conversation_history
+    copied["player_observations"] = observations
+    return copied
+
+def copied_memory_bytes(game_state) -> int:
+    """이전 방식으로 복사한 에이전트 메모리 크기 (채팅 기록 제외)"""
+    if game_state.agents is None:
+        return 0
+    # 복사본을 모두 살려 둔 채로 셈 (먼저 센 임시 객체가 해제되면 같은 id가 재사용되어 빠짐)
+    copies = [copied_memory(game_state.agents.get(player).memory) for player in game_state.agents.players()]
+    seen = set()
+    deep_sizeof(game_state.chat_history, seen)
+    return sum(deep_sizeof(copy, seen) for copy in copies)
+
+def agent_memory_entries(game_state) -> dict:
+    """게임의 모든 에이전트 메모리 항목 수 집계"""
+    totals = {"agents": 0, "conversation_history": 0, "observed_messages": 0, "game_history": 0}
+    if game_state.agents is None:
+        return totals
+    for player in game_state.agents.players():
+        memory = game_state.agents.get(player).memory
+        totals["agents"] += 1
+        totals["conversation_history"] += len(memory.conversation_history)
+        totals["observed_messages"] += sum(len(o["messages"]) for o in memory.player_observations.values())
+        totals["game_history"] += len(memory.game_history)
+    return totals
+
+async def play(client: httpx.AsyncClient, index: int, speaks: int) -> str:
+    """게임 하나를 낮 토론까지 진행"""
+    game_id = (await client.post("/game/start", json={"player_name": f"사람{index}"})).json()["game_id"]
+    params = {"game_id": game_id}
+    await client.post("/game/ai-introduction", params=params)
+    await client.post("/game/complete-introduction", params=params)
+    await client.post("/game/auto-progress", params=params)
+    for i in range(speaks):
+        await client.post("/game/ai-speak-first", params=params)
+        await client.post("/chat", params=params, json={
+            "sender": f"사람{index}", "content": f"제 생각은 {i}", "timestamp": "2024-01-01T00:00:00"
+        })
+    return game_id
+
+async def run(games: int, speaks: int):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench/api") as client:
+        # 지연 import 등 첫 실행 비용을 측정에서 빼기 위한 예열 게임
+        with contextlib.redirect_stdout(io.StringIO()):
+            warmup_id = await play(client, -1, 1)
+            await client.delete("/game", params={"game_id": warmup_id})
+
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            game_ids = await asyncio.gather(*[play(client, i, speaks) for i in range(games)])
+        elapsed = time.perf_counter() - start
+        used = tracemalloc.get_traced_memory()[0] - baseline
+
+        sample = game_registry.get(game_ids[0]).state
+        entries = agent_memory_entries(sample)
+        print(f"게임 수: {games}, 게임당 토론 발화 라운드: {speaks}, 소요 시간: {elapsed:.2f}s")
+        print(f"채팅 기록 길이 (게임당): {len(sample.chat_history)}")
+        print(f"에이전트 메모리 항목 (게임당): {entries}")
+        transcript_bytes, memory_bytes = agent_memory_bytes(sample)
+        copied_bytes = copied_memory_bytes(sample)
+        print(f"채팅 기록 크기: {transcript_bytes / 1024:.1f} KB")
+        print(f"에이전트 메모리 크기 (게임당, 채팅 기록 제외): 공유 로그 {memory_bytes / 1024:.1f} KB, "
+              f"메시지 복사 {copied_bytes / 1024:.1f} KB ({copied_bytes / max(memory_bytes, 1):.1f}배)")
+        print(f"힙 증가량: 총 {used / 1024:.1f} KB, 게임당 {used / games / 1024:.1f} KB")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            for game_id in game_ids:
+                await client.delete("/game", params={"game_id": game_id})
+        await asyncio.sleep(0.1)  # 취소된 게임 액터 태스크가 정리될 시간
+        gc.collect()
+        released = tracemalloc.get_traced_memory()[0] - baseline
+        print(f"게임 종료 후 남은 힙 증가량: {released / 1024:.1f} KB")
+        tracemalloc.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="게임당 에이전트 메모리 벤치마크")
+    parser.add_argument("--games", type=int, default=50, help="동시에 진행할 게임 수")
+    parser.add_argument("--speaks", type=int, default=10, help="게임당 AI 토론 + 사용자 발언 라운드 수")
+    args = parser.parse_args()
+    asyncio.run(run(args.games, args.speaks))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+프롬프트 컨텍스트 토큰 예산 벤치마크
+
+대화 로그 길이를 늘려가며 투표/토론/밤 행동 프롬프트의 메모리 컨텍스트 크기(추정 토큰 수)와
+컨텍스트를 만드는 데 걸리는 시간을 측정합니다.
+비교용으로 이전 방식(전체 메모리 요약 + 전체 대화 로그)의 투표 컨텍스트 크기와
+오래된 대화를 요약한 뒤(요약 + 짧은 최근 대화)의 투표 컨텍스트 크기도 함께 출력합니다.
+OpenAI 키 없이 실행되며 대화 요약은 스텁 LLM 제공자(LLM_PROVIDER=stub)가 만듭니다.
+
+실행: cd backend && python benchmarks/bench_context_budget.py --lengths 50 500 5000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault("LLM_PROVIDER", "stub")
+
+from agents.ai_memory import AIMemory
+from agents.context_builder import ContextBuilder
+from agents.conversation_summarizer import ConversationSummarizer
+from models.message_log import MessageLog
+from utils.config import CONTEXT_TOKEN_BUDGETS
+from utils.tokens import estimate_tokens
+
+PLAYERS = ["나", "플레이어1", "플레이어2", "플레이어3", "플레이어4"]
+SAMPLE_LINES = [
+    "저는 플레이어2가 어제부터 말을 아끼는 게 수상하다고 생각해요.",
+    "증거 없이 의심하는 건 위험합니다. 투표 패턴을 먼저 봅시다.",
+    "I think we should focus on who changed their vote last round.",
+    "밤에 사라진 사람을 보면 마피아는 논리적인 플레이어를 노리는 것 같네요.",
+]
+
+def build_game(length: int, summarizer: bool = False) -> AIMemory:
+    """length개의 메시지가 쌓인 게임의 AI 메모리 (summarizer=True면 오래된 대화를 요약해 둠)"""
+    log = MessageLog()
+    with contextlib.redirect_stdout(io.StringIO()):
+        memory = AIMemory("플레이어1", "mafia", "logical", message_log=log,
+                          summarizer=ConversationSummarizer(log) if summarizer else None)
+    rng = random.Random(length)
+    for i in range(length):
+        log.append({"sender": rng.choice(PLAYERS), "content": rng.choice(SAMPLE_LINES), "timestamp": "", "role": "user"})
+        if i % 20 == 0:
+            memory.ingest_messages()
+            memory.add_strategy_note(f"{i}번째 메시지 이후 플레이어{rng.randint(2, 4)}를 주시")
+            memory.update_suspicious_players(f"플레이어{rng.randint(2, 4)}", "말을 아낌")
+    memory.ingest_messages()
+    if summarizer:
+        asyncio.run(compact(memory.summarizer))
+    return memory
+
+def legacy_memory_summary(memory: AIMemory) -> str:
+    """이전 방식의 전체 메모리 요약 (비교 기준선으로만 사용)"""
+    summary = f"""
+=== {memory.player_name}의 메모리 요약 ===
+
+📋 기본 정보:
+- 실제 역할: {memory.actual_role}
+- 가짜 역할: {memory.my_fake_role}
+- 현재 페이즈: {memory.current_phase}
+
+🎯 승리 목표:
+{memory.victory_goal}
+
+👥 플레이어 관찰:
+"""
+    for player, observations in memory.player_observations.items():
+        summary += f"\n- {player}:"
+        summary += f"\n  • 메시지 수: {len(observations['messages'])}"
+        summary += f"\n  • 의심스러운 행동: {len(observations['suspicious_actions'])}"
+        summary += f"\n  • 신뢰할 만한 행동: {len(observations['trustworthy_actions'])}"
+    summary += f"\n\n🔍 의심스러운 플레이어: {[p['player'] for p in memory.suspicious_players]}"
+    summary += f"\n🤝 신뢰할 수 있는 플레이어: {[p['player'] for p in memory.trusted_players]}"
+    if memory.strategy_notes:
+        summary += f"\n\n📝 최근 전략 노트:"
+        for note in memory.strategy_notes[-3:]:
+            summary += f"\n- {note['note']}"
+    return summary
+
+async def compact(summarizer: ConversationSummarizer):
+    """최근 대화를 제외한 대화 요약을 끝까지 실행"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        summarizer.request_compaction()
+        await summarizer.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description="프롬프트 컨텍스트 토큰 예산 벤치마크")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[50, 500, 5000], help="대화 로그 메시지 수")
+    parser.add_argument("--repeat", type=int, default=200, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    print(f"예산: {CONTEXT_TOKEN_BUDGETS}")
+    print(f"{'메시지 수':>8} | {'이전 투표 컨텍스트':>16} | " +
+          " | ".join(f"{call_type:>10}" for call_type in CONTEXT_TOKEN_BUDGETS) + f" | {'요약 후 투표':>10} | 생성 시간(투표)")
+    for length in args.lengths:
+        memory = build_game(length)
+        builder = ContextBuilder(memory)
+
+        # 이전 방식: 전체 메모리 요약 + 전체 대화 로그
+        full_log = f"전체 대화 로그: {' | '.join(msg['content'] for msg in memory.message_log)}"
+        legacy_tokens = estimate_tokens(memory.get_vote_context(legacy_memory_summary(memory)) + full_log)
+
+        sizes = [estimate_tokens(builder.build(call_type)) for call_type in CONTEXT_TOKEN_BUDGETS]
+        summarized_tokens = estimate_tokens(ContextBuilder(build_game(length, summarizer=True)).build("vote"))
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            builder.build("vote")
+        elapsed_ms = (time.perf_counter() - start) / args.repeat * 1000
+
+        print(f"{length:>8} | {legacy_tokens:>16} | " +
+              " | ".join(f"{size:>10}" for size in sizes) + f" | {summarized_tokens:>10} | {elapsed_ms:.3f}ms")
+
+if __name__ == "__main__":
+    main()
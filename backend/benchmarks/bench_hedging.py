@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+헤지 요청 꼬리 지연 벤치마크
+
+대부분은 빠르지만 가끔 아주 느린 응답이 섞이는 제공자에 토론 호출을 보내고,
+헤지 요청을 쓰지 않을 때와 쓸 때의 응답 시간(p50/p90/p99)과 추가 호출 비율을 비교합니다.
+느린 응답은 요청 내용과 무관하게 무작위로 생기므로, 같은 요청을 다시 보내면 대개 빨리 돌아옵니다.
+OpenAI 키 없이 실행됩니다.
+
+실행: cd backend && python benchmarks/bench_hedging.py --calls 600 --slow-ratio 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault("LLM_PROVIDER", "stub")
+
+from llm.base import LLMProvider, LLMRequest, LLMResponse, LLMUsage
+from llm.hedging import HedgingProvider
+from utils.latency import LatencyTracker
+
+class StragglerProvider(LLMProvider):
+    """응답 시간이 보통 latency ± jitter이고, slow_ratio 확률로 slow배 느려지는 제공자"""
+    name = "straggler"
+
+    def __init__(self, latency: float, jitter: float, slow_ratio: float, slow: float, seed: int):
+        self.latency = latency
+        self.jitter = jitter
+        self.slow_ratio = slow_ratio
+        self.slow = slow
+        self.rng = random.Random(seed)
+        self.calls = 0
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        delay = self.latency + self.rng.uniform(-self.jitter, self.jitter)
+        if self.rng.random() < self.slow_ratio:
+            delay *= self.slow
+        start = time.perf_counter()
+        await asyncio.sleep(delay)
+        return LLMResponse(text="1", usage=LLMUsage(500, 30), latency=time.perf_counter() - start, provider=self.name)
+
+async def run_load(provider, args) -> LatencyTracker:
+    tracker = LatencyTracker(window=args.calls)
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def call(i: int):
+        request = LLMRequest(
+            model="stub",
+            messages=[{"role": "user", "content": f"토론 {i}"}],
+            max_tokens=50,
+            metadata={"call_type": "discussion", "game_id": f"game{i % 20}"},
+        )
+        async with semaphore:
+            start = time.perf_counter()
+            await provider.complete(request)
+            tracker.record(time.perf_counter() - start)
+
+    await asyncio.gather(*[call(i) for i in range(args.calls)])
+    return tracker
+
+async def run(args):
+    print(f"호출 {args.calls}, 동시 {args.concurrency}, 응답 {args.latency_ms:.0f}±{args.jitter_ms:.0f}ms, "
+          f"느린 응답 {args.slow_ratio:.0%} (x{args.slow:.0f}), 헤지 p{args.percentile:.0f}, 예산 {args.budget:.0%}")
+    print(f"{'방식':<6} | {'p50':>8} | {'p90':>8} | {'p99':>8} | {'max':>8} | 추가 호출")
+    for name in ("헤지 없음", "헤지"):
+        inner = StragglerProvider(args.latency_ms / 1000, args.jitter_ms / 1000, args.slow_ratio, args.slow, args.seed)
+        provider = inner
+        if name == "헤지":
+            provider = HedgingProvider(inner, ["discussion"], args.percentile, args.budget, min_samples=20)
+        tracker = await run_load(provider, args)
+        extra = (inner.calls - args.calls) / args.calls
+        print(f"{name:<6} | {tracker.percentile(50) * 1000:>5.0f} ms | {tracker.percentile(90) * 1000:>5.0f} ms | "
+              f"{tracker.percentile(99) * 1000:>5.0f} ms | {max(tracker.samples) * 1000:>5.0f} ms | {extra:.1%}")
+        if name == "헤지":
+            metrics = provider.layer_metrics()
+            print(f"       헤지 비율 {metrics['hedge_rate']:.1%}, 헤지가 먼저 답한 수 {metrics['hedge_wins']}, "
+                  f"예산 부족으로 건너뜀 {metrics['skipped_budget']}, 헤지 시점 {metrics['hedge_after_ms']}")
+            print(f"       진 쪽 호출 사용량 {metrics['loser_tokens']} (취소해서 추정한 호출 {metrics['estimated_losers']})")
+
+def main():
+    parser = argparse.ArgumentParser(description="헤지 요청 꼬리 지연 벤치마크")
+    parser.add_argument("--calls", type=int, default=600, help="보낼 호출 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시에 보내는 호출 수")
+    parser.add_argument("--latency-ms", type=float, default=300, help="보통 응답 시간 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=100, help="보통 응답 시간 편차 (ms)")
+    parser.add_argument("--slow-ratio", type=float, default=0.05, help="느린 응답 비율")
+    parser.add_argument("--slow", type=float, default=10, help="느린 응답이 보통보다 느린 배수")
+    parser.add_argument("--percentile", type=float, default=90, help="헤지 요청을 보내는 응답 시간 백분위")
+    parser.add_argument("--budget", type=float, default=0.15, help="헤지 요청 수 상한 (호출 수 대비 비율)")
+    parser.add_argument("--seed", type=int, default=7, help="난수 시드")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
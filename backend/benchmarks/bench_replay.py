@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+LLM 호출 카세트 녹화/재생 게임 흐름 벤치마크
+
+게임 한 판(자기소개 -> 밤 -> 낮 토론 3턴 -> 투표)을 API로 진행하며 단계별 시간을 측정합니다.
+1) record: 스텁 제공자(또는 --provider openai)의 응답을 카세트 파일에 기록
+2) replay (지연 재현): 기록된 응답을 기록된 지연 시간만큼 기다렸다가 재생
+3) replay: 기록된 응답을 지연 없이 재생 (LLM을 뺀 서버 처리 시간)
+재생한 게임의 대화 기록이 녹화한 게임과 같은지도 확인합니다.
+
+실행: cd backend && python benchmarks/bench_replay.py --latency-ms 300
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.chdir(BACKEND_DIR)
+os.environ.setdefault("LLM_PROVIDER", "stub")
+
+import httpx
+from main import app
+from llm.cassette import CassetteProvider
+from llm.provider import create_provider, set_llm
+from llm.stub_provider import StubProvider
+
+async def play_game(seed: int) -> tuple:
+    """게임 한 판 진행 후 (단계별 시간(ms), 대화 기록) 반환"""
+    random.seed(seed)  # 역할 배정 등 게임 쪽 무작위도 고정
+    timings = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench/api", timeout=120) as client:
+        async def step(label: str, method: str, url: str, **kwargs):
+            start = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            timings[label] = timings.get(label, 0.0) + (time.perf_counter() - start) * 1000
+            return response.json()
+
+        game = await step("게임 시작", "POST", "/game/start", json={"player_name": "나"})
+        params = {"game_id": game["game_id"]}
+        await step("자기소개", "POST", "/game/ai-introduction-sequential", params=params)
+        await step("자기소개 완료", "POST", "/game/complete-introduction", params=params)
+        await step("밤 -> 낮 (next_phase)", "POST", "/game/next-phase", params=params)
+        for _ in range(3):
+            await step("토론 (3턴 합계)", "POST", "/game/ai-speak-first", params=params)
+            await step("낮 진행 (next_phase)", "POST", "/game/next-phase", params=params)
+        await step("AI 투표", "POST", "/game/ai-vote", params=params)
+        await step("투표 결과 (next_phase)", "POST", "/game/next-phase", params=params)
+
+        state = await client.get("/game/state", params=params)
+        transcript = [(msg["sender"], msg["content"]) for msg in state.json()["chat_history"]]
+        await client.delete("/game", params=params)
+    return timings, transcript
+
+async def run_with(provider, seed: int) -> tuple:
+    """주어진 제공자로 게임 한 판 진행 (디버그 출력 숨김)"""
+    set_llm(provider)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return await play_game(seed)
+    finally:
+        await provider.close()
+
+async def run(args):
+    path = Path(args.cassette or Path(tempfile.mkdtemp()) / "bench_replay.jsonl")
+    if path.exists():
+        path.unlink()
+
+    inner = (StubProvider(latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000)
+             if args.provider == "stub" else create_provider(args.provider))
+    recorder = CassetteProvider(str(path), "record", inner=inner)
+    results = {"record": await run_with(recorder, args.seed)}
+    print(f"카세트: {path} ({recorder.recorded}건 기록)")
+
+    for label, simulate in (("replay(지연 재현)", True), ("replay", False)):
+        player = CassetteProvider(str(path), "replay", simulate_latency=simulate)
+        results[label] = await run_with(player, args.seed)
+        print(f"{label}: 해시 일치 {player.replayed}건, 호출 순서로 재생 {player.stream_matches}건, 없는 요청 {player.misses}건")
+
+    labels = list(results["record"][0])
+    print(f"\n{'단계':<24}" + "".join(f"{name:>18}" for name in results))
+    for label in labels + ["합계"]:
+        row = [sum(t.values()) if label == "합계" else t.get(label, 0.0) for t, _ in results.values()]
+        print(f"{label:<24}" + "".join(f"{value:>15.1f} ms" for value in row))
+
+    recorded_transcript = results["record"][1]
+    for name, (_, transcript) in results.items():
+        if name != "record":
+            print(f"{name} 대화 기록 일치: {transcript == recorded_transcript}")
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 호출 카세트 녹화/재생 게임 흐름 벤치마크")
+    parser.add_argument("--provider", choices=["stub", "openai"], default="stub", help="녹화할 때 호출할 제공자")
+    parser.add_argument("--latency-ms", type=float, default=300, help="스텁 응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=200, help="스텁 응답 지연 편차 (ms)")
+    parser.add_argument("--cassette", help="카세트 파일 경로 (기본: 임시 파일)")
+    parser.add_argument("--seed", type=int, default=7, help="게임 무작위 시드")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
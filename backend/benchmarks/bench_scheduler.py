@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+LLM 호출 스케줄러 혼합 부하 벤치마크
+
+동시 호출 수가 제한된 상황에서 다음 부하를 함께 보내고, 사람이 기다리는 게임들의
+첫 AI 발언까지 걸린 시간(p50/p95)을 측정합니다.
+- 백그라운드: 여러 게임의 대화 요약 호출을 한꺼번에 대량으로 보냄
+- 바쁜 게임: 한 게임이 토론 호출을 한꺼번에 대량으로 보냄
+- 일반 게임: 일정 간격으로 도착해 토론 호출 하나를 보냄 (첫 AI 발언)
+비교 대상은 도착 순서대로 자리를 주는 세마포어(FIFO)입니다.
+OpenAI 키 없이 지연 시간을 설정한 스텁 제공자로 실행됩니다.
+
+실행: cd backend && python benchmarks/bench_scheduler.py --concurrency 8 --latency-ms 200
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault("LLM_PROVIDER", "stub")
+
+from llm.base import LLMRequest, ProviderLayer
+from llm.scheduler import PriorityScheduler
+from llm.stub_provider import StubProvider
+from utils.config import LLM_PRIORITY_WEIGHTS, SLO_FIRST_AI_MESSAGE_P95_MS
+from utils.latency import LatencyTracker
+
+class FifoLimiter(ProviderLayer):
+    """비교용: 도착 순서대로 자리를 주는 동시 호출 제한"""
+    name = "fifo"
+
+    def __init__(self, inner, max_concurrency: int):
+        super().__init__(inner)
+        self._slots = asyncio.Semaphore(max_concurrency)
+
+    async def complete(self, request):
+        async with self._slots:
+            return await self.inner.complete(request)
+
+def make_request(call_type: str, game_id: str, index: int) -> LLMRequest:
+    return LLMRequest(
+        model="stub",
+        messages=[{"role": "user", "content": f"{game_id} {call_type} {index}"}],
+        max_tokens=50,
+        metadata={"call_type": call_type, "game_id": game_id},
+    )
+
+async def run_load(provider, args) -> dict:
+    """혼합 부하를 보내고 호출 종류별 완료 시간 통계 반환"""
+    first_message = LatencyTracker(slo=SLO_FIRST_AI_MESSAGE_P95_MS / 1000)
+    background = LatencyTracker()
+    busy = LatencyTracker()
+
+    async def timed(tracker: LatencyTracker, request: LLMRequest):
+        start = time.perf_counter()
+        await provider.complete(request)
+        tracker.record(time.perf_counter() - start)
+
+    async def interactive_game(i: int):
+        await asyncio.sleep(i * args.arrival_ms / 1000)
+        await timed(first_message, make_request("discussion", f"game{i}", 0))
+
+    tasks = [
+        timed(background, make_request("summary", f"bg{g}", i))
+        for g in range(args.background_games) for i in range(args.burst)
+    ]
+    tasks += [timed(busy, make_request("discussion", "busy", i)) for i in range(args.burst)]
+    tasks += [interactive_game(i) for i in range(args.games)]
+
+    start = time.perf_counter()
+    await asyncio.gather(*tasks)
+    return {
+        "elapsed": time.perf_counter() - start,
+        "first_message": first_message.to_dict(),
+        "busy": busy.to_dict(),
+        "background": background.to_dict(),
+    }
+
+async def run(args):
+    stub = StubProvider(latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000)
+    setups = {
+        "FIFO": FifoLimiter(stub, args.concurrency),
+        "스케줄러": PriorityScheduler(stub, args.concurrency, LLM_PRIORITY_WEIGHTS),
+    }
+    print(f"동시 호출 {args.concurrency}, 응답 지연 {args.latency_ms:.0f}ms, "
+          f"백그라운드 {args.background_games}게임 x {args.burst}, 바쁜 게임 {args.burst}, 일반 게임 {args.games}")
+    print(f"{'방식':<8} | {'첫 AI 발언 p50':>14} | {'p95':>9} | {'SLO':>5} | {'바쁜 게임 p95':>12} | {'백그라운드 p95':>13} | 전체")
+    for name, provider in setups.items():
+        result = await run_load(provider, args)
+        first = result["first_message"]
+        print(f"{name:<8} | {first['p50_ms']:>11.0f} ms | {first['p95_ms']:>6.0f} ms | "
+              f"{'OK' if first['within_slo'] else 'X':>5} | {result['busy']['p95_ms']:>9.0f} ms | "
+              f"{result['background']['p95_ms']:>10.0f} ms | {result['elapsed']:.1f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 호출 스케줄러 혼합 부하 벤치마크")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 호출 수 상한")
+    parser.add_argument("--latency-ms", type=float, default=200, help="스텁 응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=100, help="스텁 응답 지연 편차 (ms)")
+    parser.add_argument("--background-games", type=int, default=4, help="요약 호출을 쏟아내는 게임 수")
+    parser.add_argument("--burst", type=int, default=40, help="백그라운드/바쁜 게임이 한꺼번에 보내는 호출 수")
+    parser.add_argument("--games", type=int, default=30, help="첫 AI 발언을 기다리는 일반 게임 수")
+    parser.add_argument("--arrival-ms", type=float, default=100, help="일반 게임 도착 간격 (ms)")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
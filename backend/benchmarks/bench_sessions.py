@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+게임 세션 레지스트리 벤치마크
+
+한 프로세스에서 N개의 게임을 동시에 생성/조회/진행/종료하며 처리량을 측정합니다.
+OpenAI를 호출하지 않는 경로(게임 시작, 상태 조회, 자기소개 채팅, 종료)만 사용합니다.
+
+실행: cd backend && python benchmarks/bench_sessions.py --sessions 500
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.chdir(BACKEND_DIR)
+os.environ.setdefault("LLM_PROVIDER", "stub")
+os.environ.setdefault("ADMISSION_MAX_ACTIVE_GAMES", "0")  # 동시 게임 수 자체를 재므로 입장 제한 없음
+
+import httpx
+from main import app
+from models.game_session import game_registry
+
+def report(label: str, count: int, elapsed: float):
+    """측정 결과 출력"""
+    print(f"{label:<24} {count:>6}건  {elapsed * 1000:>9.1f} ms  {count / elapsed:>10.0f} req/s")
+
+async def run(sessions: int, messages: int):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench/api") as client:
+        # 1. 게임 동시 생성
+        start = time.perf_counter()
+        responses = await asyncio.gather(*[
+            client.post("/game/start", json={"player_name": f"사람{i}"})
+            for i in range(sessions)
+        ])
+        report("게임 시작", sessions, time.perf_counter() - start)
+        game_ids = [r.json()["game_id"] for r in responses]
+        assert len(set(game_ids)) == sessions
+        assert len(game_registry) >= sessions
+
+        # 2. 게임별 채팅 (세션 격리 확인 포함)
+        start = time.perf_counter()
+        await asyncio.gather(*[
+            client.post("/chat", params={"game_id": game_id}, json={
+                "sender": f"사람{i}",
+                "content": f"안녕하세요 {j}",
+                "timestamp": "2024-01-01T00:00:00"
+            })
+            for i, game_id in enumerate(game_ids)
+            for j in range(messages)
+        ])
+        report("채팅", sessions * messages, time.perf_counter() - start)
+
+        # 3. 상태 조회
+        start = time.perf_counter()
+        states = await asyncio.gather(*[
+            client.get("/game/state", params={"game_id": game_id})
+            for game_id in game_ids
+        ])
+        report("상태 조회", sessions, time.perf_counter() - start)
+        for i, state in enumerate(states):
+            senders = {msg["sender"] for msg in state.json()["chat_history"]}
+            assert senders <= {"moderator", f"사람{i}"}, "다른 게임의 메시지가 섞였습니다"
+
+        # 4. 레지스트리 직접 조회 (O(1) 확인)
+        lookups = sessions * 1000
+        start = time.perf_counter()
+        for k in range(lookups):
+            game_registry.get(game_ids[k % sessions])
+        report("레지스트리 조회", lookups, time.perf_counter() - start)
+
+        # 5. 게임 종료
+        start = time.perf_counter()
+        await asyncio.gather(*[
+            client.delete("/game", params={"game_id": game_id})
+            for game_id in game_ids
+        ])
+        report("게임 종료", sessions, time.perf_counter() - start)
+        print(f"남은 세션 수: {len(game_registry)}")
+
+def main():
+    parser = argparse.ArgumentParser(description="게임 세션 레지스트리 벤치마크")
+    parser.add_argument("--sessions", type=int, default=500, help="동시 게임 수")
+    parser.add_argument("--messages", type=int, default=5, help="게임당 채팅 메시지 수")
+    args = parser.parse_args()
+    asyncio.run(run(args.sessions, args.messages))
+
+if __name__ == "__main__":
+    main()
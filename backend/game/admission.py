@@ -0,0 +1,170 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Set, Tuple
+from llm.provider import get_llm
+from utils.config import (
+    ADMISSION_MAX_ACTIVE_GAMES, ADMISSION_MODE, ADMISSION_QUEUE_SIZE, ADMISSION_QUEUE_TIMEOUT,
+    ADMISSION_NEW_GAME_MAX_LLM_QUEUE, ADMISSION_MAX_LLM_QUEUE
+)
+
+# 입장 거절 (retry_after초 뒤 다시 시도하라는 의미)
+class AdmissionRejected(Exception):
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = max(1, math.ceil(retry_after))
+
+# 게임 입장 제어
+# 새 게임은 진행 중인 게임 수와 밀려 있는 LLM 호출 수가 여유 있을 때만 받고, 여유가 없으면
+# 대기열(FIFO)에서 기다리게 하거나(queue) 바로 거절(reject)함.
+# 진행 중인 게임의 AI 요청은 새 게임보다 훨씬 큰 LLM 대기열까지 받아 주므로,
+# 과부하가 오면 새 게임부터 막히고 이미 시작한 게임은 계속 응답함
+class AdmissionController:
+    POLL_INTERVAL = 0.25  # 대기열이 있을 때 LLM 대기열이 줄었는지 다시 확인하는 간격(초)
+
+    def __init__(self, max_active_games: int, mode: str, queue_size: int, queue_timeout: float,
+                 new_game_max_llm_queue: int, max_llm_queue: int):
+        self.max_active_games = max_active_games
+        self.mode = mode
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.new_game_max_llm_queue = new_game_max_llm_queue
+        self.max_llm_queue = max_llm_queue
+        self._active: Set[str] = set()
+        self._waiters: Deque[Tuple[asyncio.Future, str]] = deque()
+        self._pump: Optional[asyncio.Task] = None
+        self._last_release: Optional[float] = None
+        self.release_interval = 0.0  # 게임 자리가 나는 간격의 이동 평균(초), 대기 시간 추정에 사용
+        self.admitted = 0
+        self.queued = 0  # 대기열을 거쳐 들어오려 한 게임 수
+        self.rejected = 0  # 대기열이 없거나 가득 차서 바로 거절한 게임 수
+        self.timeouts = 0  # 대기열에서 기다리다 시간이 초과된 게임 수
+        self.shed = 0  # LLM 대기열이 가득 차서 거절한 진행 중인 게임의 AI 요청 수
+
+    def _games_full(self) -> bool:
+        return self.max_active_games > 0 and len(self._active) >= self.max_active_games
+
+    def _llm_queue_over(self, limit: int) -> bool:
+        return limit > 0 and get_llm().backlog().queued > limit
+
+    def _has_capacity(self) -> bool:
+        return not self._games_full() and not self._llm_queue_over(self.new_game_max_llm_queue)
+
+    def estimated_wait(self, position: int = None) -> float:
+        """대기열 position번째(기본: 맨 뒤에 새로 서는) 게임이 들어가기까지 예상 시간(초)"""
+        if position is None:
+            position = len(self._waiters) + 1
+        game_wait = 0.0
+        if self._games_full():
+            # 아직 끝난 게임이 없어 간격을 모르면 대기열 최대 대기 시간으로 추정
+            game_wait = position * self.release_interval if self.release_interval else self.queue_timeout
+        return max(game_wait, get_llm().backlog().estimated_wait)
+
+    def _admit(self, game_id: str):
+        self._active.add(game_id)
+        self.admitted += 1
+
+    async def admit_game(self, game_id: str):
+        """새 게임 입장 (자리가 없으면 대기열에서 기다리거나 AdmissionRejected)
+
+        이미 자리를 가진 game_id로 다시 시작하면 진행 중인 게임 수가 늘지 않으므로 그 자리를 그대로 넘겨받음
+        """
+        if game_id in self._active:
+            self.admitted += 1
+            return
+        if not self._waiters and self._has_capacity():
+            self._admit(game_id)
+            return
+        if self.mode != "queue" or len(self._waiters) >= self.queue_size:
+            self.rejected += 1
+            raise AdmissionRejected("서버가 혼잡해 새 게임을 시작할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+                                    self.estimated_wait())
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (future, game_id)
+        self._waiters.append(entry)
+        self.queued += 1
+        print(f"⏳ 새 게임 대기열 진입: {game_id} ({len(self._waiters)}번째)")
+        if self._pump is None or self._pump.done():
+            self._pump = asyncio.create_task(self._drain(), name="game-admission")
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.queue_timeout)
+        except asyncio.TimeoutError:
+            if future.done():
+                return  # 시간 초과와 같은 순간에 자리를 받음
+            future.cancel()
+            self._waiters.remove(entry)
+            self.timeouts += 1
+            raise AdmissionRejected("대기 시간이 초과되었습니다. 잠시 후 다시 시도해 주세요.",
+                                    self.estimated_wait())
+        except asyncio.CancelledError:
+            if future.done():
+                self.release(game_id)  # 자리를 받은 직후 요청이 취소됨
+            else:
+                future.cancel()
+                self._waiters.remove(entry)
+            raise
+
+    def _wake(self):
+        """자리가 있는 만큼 대기열 앞에서부터 입장시킴"""
+        while self._waiters and self._has_capacity():
+            future, game_id = self._waiters.popleft()
+            if future.done():
+                continue
+            self._admit(game_id)
+            future.set_result(None)
+
+    async def _drain(self):
+        """대기열이 빌 때까지 주기적으로 입장 확인 (LLM 대기열은 게임 종료 없이도 줄어듦)"""
+        while self._waiters:
+            self._wake()
+            await asyncio.sleep(self.POLL_INTERVAL)
+
+    def release(self, game_id: str):
+        """게임 종료 시 자리 반납 (이미 반납했으면 무시)"""
+        if game_id not in self._active:
+            return
+        self._active.discard(game_id)
+        now = time.monotonic()
+        if self._last_release is not None:
+            interval = now - self._last_release
+            self.release_interval = interval if not self.release_interval else 0.8 * self.release_interval + 0.2 * interval
+        self._last_release = now
+        self._wake()
+
+    def check_llm_call(self):
+        """진행 중인 게임의 AI 요청 입장 확인 (LLM 대기열이 한도를 넘으면 기다리게 하지 않고 AdmissionRejected)"""
+        backlog = get_llm().backlog()
+        if self.max_llm_queue > 0 and backlog.queued > self.max_llm_queue:
+            self.shed += 1
+            raise AdmissionRejected("AI 응답 대기열이 가득 찼습니다. 잠시 후 다시 시도해 주세요.",
+                                    backlog.estimated_wait)
+
+    def get_status(self) -> Dict[str, Any]:
+        backlog = get_llm().backlog()
+        return {
+            "mode": self.mode,
+            "active_games": len(self._active),
+            "max_active_games": self.max_active_games,
+            "queued_games": len(self._waiters),
+            "estimated_wait_s": round(self.estimated_wait(), 1),
+            "llm_queued_calls": backlog.queued,
+            "llm_estimated_wait_s": round(backlog.estimated_wait, 1),
+            "admitted": self.admitted,
+            "queued_total": self.queued,
+            "rejected": self.rejected,
+            "queue_timeouts": self.timeouts,
+            "shed_llm_requests": self.shed,
+        }
+
+# 전역 입장 제어 인스턴스
+admission = AdmissionController(
+    max_active_games=ADMISSION_MAX_ACTIVE_GAMES,
+    mode=ADMISSION_MODE,
+    queue_size=ADMISSION_QUEUE_SIZE,
+    queue_timeout=ADMISSION_QUEUE_TIMEOUT,
+    new_game_max_llm_queue=ADMISSION_NEW_GAME_MAX_LLM_QUEUE,
+    max_llm_queue=ADMISSION_MAX_LLM_QUEUE,
+)
@@ -0,0 +1,63 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+# 게임 하나의 상태 변경을 한 번에 하나씩 처리하는 액터
+# (작업 태스크 + 명령 큐. 서로 다른 게임은 같은 이벤트 루프에서 병렬로 진행됨)
+class GameActor:
+    def __init__(self, game_id: str):
+        self.game_id = game_id
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: asyncio.Task = None
+        self.processed = 0  # 처리한 명령 수
+
+    def _ensure_started(self):
+        """첫 명령이 들어올 때 작업 태스크 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"game-actor-{self.game_id}")
+
+    def send(self, handler: Callable[..., Awaitable[Any]], *args, **kwargs) -> asyncio.Future:
+        """명령을 큐에 넣고 결과 future 반환 (기다리지 않음)"""
+        future = asyncio.get_running_loop().create_future()
+        self._ensure_started()
+        self._queue.put_nowait((handler, args, kwargs, future))
+        return future
+
+    async def call(self, handler: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """명령을 큐에 넣고 처리 결과를 기다림
+
+        요청이 중간에 끊겨도 이미 넣은 명령은 끝까지 처리됨
+        """
+        return await asyncio.shield(self.send(handler, *args, **kwargs))
+
+    @property
+    def pending(self) -> int:
+        """대기 중인 명령 수"""
+        return self._queue.qsize()
+
+    async def _run(self):
+        """명령 처리 루프"""
+        while True:
+            handler, args, kwargs, future = await self._queue.get()
+            try:
+                result = await handler(*args, **kwargs)
+                if not future.done():
+                    future.set_result(result)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            except Exception as e:
+                print(f"게임 액터 오류 ({self.game_id}): {e}")
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self.processed += 1
+
+    def close(self):
+        """작업 태스크 종료 및 대기 중인 명령 취소"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        while not self._queue.empty():
+            _, _, _, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
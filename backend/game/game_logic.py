@@ -1,33 +1,64 @@
-import asyncio
 import random
 from datetime import datetime
-from models.game_state import game_state
+from models.game_state import GameState
 from game.moderator import moderator
 from game.winner_check import check_winner, check_game_end_conditions
-from agents.ai_agent import AIAgent
+from game.phase_scheduler import phase_scheduler
+from game.admission import admission
+from agents.ai_agent import phase_deadline
+from utils.config import DAY_TURN_ADVANCE_DELAY, VOTING_RESOLUTION_DELAY
+
+def finish_game(game_state: GameState):
+    """게임 종료 처리 (입장 자리 반납, 에이전트 풀 해제, 대화 요약 중단)"""
+    game_state.phase = "gameOver"
+    admission.release(game_state.game_id)
+    if game_state.agents is not None:
+        game_state.agents.release()
+    if game_state.summarizer is not None:
+        game_state.summarizer.close()
 
 # 자동 진행 관리
-async def check_and_auto_progress():
+def schedule_next_phase(game_state: GameState, delay: float) -> dict:
+    """delay초 뒤 다음 페이즈로 진행하도록 예약 (요청은 기다리지 않음)"""
+    phase_scheduler.schedule(
+        game_state.game_id, delay, scheduled_next_phase,
+        game_state.phase, game_state.turn, key="next_phase"
+    )
+    print(f"DEBUG: {delay}초 후 자동 진행 예약 - 페이즈: {game_state.phase}, 턴: {game_state.turn}")
+    return {
+        "success": True,
+        "scheduled": True,
+        "delay": delay,
+        "phase": game_state.phase,
+        "turn": game_state.turn
+    }
+
+async def scheduled_next_phase(game_state: GameState, expected_phase: str, expected_turn: int):
+    """예약된 페이즈 진행 (예약 이후 페이즈나 턴이 바뀌었으면 건너뜀)"""
+    if game_state.phase != expected_phase or game_state.turn != expected_turn:
+        print(f"DEBUG: 예약된 자동 진행 건너뜀 - 이미 {game_state.phase} {game_state.turn}턴")
+        return None
+    return await next_phase_internal(game_state)
+
+async def check_and_auto_progress(game_state: GameState):
     """자동 진행 조건 체크 및 실행"""
     auto_progress_result = None
     
     # 밤 페이즈: 즉시 자동으로 낮으로 진행 (첫 밤은 AI가 자동으로 행동)
     if game_state.phase == "night":
-        auto_progress_result = await next_phase_internal()
+        auto_progress_result = await next_phase_internal(game_state)
     
-    # 낮 페이즈: 사용자가 메시지를 보낸 후 2초 뒤 자동으로 다음 턴으로
+    # 낮 페이즈: 사용자가 메시지를 보낸 후 잠시 뒤 자동으로 다음 턴으로
     elif game_state.phase == "day":
-        await asyncio.sleep(2)  # 2초 대기
-        auto_progress_result = await next_phase_internal()
+        auto_progress_result = schedule_next_phase(game_state, DAY_TURN_ADVANCE_DELAY)
     
-    # 투표 페이즈: 5초 후 자동으로 결과 처리
+    # 투표 페이즈: 잠시 뒤 자동으로 결과 처리
     elif game_state.phase == "voting":
-        await asyncio.sleep(5)  # 5초 대기
-        auto_progress_result = await next_phase_internal()
+        auto_progress_result = schedule_next_phase(game_state, VOTING_RESOLUTION_DELAY)
     
     return auto_progress_result
 
-async def next_phase_internal():
+async def next_phase_internal(game_state: GameState):
     """내부 페이즈 진행 로직"""
     print(f"DEBUG: next_phase_internal 호출됨 - 현재 페이즈: {game_state.phase}")
     
@@ -46,8 +77,8 @@ async def next_phase_internal():
             mafia = mafia_players[0]  # 첫 번째 마피아
             print(f"DEBUG: 마피아 플레이어 발견: {mafia}")
             
-            # AI 마피아 에이전트 생성
-            agent = AIAgent(mafia, "mafia")
+            # AI 마피아 에이전트 (게임 에이전트 풀에서 재사용)
+            agent = game_state.agents.get(mafia)
             
             # 살아있는 AI 플레이어들만 타겟으로 선택 (마피아 자신과 사람 플레이어 제외)
             alive_targets = [p for p in game_state.players 
@@ -56,8 +87,8 @@ async def next_phase_internal():
             print(f"DEBUG: 살아있는 AI 타겟들: {alive_targets}")
             
             if alive_targets:
-                # AI 마피아가 지능적으로 타겟 선택
-                target = await agent.get_night_action(alive_targets)
+                # AI 마피아가 지능적으로 타겟 선택 (마감 시간이 지나면 휴리스틱으로 선택)
+                target = await agent.get_night_action(alive_targets, phase_deadline("night"))
                 
                 print(f"DEBUG: 마피아 {mafia}가 {target}를 선택했습니다.")
                 
@@ -91,9 +122,9 @@ async def next_phase_internal():
                         print(f"DEBUG: 첫 번째 사망 메시지 추가됨")
                     
                     # 게임 종료 조건 체크
-                    game_end_result = check_game_end_conditions()
+                    game_end_result = check_game_end_conditions(game_state)
                     if game_end_result["game_ended"]:
-                        game_state.phase = "gameOver"
+                        finish_game(game_state)
                         game_result = moderator.announce_game_result(game_end_result["winner"], game_end_result["reason"])
                         game_state.chat_history.append({
                             "sender": "moderator",
@@ -108,8 +139,7 @@ async def next_phase_internal():
                             "announcement": game_result
                         }
                     
-                    # 사망 후 낮 페이즈 설명 추가 (1초 지연)
-                    await asyncio.sleep(1)
+                    # 사망 후 낮 페이즈 설명 추가
                     day_after_death_message = moderator.announce_day_after_death()
                     game_state.chat_history.append({
                         "sender": "moderator",
@@ -122,8 +152,7 @@ async def next_phase_internal():
         
         # 밤에서 낮으로 전환 (AI 마피아가 행동하지 않았어도)
         game_state.phase = "day"
-        # 1초 지연 후 낮 페이즈 공지
-        await asyncio.sleep(1)
+        # 낮 페이즈 공지
         day_announcement = moderator.announce_phase("day", game_state.turn)
         game_state.chat_history.append({
             "sender": "moderator",
@@ -139,8 +168,7 @@ async def next_phase_internal():
             game_state.turn += 1
             print(f"DEBUG: 턴 증가 - 새로운 턴: {game_state.turn}")
             
-            # 1초 지연 후 턴 공지
-            await asyncio.sleep(1)
+            # 턴 공지
             day_announcement = moderator.announce_phase("day", game_state.turn)
             game_state.chat_history.append({
                 "sender": "moderator",
@@ -153,8 +181,8 @@ async def next_phase_internal():
         else:
             print(f"DEBUG: 3턴 완료 - 투표 페이즈로 전환")
             game_state.phase = "voting"
-            # 1초 지연 후 투표 페이즈 공지
-            await asyncio.sleep(1)
+            game_state.vote_context = None  # 새 투표 페이즈의 컨텍스트는 처음 투표할 때 생성
+            # 투표 페이즈 공지
             voting_announcement = moderator.announce_phase("voting")
             game_state.chat_history.append({
                 "sender": "moderator",
@@ -194,7 +222,7 @@ async def next_phase_internal():
                     })
                     
                     # 게임 종료
-                    game_state.phase = "gameOver"
+                    finish_game(game_state)
                     return {
                         "success": True,
                         "phase": game_state.phase,
@@ -218,9 +246,9 @@ async def next_phase_internal():
                     print(f"DEBUG: 투표 사망 메시지가 채팅 히스토리에 추가됨: {game_state.chat_history[-1]}")
                 
                 # 게임 종료 조건 체크
-                game_end_result = check_game_end_conditions()
+                game_end_result = check_game_end_conditions(game_state)
                 if game_end_result["game_ended"]:
-                    game_state.phase = "gameOver"
+                    finish_game(game_state)
                     game_result = moderator.announce_game_result(game_end_result["winner"], game_end_result["reason"])
                     game_state.chat_history.append({
                         "sender": "moderator",
@@ -240,8 +268,7 @@ async def next_phase_internal():
         game_state.votes = {}
         game_state.phase = "night"
         game_state.turn = 1
-        # 1초 지연 후 밤 페이즈 공지
-        await asyncio.sleep(2)
+        # 밤 페이즈 공지
         night_announcement = moderator.announce_phase("night")
         game_state.chat_history.append({
             "sender": "moderator",
@@ -0,0 +1,122 @@
+import asyncio
+import heapq
+import itertools
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# 예약된 작업 하나
+class ScheduledTimer:
+    def __init__(self, deadline: float, game_id: str, key: Optional[str],
+                 handler: Callable[..., Awaitable[Any]], args: tuple):
+        self.deadline = deadline
+        self.game_id = game_id
+        self.key = key
+        self.handler = handler
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """예약 취소 (힙에서는 실행 시점에 건너뜀)"""
+        self.cancelled = True
+
+# 마감 시각 힙 기반 페이즈 스케줄러
+# 모든 게임의 타이머를 하나의 힙에 두고, 가장 이른 마감 시각에만 loop.call_at 핸들을 걸어 둠.
+# 마감이 되면 해당 게임 액터에 명령을 넣으므로 요청 핸들러는 기다리지 않고 바로 응답함
+class PhaseScheduler:
+    def __init__(self):
+        self._heap = []  # (deadline, seq, timer)
+        self._seq = itertools.count()
+        self._keyed: Dict[tuple, ScheduledTimer] = {}  # (game_id, key) -> 타이머
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._armed_at: Optional[float] = None
+        self.fired = 0  # 실행된 타이머 수
+
+    def schedule(self, game_id: str, delay: float, handler: Callable[..., Awaitable[Any]],
+                 *args, key: str = None) -> ScheduledTimer:
+        """delay초 뒤 게임 액터에서 handler(game_state, *args) 실행 예약
+
+        같은 key로 다시 예약하면 이전 예약은 취소됨
+        """
+        loop = asyncio.get_running_loop()
+        if key is not None:
+            previous = self._keyed.pop((game_id, key), None)
+            if previous:
+                previous.cancel()
+        timer = ScheduledTimer(loop.time() + delay, game_id, key, handler, args)
+        if key is not None:
+            self._keyed[(game_id, key)] = timer
+        heapq.heappush(self._heap, (timer.deadline, next(self._seq), timer))
+        self._arm(loop)
+        return timer
+
+    def cancel_game(self, game_id: str):
+        """게임의 모든 예약 취소 (취소된 항목은 힙에서 바로 제거)"""
+        for _, _, timer in self._heap:
+            if timer.game_id == game_id:
+                timer.cancel()
+        self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+        heapq.heapify(self._heap)
+        for game_key in [k for k in self._keyed if k[0] == game_id]:
+            del self._keyed[game_key]
+
+    @property
+    def pending(self) -> int:
+        """대기 중인 예약 수"""
+        return sum(1 for _, _, timer in self._heap if not timer.cancelled)
+
+    def _arm(self, loop: asyncio.AbstractEventLoop):
+        """가장 이른 마감 시각에 깨어나도록 핸들 설정"""
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            if self._handle:
+                self._handle.cancel()
+                self._handle = None
+            return
+        deadline = self._heap[0][0]
+        if self._handle and self._armed_at <= deadline:
+            return
+        if self._handle:
+            self._handle.cancel()
+        self._handle = loop.call_at(deadline, self._on_timer)
+        self._armed_at = deadline
+
+    def _on_timer(self):
+        """마감된 타이머 실행"""
+        loop = asyncio.get_running_loop()
+        self._handle = None
+        now = loop.time()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, timer = heapq.heappop(self._heap)
+            if timer.cancelled:
+                continue
+            if timer.key is not None:
+                self._keyed.pop((timer.game_id, timer.key), None)
+            self._fire(timer)
+        self._arm(loop)
+
+    def _fire(self, timer: ScheduledTimer):
+        """게임 액터에 예약 명령 전달"""
+        from models.game_session import game_registry
+
+        session = game_registry.get(timer.game_id)
+        if session is None:
+            return
+        self.fired += 1
+        future = session.actor.send(timer.handler, session.state, *timer.args)
+        future.add_done_callback(self._log_failure)
+
+    @staticmethod
+    def _log_failure(future: asyncio.Future):
+        if not future.cancelled() and future.exception():
+            print(f"예약 작업 오류: {future.exception()}")
+
+    def shutdown(self):
+        """모든 예약 취소 (서버 종료 시)"""
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+        self._heap.clear()
+        self._keyed.clear()
+
+# 전역 페이즈 스케줄러 인스턴스
+phase_scheduler = PhaseScheduler()
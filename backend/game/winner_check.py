@@ -1,6 +1,6 @@
-from models.game_state import game_state
+from models.game_state import GameState
 
-def check_winner():
+def check_winner(game_state: GameState):
     """승리 조건 체크"""
     alive_players = [p for p in game_state.players if p not in game_state.eliminated]
     alive_mafia = [p for p in alive_players if p in game_state.roles and game_state.roles[p] == "mafia"]
@@ -24,7 +24,7 @@ def check_winner():
     
     return None
 
-def check_game_end_conditions():
+def check_game_end_conditions(game_state: GameState):
     """게임 종료 조건 체크 (상세한 정보 포함)"""
     alive_players = [p for p in game_state.players if p not in game_state.eliminated]
     alive_mafia = [p for p in alive_players if p in game_state.roles and game_state.roles[p] == "mafia"]
@@ -0,0 +1,139 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# LLM 호출 요청 (제공자와 무관한 형식)
+@dataclass
+class LLMRequest:
+    model: str
+    messages: List[Dict[str, str]]
+    max_tokens: int
+    temperature: float = 0.7
+    params: Dict[str, Any] = field(default_factory=dict)  # logit_bias, response_format 등 추가 파라미터
+    metadata: Dict[str, Any] = field(default_factory=dict)  # game_id, call_type 등 (제공자에게 보내지 않음)
+
+    @property
+    def call_type(self) -> str:
+        return self.metadata.get("call_type", "unknown")
+
+    def fingerprint(self) -> str:
+        """제공자에게 보내는 내용(모델, 메시지, 샘플링 파라미터)의 정규화된 해시
+
+        metadata는 포함하지 않으므로 게임/플레이어가 달라도 보내는 내용이 같으면 같은 값
+        """
+        payload = json.dumps(
+            [
+                self.model,
+                [[msg["role"], msg["content"]] for msg in self.messages],
+                self.max_tokens,
+                round(self.temperature, 3),
+                self.params,
+            ],
+            ensure_ascii=False, sort_keys=True, separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+# 토큰 사용량
+@dataclass
+class LLMUsage:
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0  # 제공자의 프롬프트 접두사 캐시에서 읽은 입력 토큰 (input_tokens에 포함)
+
+# LLM 호출 응답
+@dataclass
+class LLMResponse:
+    text: str
+    usage: Optional[LLMUsage] = None
+    latency: float = 0.0  # 초
+    provider: str = ""
+    from_cache: bool = False  # 응답 캐시에서 돌려준 응답 (usage는 처음 호출했을 때의 사용량, 비용 없음)
+    coalesced: bool = False  # 같은 요청의 진행 중인 호출 결과를 함께 받은 응답 (비용 없음)
+    extra_usage: Optional[LLMUsage] = None  # 이 응답을 얻으려고 함께 보낸 다른 호출(진 헤지 요청 등)의 사용량 (비용에 포함)
+
+    @property
+    def reused(self) -> bool:
+        """이 응답을 위해 API를 따로 호출하지 않았는지"""
+        return self.from_cache or self.coalesced
+
+# 제공자 앞에 밀려 있는 호출 (입장 제어가 과부하 여부와 예상 대기 시간을 판단하는 데 사용)
+@dataclass
+class LLMBacklog:
+    queued: int = 0  # 자리/속도 제한/연결을 기다리는 호출 수
+    estimated_wait: float = 0.0  # 지금 보내는 interactive 호출이 실제로 나가기까지 예상 대기 시간(초)
+
+# LLM 제공자 인터페이스
+# 구현체는 complete()로 요청 하나를 처리하고, get_metrics()로 호출 통계를 제공함
+class LLMProvider:
+    name = "base"
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        """요청 하나를 처리해 응답 반환 (실패하면 예외)"""
+        raise NotImplementedError
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """호출 통계"""
+        return {"provider": self.name}
+
+    def backlog(self) -> LLMBacklog:
+        """밀려 있는 호출 수와 예상 대기 시간"""
+        return LLMBacklog()
+
+    async def start(self):
+        """서버 시작 시 준비 작업 (연결 미리 맺기 등)"""
+        return None
+
+    async def close(self):
+        """제공자가 가진 자원 정리"""
+        return None
+
+# 다른 제공자를 감싸는 계층 (캐시, 중복 호출 제거 등)
+# 기본 동작은 감싼 제공자에 그대로 위임하며, 통계에는 감싼 제공자의 통계를 inner로 붙임
+class ProviderLayer(LLMProvider):
+    name = "layer"
+
+    def __init__(self, inner: LLMProvider):
+        self.inner = inner
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        return await self.inner.complete(request)
+
+    def layer_metrics(self) -> Dict[str, Any]:
+        """이 계층의 통계"""
+        return {}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {"provider": self.name, **self.layer_metrics(), "inner": self.inner.get_metrics()}
+
+    def backlog(self) -> LLMBacklog:
+        return self.inner.backlog()
+
+    async def start(self):
+        await self.inner.start()
+
+    async def close(self):
+        await self.inner.close()
+
+# 제공자 호출 통계 (호출 수, 오류 수, 지연 시간)
+class ProviderMetrics:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def record(self, latency: float, error: bool = False):
+        self.calls += 1
+        if error:
+            self.errors += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_latency_ms": round(self.total_latency / self.calls * 1000, 1) if self.calls else 0.0,
+            "max_latency_ms": round(self.max_latency * 1000, 1),
+        }
@@ -0,0 +1,87 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from llm.base import LLMProvider, LLMRequest, LLMResponse, ProviderLayer
+
+# 완성 응답 캐시 (LRU + TTL)
+# 모델/메시지/샘플링 파라미터가 완전히 같은 요청은 제공자를 다시 호출하지 않고 저장된 응답을 돌려줌.
+# 샘플링 온도가 max_temperature보다 높은 요청은 매번 다른 응답을 기대하므로 캐시하지 않음
+class CachingProvider(ProviderLayer):
+    name = "cache"
+
+    def __init__(self, inner: LLMProvider, max_entries: int = 1024, ttl: float = 600.0,
+                 max_temperature: float = 0.0):
+        """
+        inner: 캐시에 없을 때 호출할 제공자
+        max_entries: 저장할 최대 응답 수 (넘으면 가장 오래 쓰지 않은 응답부터 제거)
+        ttl: 응답 유효 시간(초)
+        max_temperature: 이 온도 이하의 요청만 캐시
+        """
+        super().__init__(inner)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_temperature = max_temperature
+        self._entries: "OrderedDict[str, Tuple[float, LLMResponse]]" = OrderedDict()  # 키 -> (만료 시각, 응답)
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0  # 온도가 높아 캐시하지 않은 요청
+        self.evictions = 0
+        self.expirations = 0
+
+    def _lookup(self, key: str) -> Optional[LLMResponse]:
+        """유효한 캐시 응답 반환 (만료된 응답은 제거)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def _store(self, key: str, response: LLMResponse):
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        if request.temperature > self.max_temperature:
+            self.bypassed += 1
+            return await self.inner.complete(request)
+
+        key = request.fingerprint()
+        response = self._lookup(key)
+        if response is not None:
+            self.hits += 1
+            return LLMResponse(
+                text=response.text,
+                usage=response.usage,
+                latency=0.0,
+                provider=self.name,
+                from_cache=True,
+            )
+
+        self.misses += 1
+        response = await self.inner.complete(request)
+        self._store(key, response)
+        return response
+
+    def layer_metrics(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "bypassed": self.bypassed,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+        }
+
+    async def close(self):
+        self._entries.clear()
+        await self.inner.close()
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from llm.base import LLMBacklog, LLMProvider, LLMRequest, LLMResponse, LLMUsage
+
+# LLM 호출 녹화/재생 카세트
+# record: 실제 제공자의 응답을 요청 해시와 함께 JSONL 파일에 한 줄씩 기록
+# replay: 기록된 응답을 디스크에서 돌려줌 (제공자를 호출하지 않음)
+#   1) 같은 해시의 기록을 기록된 순서대로 사용 (다 쓰면 마지막 응답 반복)
+#   2) 해시가 없으면 같은 호출 종류/플레이어의 다음 미사용 기록을 사용
+#      (백그라운드 대화 요약이 끝나는 시점처럼 지연 시간에 따라 프롬프트가 조금 달라지는 경우)
+#   3) 둘 다 없으면 CassetteMiss
+class CassetteMiss(LookupError):
+    """재생할 기록이 없는 요청"""
+
+class CassetteProvider(LLMProvider):
+    MODES = ("record", "replay")
+
+    def __init__(self, path: str, mode: str, inner: Optional[LLMProvider] = None,
+                 simulate_latency: bool = False):
+        """
+        path: 카세트 파일 (JSONL)
+        mode: "record" 또는 "replay"
+        inner: 녹화할 때 실제로 호출할 제공자 (replay에서는 사용하지 않음)
+        simulate_latency: replay에서 기록된 지연 시간만큼 기다렸다가 응답
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"알 수 없는 카세트 모드: {mode}")
+        if mode == "record" and inner is None:
+            raise ValueError("record 모드에는 실제 제공자가 필요합니다")
+        self.path = Path(path)
+        self.mode = mode
+        self.inner = inner
+        self.simulate_latency = simulate_latency
+        self.name = f"cassette-{mode}({inner.name})" if inner is not None and mode == "record" else f"cassette-{mode}"
+        self._entries: List[Dict[str, Any]] = []
+        self._by_key: Dict[str, List[int]] = defaultdict(list)  # 요청 해시 -> 기록 번호들
+        self._by_stream: Dict[tuple, List[int]] = defaultdict(list)  # (호출 종류, 플레이어) -> 기록 번호들
+        self._used = set()
+        self._file = None
+        self.recorded = 0
+        self.replayed = 0
+        self.stream_matches = 0  # 해시는 다르지만 호출 순서로 재생한 수
+        self.misses = 0
+
+        if mode == "replay":
+            self._load()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # 기존 카세트에 이어서 기록
+            self._file = self.path.open("a", encoding="utf-8")
+
+    def _load(self):
+        """카세트 파일을 요청 해시별로 읽어 둠"""
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    index = len(self._entries)
+                    self._entries.append(entry)
+                    self._by_key[entry["key"]].append(index)
+                    self._by_stream[(entry["call_type"], entry.get("player"))].append(index)
+        print(f"📼 카세트 로드 - {self.path} ({len(self._entries)}건)")
+
+    @staticmethod
+    def _stream(request: LLMRequest) -> tuple:
+        return request.call_type, request.metadata.get("player")
+
+    def _next_unused(self, indices: List[int]) -> Optional[int]:
+        for index in indices:
+            if index not in self._used:
+                return index
+        return None
+
+    def _find(self, key: str, request: LLMRequest) -> Optional[Dict[str, Any]]:
+        """요청에 맞는 기록 찾기 (해시 -> 같은 호출 종류/플레이어의 다음 기록 순)"""
+        indices = self._by_key.get(key)
+        if indices:
+            index = self._next_unused(indices)
+            if index is None:
+                index = indices[-1]
+            self.replayed += 1
+        else:
+            index = self._next_unused(self._by_stream.get(self._stream(request), []))
+            if index is None:
+                return None
+            self.stream_matches += 1
+        self._used.add(index)
+        return self._entries[index]
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        key = request.fingerprint()
+        if self.mode == "record":
+            response = await self.inner.complete(request)
+            self._write(key, request, response)
+            return response
+
+        entry = self._find(key, request)
+        if entry is None:
+            self.misses += 1
+            raise CassetteMiss(f"카세트에 없는 요청 - {request.call_type} ({key})")
+
+        start = time.perf_counter()
+        if self.simulate_latency and entry["latency"] > 0:
+            await asyncio.sleep(entry["latency"])
+        usage = entry.get("usage")
+        return LLMResponse(
+            text=entry["text"],
+            usage=LLMUsage(**usage) if usage else None,
+            latency=time.perf_counter() - start,
+            provider=self.name,
+        )
+
+    def _write(self, key: str, request: LLMRequest, response: LLMResponse):
+        """응답 하나를 카세트에 한 줄로 기록"""
+        usage = response.usage
+        entry = {
+            "key": key,
+            "call_type": request.call_type,
+            "player": request.metadata.get("player"),
+            "text": response.text,
+            "usage": {
+                "input_tokens": usage.input_tokens,
+                "output_tokens": usage.output_tokens,
+                "cached_tokens": usage.cached_tokens,
+            } if usage else None,
+            "latency": round(response.latency, 4),
+        }
+        self._file.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self.recorded += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        metrics = {
+            "provider": self.name,
+            "cassette": str(self.path),
+            "recorded": self.recorded,
+            "replayed": self.replayed,
+            "stream_matches": self.stream_matches,
+            "misses": self.misses,
+        }
+        if self.inner is not None and self.mode == "record":
+            metrics["inner"] = self.inner.get_metrics()
+        return metrics
+
+    def backlog(self) -> LLMBacklog:
+        return self.inner.backlog() if self.inner is not None else LLMBacklog()
+
+    async def start(self):
+        if self.inner is not None:
+            await self.inner.start()
+
+    async def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.inner is not None:
+            await self.inner.close()
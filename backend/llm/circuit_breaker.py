@@ -0,0 +1,171 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Dict
+from llm.base import LLMProvider, LLMRequest, LLMResponse, ProviderLayer
+from utils.config import (
+    LLM_BREAKER_ENABLED, LLM_BREAKER_WINDOW, LLM_BREAKER_MIN_CALLS, LLM_BREAKER_FAILURE_RATIO, LLM_BREAKER_COOLDOWN
+)
+
+# 회로가 열려 있어 LLM을 호출하지 않음 (호출한 쪽은 휴리스틱으로 대체)
+class CircuitOpenError(RuntimeError):
+    pass
+
+# LLM 회로 차단기
+# - closed: 모든 호출을 보냄. 최근 window개 호출 중 실패(오류/마감 초과) 비율이 failure_ratio 이상이면 open
+# - open: cooldown초 동안 호출을 보내지 않음 (AI는 바로 휴리스틱 사용)
+# - half_open: 시험 호출 하나만 보내고, 성공하면 closed, 실패하면 다시 open
+class CircuitBreaker:
+    def __init__(self, window: int, min_calls: int, failure_ratio: float, cooldown: float, enabled: bool = True):
+        self.enabled = enabled
+        self.min_calls = min_calls
+        self.failure_ratio = failure_ratio
+        self.cooldown = cooldown
+        self.state = "closed"
+        self._outcomes = deque(maxlen=window)  # 최근 호출 실패 여부
+        self._opened_at = 0.0
+        self._probing = False  # half_open에서 시험 호출이 진행 중인지
+        self.opened = 0  # 회로가 열린 횟수
+        self.short_circuited = 0  # 회로가 열려 있어 보내지 않은 호출 수
+
+    def allow(self) -> bool:
+        """호출을 보내도 되는지 (True를 받으면 결과를 record()나 release()로 알려야 함)"""
+        if not self.enabled or self.state == "closed":
+            return True
+        if self.state == "open" and time.monotonic() - self._opened_at >= self.cooldown:
+            self.state = "half_open"
+            print("🔌 LLM 회로 반열림 - 시험 호출로 복구 확인")
+        if self.state == "half_open" and not self._probing:
+            self._probing = True
+            return True
+        self.short_circuited += 1
+        return False
+
+    def record(self, success: bool):
+        """보낸 호출의 결과 기록"""
+        if not self.enabled:
+            return
+        if self.state == "half_open" and self._probing:
+            self._probing = False
+            if success:
+                self.state = "closed"
+                self._outcomes.clear()
+                print("✅ LLM 회로 닫힘 - 제공자 복구")
+            else:
+                self._open()
+            return
+        if self.state != "closed":
+            return  # 회로가 열리기 전에 보낸 호출의 늦은 결과
+        self._outcomes.append(not success)
+        failures = sum(self._outcomes)
+        if len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.failure_ratio:
+            self._open()
+
+    def release(self):
+        """보낸 호출이 결과 없이 취소됨 (시험 호출이었으면 다음 호출이 다시 시험)"""
+        if self.state == "half_open":
+            self._probing = False
+
+    def _open(self):
+        self.state = "open"
+        self._opened_at = time.monotonic()
+        self._probing = False
+        self.opened += 1
+        print(f"🚨 LLM 회로 열림 - {self.cooldown:.0f}초 동안 AI가 휴리스틱으로 응답")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        failures = sum(self._outcomes)
+        return {
+            "enabled": self.enabled,
+            "state": self.state,
+            "recent_calls": len(self._outcomes),
+            "recent_failure_ratio": round(failures / len(self._outcomes), 3) if self._outcomes else 0.0,
+            "opened": self.opened,
+            "short_circuited": self.short_circuited,
+        }
+
+# 제공자 호출 마감 시간 + 회로 차단기 계층
+# 스케줄러/속도 제한보다 안쪽(실제 제공자 바로 바깥)에 두어 제공자의 결과(성공, 오류, 제공자 쪽 마감 초과)만
+# 회로 차단기에 기록함. 제공자 쪽 마감 시간(deadlines)은 제공자로 보낸 시점부터 잼.
+# - 요청 metadata의 deadline(페이즈 전체 마감 시각)이 대기열에서 이미 지났으면 보내지 않음 (실패로 세지 않음)
+# - 호출한 쪽이 페이즈 마감 시각에 기다리기를 포기해도 이미 보낸 호출은 제공자 쪽 마감 시간까지 마저 진행해
+#   결과를 기록함 (대기열에서 시간을 많이 쓴 호출이 제공자 실패로 잘못 기록되거나, 느린 제공자가 기록되지 않는 일 방지)
+class CircuitBreakerProvider(ProviderLayer):
+    name = "circuit_breaker"
+    DEADLINE_SLACK = 0.05  # 마감 시각 타이머가 조금 일찍 울려도 마감으로 보는 여유(초)
+
+    def __init__(self, inner: LLMProvider, breaker: CircuitBreaker, deadlines: Dict[str, float]):
+        super().__init__(inner)
+        self.breaker = breaker
+        self.deadlines = deadlines  # 호출 종류 -> 제공자 쪽 마감 시간(초, 0이면 없음)
+        self.deadline_misses = 0
+        self.expired_in_queue = 0  # 페이즈 마감 시각이 지나 보내지 않은 호출 수
+        self.abandoned = 0  # 호출한 쪽이 마감 시각에 포기한 뒤 마저 진행한 호출 수
+        self.abandoned_tokens = {"input": 0, "output": 0}  # 그 호출들이 쓴 토큰 (응답을 받은 경우)
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        deadline_at = request.metadata.get("deadline")
+        if deadline_at is not None and time.monotonic() >= deadline_at:
+            self.expired_in_queue += 1
+            raise asyncio.TimeoutError()
+        if not self.breaker.allow():
+            raise CircuitOpenError("LLM 회로가 열려 있습니다.")
+        call = asyncio.ensure_future(self._call(request))
+        try:
+            return await asyncio.shield(call)
+        except asyncio.CancelledError:
+            if deadline_at is not None and time.monotonic() >= deadline_at - self.DEADLINE_SLACK and not call.done():
+                self.abandoned += 1
+                call.add_done_callback(self._finish_abandoned)
+            else:
+                call.cancel()  # 게임 종료, 헤지 요청의 진 쪽 등
+            raise
+
+    async def _call(self, request: LLMRequest) -> LLMResponse:
+        """제공자 호출 (제공자 쪽 마감 시간 적용, 결과를 회로 차단기에 기록)"""
+        deadline = self.deadlines.get(request.call_type, 0)
+        try:
+            if deadline > 0:
+                response = await asyncio.wait_for(self.inner.complete(request), deadline)
+            else:
+                response = await self.inner.complete(request)
+        except asyncio.TimeoutError:
+            self.deadline_misses += 1
+            self.breaker.record(success=False)
+            raise
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
+        except Exception:
+            self.breaker.record(success=False)
+            raise
+        self.breaker.record(success=True)
+        return response
+
+    def _finish_abandoned(self, call: asyncio.Future):
+        """포기된 호출의 결과 정리 (회로 차단기 기록은 _call에서 끝남)"""
+        if call.cancelled() or call.exception() is not None:
+            return
+        usage = call.result().usage
+        if usage:
+            self.abandoned_tokens["input"] += usage.input_tokens
+            self.abandoned_tokens["output"] += usage.output_tokens
+
+    def layer_metrics(self) -> Dict[str, Any]:
+        return {
+            "deadlines": self.deadlines,
+            "deadline_misses": self.deadline_misses,
+            "expired_in_queue": self.expired_in_queue,
+            "abandoned": self.abandoned,
+            "abandoned_tokens": self.abandoned_tokens,
+            **self.breaker.get_metrics(),
+        }
+
+# 프로세스 전체에서 공유하는 LLM 회로 차단기
+llm_breaker = CircuitBreaker(
+    window=LLM_BREAKER_WINDOW,
+    min_calls=LLM_BREAKER_MIN_CALLS,
+    failure_ratio=LLM_BREAKER_FAILURE_RATIO,
+    cooldown=LLM_BREAKER_COOLDOWN,
+    enabled=LLM_BREAKER_ENABLED,
+)
@@ -0,0 +1,146 @@
+import asyncio
+import dataclasses
+import time
+from typing import Any, Dict, Iterable
+from llm.base import LLMProvider, LLMRequest, LLMResponse, LLMUsage, ProviderLayer
+from utils.latency import LatencyTracker
+from utils.tokens import estimate_message_tokens
+
+# 헤지 요청 (느린 호출의 꼬리 지연 줄이기)
+# 호출 종류별 최근 응답 시간의 p백분위(기본 p90)까지 답이 없으면 같은 요청을 한 번 더 보내고,
+# 먼저 온 응답을 쓰고 나머지는 취소함.
+# - 헤지 수는 전체 호출 수의 budget 비율 이내 (비용 상한)
+# - 감싼 계층에 밀린 호출이 있으면(스케줄러/속도 제한 대기열) 헤지하지 않음: 느린 이유가 혼잡이면 중복 호출은 혼잡만 키움
+# - 진 쪽 호출의 사용량은 응답의 extra_usage로 넘겨 비용 통계에 넣음
+#   (함께 끝났으면 실제 사용량, 취소했으면 입력은 메시지로 추정하고 출력은 이긴 쪽만큼 생성했다고 보고 추정)
+# 같은 요청을 합치는 중복 호출 제거 계층보다 안쪽에 둬야 헤지 요청이 원래 요청에 합쳐지지 않음
+class HedgingProvider(ProviderLayer):
+    name = "hedging"
+
+    def __init__(self, inner: LLMProvider, call_types: Iterable[str], percentile: float = 90,
+                 budget: float = 0.15, min_samples: int = 20):
+        super().__init__(inner)
+        self.call_types = set(call_types)
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self._service = {}  # 호출 종류 -> 응답 시간 (헤지 시점 계산용)
+        self.latency = LatencyTracker()  # 헤지 대상 호출의 실제 대기 시간 (헤지 포함)
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0  # 헤지 요청이 먼저 답한 수
+        self.skipped_budget = 0  # 헤지 시점이 지났지만 예산이 없어 헤지하지 않은 수
+        self.skipped_backlog = 0  # 헤지 시점이 지났지만 밀린 호출이 있어 헤지하지 않은 수
+        self.loser_tokens = {"input": 0, "output": 0}  # 진 쪽 호출의 사용량 (추정 포함)
+        self.estimated_losers = 0  # 취소해서 사용량을 추정한 진 쪽 호출 수
+
+    def _tracker(self, call_type: str) -> LatencyTracker:
+        if call_type not in self._service:
+            self._service[call_type] = LatencyTracker(window=200)
+        return self._service[call_type]
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        if request.call_type not in self.call_types:
+            return await self.inner.complete(request)
+
+        tracker = self._tracker(request.call_type)
+        self.calls += 1
+        start = time.perf_counter()
+        primary = asyncio.create_task(self.inner.complete(request))
+        tasks = {primary}
+        try:
+            delay = tracker.percentile(self.percentile) if len(tracker.samples) >= self.min_samples else None
+            if delay is not None:
+                await asyncio.wait(tasks, timeout=delay)
+                if not primary.done():
+                    hedge = self._start_hedge(request)
+                    if hedge is not None:
+                        tasks.add(hedge)
+            winner, response = await self._first_success(tasks)
+            extra_usage = self._loser_usage(request, tasks - {winner}, response)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()  # 늦은 쪽 취소
+                elif not task.cancelled():
+                    task.exception()  # 함께 끝난 쪽의 오류는 이미 처리됨으로 표시
+
+        elapsed = time.perf_counter() - start
+        self.latency.record(elapsed)
+        # 헤지가 이기면 원래 요청의 응답 시간은 알 수 없으므로 헤지 요청 자체의 응답 시간을 기록
+        tracker.record(response.latency or elapsed)
+        if winner is not primary:
+            self.hedge_wins += 1
+        if extra_usage is not None:
+            response = dataclasses.replace(response, extra_usage=extra_usage)
+        return response
+
+    def _loser_usage(self, request: LLMRequest, losers: set, response: LLMResponse):
+        """진 쪽 호출의 사용량 (진 쪽이 없으면 None)
+
+        이미 성공한 쪽은 실제 사용량, 아직 진행 중이라 취소할 쪽은 추정치, 실패한 쪽은 사용량 없음으로 봄
+        """
+        if not losers:
+            return None
+        usage = LLMUsage()
+        for task in losers:
+            if not task.done():
+                usage.input_tokens += estimate_message_tokens(request.messages)
+                usage.output_tokens += response.usage.output_tokens if response.usage else 0
+                self.estimated_losers += 1
+            elif not task.cancelled() and task.exception() is None and task.result().usage:
+                loser = task.result().usage
+                usage.input_tokens += loser.input_tokens
+                usage.output_tokens += loser.output_tokens
+                usage.cached_tokens += loser.cached_tokens
+        self.loser_tokens["input"] += usage.input_tokens
+        self.loser_tokens["output"] += usage.output_tokens
+        return usage
+
+    def _start_hedge(self, request: LLMRequest):
+        """예산과 혼잡도를 확인하고 헤지 요청 시작 (보내지 않으면 None)"""
+        if self.hedged + 1 > self.budget * self.calls:
+            self.skipped_budget += 1
+            return None
+        if self.inner.backlog().queued > 0:
+            self.skipped_backlog += 1
+            return None
+        self.hedged += 1
+        hedge_request = dataclasses.replace(request, metadata={**request.metadata, "hedge": True})
+        return asyncio.create_task(self.inner.complete(hedge_request))
+
+    @staticmethod
+    async def _first_success(tasks: set):
+        """먼저 성공한 (작업, 응답) 반환 (모두 실패하면 첫 번째로 실패한 예외)"""
+        pending = set(tasks)
+        error = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task, task.result()
+                error = error or task.exception()
+        raise error
+
+    def layer_metrics(self) -> Dict[str, Any]:
+        return {
+            "call_types": sorted(self.call_types),
+            "percentile": self.percentile,
+            "budget": self.budget,
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "hedge_rate": round(self.hedged / self.calls, 4) if self.calls else 0.0,
+            "hedge_wins": self.hedge_wins,
+            "skipped_budget": self.skipped_budget,
+            "skipped_backlog": self.skipped_backlog,
+            "loser_tokens": dict(self.loser_tokens),
+            "estimated_losers": self.estimated_losers,
+            "hedge_after_ms": {
+                call_type: round(tracker.percentile(self.percentile) * 1000, 1)
+                for call_type, tracker in self._service.items() if len(tracker.samples) >= self.min_samples
+            },
+            "latency": {
+                **self.latency.to_dict(),
+                "p99_ms": round(self.latency.percentile(99) * 1000, 1),
+            },
+        }
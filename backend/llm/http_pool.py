@@ -0,0 +1,141 @@
+import asyncio
+import importlib.util
+import os
+import time
+from typing import Any, Callable, Dict, Optional
+import httpx
+
+# OpenAI API용 HTTP 연결 풀
+# httpx 연결 풀 앞에 연결 수만큼의 슬롯을 두어, 풀이 가득 찼을 때 기다린 시간과 포화 상태를 측정함.
+# 새 연결(TCP + TLS)을 맺은 수와 걸린 시간은 httpcore trace 이벤트로 측정
+class _ReleasingStream(httpx.AsyncByteStream):
+    """응답 본문을 다 읽고 닫을 때 연결 슬롯을 돌려주는 스트림"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+class MeteredTransport(httpx.AsyncBaseTransport):
+    def __init__(self, max_connections: int, max_keepalive: int, keepalive_expiry: float,
+                 http2: bool = False, pool_timeout: Optional[float] = None):
+        proxy = os.getenv("HTTPS_PROXY") or os.getenv("HTTP_PROXY") or None
+        if http2 and importlib.util.find_spec("h2") is None:
+            print("⚠️ HTTP/2를 쓰려면 h2 패키지가 필요합니다 (pip install 'httpx[http2]'). HTTP/1.1로 연결합니다.")
+            http2 = False
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.pool_timeout = pool_timeout
+        self._transport = httpx.AsyncHTTPTransport(
+            proxy=proxy,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+        self._slots = asyncio.Semaphore(max_connections)
+        self.requests = 0
+        self.active = 0
+        self.max_active = 0
+        self.waited = 0  # 풀이 가득 차서 기다린 요청 수
+        self.pending = 0  # 지금 풀 자리를 기다리는 요청 수
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.pool_timeouts = 0
+        self.connections_opened = 0
+        self.total_connect_time = 0.0  # 새 연결의 TCP + TLS 연결 시간 합
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        saturated = self._slots.locked()
+        if not saturated:
+            await self._slots.acquire()  # 남은 슬롯이 있으면 기다리지 않고 바로 얻음
+        else:
+            self.pending += 1
+            try:
+                await asyncio.wait_for(self._slots.acquire(), self.pool_timeout)
+            except asyncio.TimeoutError:
+                self.pool_timeouts += 1
+                raise httpx.PoolTimeout("연결 풀 대기 시간 초과", request=request)
+            finally:
+                self.pending -= 1
+        wait = time.perf_counter() - start
+        self.requests += 1
+        if saturated:
+            self.waited += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+
+        released = False
+
+        def release():
+            nonlocal released
+            if not released:
+                released = True
+                self.active -= 1
+                self._slots.release()
+
+        request.extensions["trace"] = self._tracer(request.extensions.get("trace"))
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, release),
+            extensions=response.extensions,
+        )
+
+    def _tracer(self, previous):
+        """새 연결 수와 연결 시간을 재는 httpcore trace 콜백 (기존 콜백이 있으면 이어서 호출)"""
+        started = {}
+
+        async def trace(event_name: str, info: Dict[str, Any]):
+            now = time.perf_counter()
+            if event_name == "connection.connect_tcp.started":
+                started["connect"] = now
+            elif event_name == "connection.connect_tcp.complete":
+                self.connections_opened += 1
+                self.total_connect_time += now - started.pop("connect", now)
+                started["tls"] = now
+            elif event_name == "connection.start_tls.complete":
+                self.total_connect_time += now - started.pop("tls", now)
+            if previous is not None:
+                await previous(event_name, info)
+
+        return trace
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "active": self.active,
+            "max_active": self.max_active,
+            "saturation": round(self.active / self.max_connections, 3),
+            "requests": self.requests,
+            "waited": self.waited,
+            "pending": self.pending,
+            "avg_wait_ms": round(self.total_wait / self.waited * 1000, 1) if self.waited else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 1),
+            "pool_timeouts": self.pool_timeouts,
+            "connections_opened": self.connections_opened,
+            "avg_connect_ms": round(self.total_connect_time / self.connections_opened * 1000, 1) if self.connections_opened else 0.0,
+        }
+
+    async def aclose(self):
+        await self._transport.aclose()
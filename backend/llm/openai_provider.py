@@ -0,0 +1,101 @@
+import asyncio
+import time
+from typing import Any, Dict
+import httpx
+from openai import AsyncOpenAI  # ✅ 비동기 클라이언트 사용
+from llm.base import LLMBacklog, LLMProvider, LLMRequest, LLMResponse, LLMUsage, ProviderMetrics
+from llm.http_pool import MeteredTransport
+from utils.config import (
+    LLM_HTTP_MAX_CONNECTIONS, LLM_HTTP_MAX_KEEPALIVE, LLM_HTTP_KEEPALIVE_EXPIRY, LLM_HTTP_HTTP2,
+    LLM_HTTP_CONNECT_TIMEOUT, LLM_HTTP_READ_TIMEOUT, LLM_HTTP_POOL_TIMEOUT, LLM_HTTP_WARM_CONNECTIONS
+)
+
+# OpenAI Chat Completions 제공자
+class OpenAIProvider(LLMProvider):
+    name = "openai"
+
+    def __init__(self, api_key: str):
+        # 표준 프록시 환경변수는 연결 풀에서 사용 (있으면 자동 적용)
+        self._transport = MeteredTransport(
+            max_connections=LLM_HTTP_MAX_CONNECTIONS,
+            max_keepalive=LLM_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=LLM_HTTP_KEEPALIVE_EXPIRY,
+            http2=LLM_HTTP_HTTP2,
+            pool_timeout=LLM_HTTP_POOL_TIMEOUT,
+        )
+        # 연결은 짧게, 응답은 길게 기다림
+        timeout = httpx.Timeout(LLM_HTTP_READ_TIMEOUT, connect=LLM_HTTP_CONNECT_TIMEOUT, pool=LLM_HTTP_POOL_TIMEOUT)
+        self._http_client = httpx.AsyncClient(transport=self._transport, timeout=timeout)
+        # openai>=1.0 API (Responses/Chat Completions 지원)
+        self._client = AsyncOpenAI(api_key=api_key, http_client=self._http_client, timeout=timeout)
+        self.metrics = ProviderMetrics()
+        self.warmed_connections = 0
+
+    async def start(self):
+        """연결 풀에 연결을 미리 맺어 둠 (첫 게임이 TCP/TLS 연결 시간을 기다리지 않도록)
+
+        모델 목록 조회는 토큰을 쓰지 않으며, 실패해도 서버 시작은 계속함.
+        SDK 클라이언트를 거쳐 호출하므로 SDK의 첫 호출 초기화 비용도 여기서 치름
+        """
+        count = min(LLM_HTTP_WARM_CONNECTIONS, LLM_HTTP_MAX_CONNECTIONS, LLM_HTTP_MAX_KEEPALIVE)
+        if count <= 0:
+            return
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *[self._client.with_options(max_retries=0).models.list() for _ in range(count)],
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        self.warmed_connections = self._transport.connections_opened
+        if errors:
+            print(f"⚠️ 연결 미리 맺기 실패 - {errors[0]}")
+        print(f"🔌 OpenAI 연결 {self.warmed_connections}개 준비 ({(time.perf_counter() - start) * 1000:.0f}ms)")
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        start = time.perf_counter()
+        try:
+            resp = await self._client.chat.completions.create(
+                model=request.model,
+                messages=request.messages,
+                max_tokens=request.max_tokens,
+                temperature=request.temperature,
+                **request.params,
+            )
+        except Exception:
+            self.metrics.record(time.perf_counter() - start, error=True)
+            raise
+        latency = time.perf_counter() - start
+        self.metrics.record(latency)
+
+        usage = None
+        if getattr(resp, "usage", None):
+            # 제공자의 프롬프트 접두사 캐시에서 읽은 입력 토큰 (입력 토큰에 포함되어 있음)
+            details = getattr(resp.usage, "prompt_tokens_details", None)
+            usage = LLMUsage(
+                input_tokens=resp.usage.prompt_tokens,
+                output_tokens=resp.usage.completion_tokens,
+                cached_tokens=getattr(details, "cached_tokens", 0) or 0,
+            )
+        return LLMResponse(
+            text=(resp.choices[0].message.content or "").strip(),
+            usage=usage,
+            latency=latency,
+            provider=self.name,
+        )
+
+    def backlog(self) -> LLMBacklog:
+        """연결 풀 자리를 기다리는 요청 (자리가 나는 속도는 평균 응답 시간으로 추정)"""
+        pending = self._transport.pending
+        avg_latency = self.metrics.total_latency / self.metrics.calls if self.metrics.calls else 0.0
+        return LLMBacklog(pending, pending / self._transport.max_connections * avg_latency)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "provider": self.name,
+            **self.metrics.to_dict(),
+            "warmed_connections": self.warmed_connections,
+            "pool": self._transport.get_metrics(),
+        }
+
+    async def close(self):
+        await self._http_client.aclose()
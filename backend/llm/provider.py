@@ -0,0 +1,110 @@
+from typing import Optional
+from llm.base import LLMProvider
+from utils.config import (
+    OPENAI_API_KEY, LLM_PROVIDER, LLM_STUB_LATENCY_MS, LLM_STUB_JITTER_MS,
+    LLM_STUB_INPUT_TOKENS, LLM_STUB_OUTPUT_TOKENS,
+    LLM_CASSETTE_MODE, LLM_CASSETTE_PATH, LLM_CASSETTE_SIMULATE_LATENCY,
+    LLM_CACHE_ENABLED, LLM_CACHE_MAX_ENTRIES, LLM_CACHE_TTL_SECONDS, LLM_CACHE_MAX_TEMPERATURE,
+    LLM_SINGLEFLIGHT_ENABLED, LLM_RATE_LIMIT_RPM, LLM_RATE_LIMIT_TPM,
+    LLM_MAX_CONCURRENT_CALLS, LLM_PRIORITY_WEIGHTS,
+    LLM_HEDGE_ENABLED, LLM_HEDGE_CALL_TYPES, LLM_HEDGE_PERCENTILE, LLM_HEDGE_BUDGET, LLM_HEDGE_MIN_SAMPLES,
+    AI_DEADLINES
+)
+
+def has_api_key() -> bool:
+    """실제 OpenAI API 키가 설정되어 있는지"""
+    return bool(OPENAI_API_KEY) and OPENAI_API_KEY != "your_openai_api_key_here"
+
+def create_provider(name: str = LLM_PROVIDER) -> LLMProvider:
+    """설정에 맞는 LLM 제공자 생성
+
+    - openai: OpenAI API
+    - stub: 네트워크 없이 동작하는 결정적 스텁
+    - auto: API 키가 있으면 openai, 없으면 stub
+    """
+    if name == "auto":
+        name = "openai" if has_api_key() else "stub"
+    if name == "openai":
+        from llm.openai_provider import OpenAIProvider
+        return OpenAIProvider(OPENAI_API_KEY)
+    if name == "stub":
+        from llm.stub_provider import StubProvider
+        return StubProvider(
+            latency=LLM_STUB_LATENCY_MS / 1000,
+            jitter=LLM_STUB_JITTER_MS / 1000,
+            input_tokens=LLM_STUB_INPUT_TOKENS,
+            output_tokens=LLM_STUB_OUTPUT_TOKENS,
+        )
+    raise ValueError(f"알 수 없는 LLM 제공자: {name}")
+
+def build_provider() -> LLMProvider:
+    """설정된 제공자에 계층을 씌운 제공자 생성
+
+    요청은 바깥부터 응답 캐시 -> 중복 호출 제거 -> 헤지 요청 -> 우선순위 스케줄러 -> 속도 제한
+    -> 마감 시간/회로 차단기 -> 카세트 녹화/재생 -> 실제 제공자 순으로 지나감
+    """
+    if LLM_CASSETTE_MODE == "replay":
+        from llm.cassette import CassetteProvider
+        provider = CassetteProvider(LLM_CASSETTE_PATH, "replay", simulate_latency=LLM_CASSETTE_SIMULATE_LATENCY)
+    else:
+        provider = create_provider()
+        if LLM_CASSETTE_MODE == "record":
+            from llm.cassette import CassetteProvider
+            provider = CassetteProvider(LLM_CASSETTE_PATH, "record", inner=provider)
+    from llm.circuit_breaker import CircuitBreakerProvider, llm_breaker
+    provider = CircuitBreakerProvider(provider, llm_breaker, AI_DEADLINES)
+    if LLM_RATE_LIMIT_RPM > 0 or LLM_RATE_LIMIT_TPM > 0:
+        from llm.rate_limiter import RateLimitedProvider
+        provider = RateLimitedProvider(provider, LLM_RATE_LIMIT_RPM, LLM_RATE_LIMIT_TPM)
+    if LLM_MAX_CONCURRENT_CALLS > 0:
+        from llm.scheduler import PriorityScheduler
+        provider = PriorityScheduler(provider, LLM_MAX_CONCURRENT_CALLS, LLM_PRIORITY_WEIGHTS)
+    if LLM_HEDGE_ENABLED:
+        from llm.hedging import HedgingProvider
+        provider = HedgingProvider(
+            provider,
+            call_types=LLM_HEDGE_CALL_TYPES,
+            percentile=LLM_HEDGE_PERCENTILE,
+            budget=LLM_HEDGE_BUDGET,
+            min_samples=LLM_HEDGE_MIN_SAMPLES,
+        )
+    if LLM_SINGLEFLIGHT_ENABLED:
+        from llm.singleflight import SingleflightProvider
+        provider = SingleflightProvider(provider)
+    if LLM_CACHE_ENABLED:
+        from llm.cache import CachingProvider
+        provider = CachingProvider(
+            provider,
+            max_entries=LLM_CACHE_MAX_ENTRIES,
+            ttl=LLM_CACHE_TTL_SECONDS,
+            max_temperature=LLM_CACHE_MAX_TEMPERATURE,
+        )
+    return provider
+
+# 프로세스 전체에서 공유하는 LLM 제공자 (처음 사용할 때 생성)
+_provider: Optional[LLMProvider] = None
+
+def get_llm() -> LLMProvider:
+    """현재 LLM 제공자 반환"""
+    global _provider
+    if _provider is None:
+        _provider = build_provider()
+        print(f"🤖 LLM 제공자: {_provider.name}")
+    return _provider
+
+def set_llm(provider: Optional[LLMProvider]) -> Optional[LLMProvider]:
+    """LLM 제공자 교체 (벤치마크/테스트용). 이전 제공자 반환"""
+    global _provider
+    previous, _provider = _provider, provider
+    return previous
+
+async def start_llm():
+    """LLM 제공자 준비 (서버 시작 시: 제공자 생성, 연결 미리 맺기)"""
+    await get_llm().start()
+
+async def close_llm():
+    """LLM 제공자 정리 (서버 종료 시)"""
+    global _provider
+    if _provider is not None:
+        await _provider.close()
+        _provider = None
@@ -0,0 +1,142 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+from llm.base import LLMBacklog, LLMProvider, LLMRequest, LLMResponse, ProviderLayer
+from utils.tokens import estimate_message_tokens
+
+# 분당 요청 수(RPM)/토큰 수(TPM) 토큰 버킷 (per_minute가 0 이하면 제한 없음)
+class TokenBucket:
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.unlimited = per_minute <= 0
+        self.rate = per_minute / 60.0  # 초당 채워지는 양
+        self.level = per_minute
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """amount만큼 꺼낼 수 있을 때까지 남은 시간(초)"""
+        if self.unlimited:
+            return 0.0
+        self._refill()
+        return max(0.0, (amount - self.level) / self.rate)
+
+    def take(self, amount: float):
+        """amount만큼 꺼냄 (사용량 보정으로 음수가 되면 그만큼 다음 요청이 기다림)"""
+        if self.unlimited:
+            return
+        self._refill()
+        self.level -= amount
+
+# 프로세스 전체 요청 속도 제한
+# 요청마다 RPM 버킷에서 1, TPM 버킷에서 예상 토큰 수(입력 추정 + max_tokens)를 꺼낸 뒤 호출하고,
+# 응답을 받으면 실제 사용량과의 차이를 TPM 버킷에 반영함.
+# 버킷이 비어 있으면 실패하지 않고 도착 순서대로 줄을 서서 기다림 (앞 요청이 기다리는 동안 뒤 요청이 새치기하지 않음)
+class RateLimitedProvider(ProviderLayer):
+    name = "rate_limit"
+
+    def __init__(self, inner: LLMProvider, requests_per_minute: float, tokens_per_minute: float):
+        super().__init__(inner)
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self._queue: Deque[Tuple[asyncio.Future, int]] = deque()
+        self._pump: Optional[asyncio.Task] = None
+        self.calls = 0
+        self.throttled = 0  # 버킷이 비어 기다린 요청 수
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.max_queue = 0
+
+    def _estimate(self, request: LLMRequest) -> int:
+        """요청이 쓸 토큰 수 추정 (한 번에 버킷 용량보다 많이 꺼내지 않음)"""
+        cost = estimate_message_tokens(request.messages) + request.max_tokens
+        return cost if self.tokens.unlimited else min(cost, int(self.tokens.capacity))
+
+    def _ready(self, cost: int) -> float:
+        return max(self.requests.wait_time(1), self.tokens.wait_time(cost))
+
+    def _take(self, cost: int):
+        self.requests.take(1)
+        self.tokens.take(cost)
+
+    async def _acquire(self, cost: int):
+        """버킷에서 요청 하나만큼 꺼냄 (비어 있으면 줄을 서서 기다림)"""
+        if not self._queue and self._ready(cost) == 0:
+            self._take(cost)
+            return
+
+        start = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((future, cost))
+        self.throttled += 1
+        self.max_queue = max(self.max_queue, len(self._queue))
+        if self._pump is None or self._pump.done():
+            self._pump = asyncio.create_task(self._drain(), name="llm-rate-limit")
+        try:
+            await future
+        finally:
+            wait = time.perf_counter() - start
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    async def _drain(self):
+        """줄 맨 앞 요청부터 버킷이 채워지는 대로 통과시킴 (취소된 요청은 건너뜀)"""
+        while self._queue:
+            future, cost = self._queue[0]
+            if future.done():
+                self._queue.popleft()
+                continue
+            wait = self._ready(cost)
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            self._take(cost)
+            self._queue.popleft()
+            future.set_result(None)
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        cost = self._estimate(request)
+        await self._acquire(cost)
+        self.calls += 1
+        response = await self.inner.complete(request)
+        if response.usage:
+            # 추정치와 실제 사용량의 차이 보정
+            self.tokens.take(response.usage.input_tokens + response.usage.output_tokens - cost)
+        return response
+
+    def backlog(self) -> LLMBacklog:
+        """줄에 선 요청이 모두 버킷을 통과할 때까지 걸리는 시간 (그 뒤에 오는 요청의 대기 시간)"""
+        inner = self.inner.backlog()
+        if not self._queue:
+            return inner
+        wait = max(
+            self.requests.wait_time(len(self._queue)),
+            self.tokens.wait_time(sum(cost for _, cost in self._queue)),
+        )
+        return LLMBacklog(len(self._queue) + inner.queued, max(wait, inner.estimated_wait))
+
+    def layer_metrics(self) -> Dict[str, Any]:
+        return {
+            "rpm_limit": self.requests.capacity,
+            "tpm_limit": self.tokens.capacity,
+            "calls": self.calls,
+            "throttled": self.throttled,
+            "queued": len(self._queue),
+            "max_queue": self.max_queue,
+            "avg_wait_ms": round(self.total_wait / self.throttled * 1000, 1) if self.throttled else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 1),
+        }
+
+    async def close(self):
+        if self._pump is not None:
+            self._pump.cancel()
+            self._pump = None
+        for future, _ in self._queue:
+            future.cancel()
+        self._queue.clear()
+        await self.inner.close()
@@ -0,0 +1,141 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from llm.base import LLMBacklog, LLMProvider, LLMRequest, LLMResponse, ProviderLayer
+from utils.latency import LatencyTracker
+
+# 우선순위 등급 (앞일수록 높음)
+PRIORITIES = ("interactive", "near_term", "background")
+
+# 호출 종류별 기본 우선순위 (요청 metadata의 priority가 있으면 그 값을 사용)
+# - interactive: 사람이 화면을 보며 기다리는 호출 (AI 토론, 투표, 밤 행동)
+# - near_term: 곧 필요하지만 지금 기다리는 사람은 없는 호출 (게임 시작 때 미리 만드는 자기소개)
+# - background: 늦어도 되는 호출 (대화 요약)
+CALL_PRIORITIES = {
+    "discussion": "interactive",
+    "ensemble": "interactive",
+    "vote": "interactive",
+    "night": "interactive",
+    "introduction": "near_term",
+    "summary": "background",
+}
+
+def request_priority(request: LLMRequest) -> str:
+    priority = request.metadata.get("priority") or CALL_PRIORITIES.get(request.call_type, "near_term")
+    return priority if priority in PRIORITIES else "near_term"
+
+# LLM 호출 스케줄러 (우선순위 + 게임별 가중 공정 큐)
+# 동시에 진행하는 호출 수를 max_concurrency로 제한하고, 자리가 나면 기다리는 호출 중 다음 호출을 고름.
+# 흐름(우선순위 등급, game_id)마다 시작 태그를 붙이는 start-time fair queueing:
+#   시작 태그 = max(가상 시각, 같은 흐름의 이전 종료 태그), 종료 태그 = 시작 태그 + 1 / 등급 가중치
+# 시작 태그가 가장 작은 호출부터 보내므로, 한 게임이 호출을 많이 쌓아도 다른 게임의 호출이 사이사이 끼어들고
+# 가중치가 큰 등급(interactive)이 더 자주 선택됨
+class PriorityScheduler(ProviderLayer):
+    name = "scheduler"
+    MAX_FLOWS = 512  # 종료 태그를 보관하는 흐름 수 (넘으면 지난 태그 정리)
+
+    def __init__(self, inner: LLMProvider, max_concurrency: int, weights: Dict[str, float]):
+        super().__init__(inner)
+        self.max_concurrency = max_concurrency
+        self.weights = weights
+        self.active = 0
+        self._queue: List[Tuple[float, int, asyncio.Future]] = []  # (시작 태그, 도착 순번, 대기 future)
+        self._order = itertools.count()
+        self._virtual_time = 0.0
+        self._finish_tags: Dict[Tuple[str, Any], float] = {}
+        self.dispatched = {priority: 0 for priority in PRIORITIES}
+        self.queued = {priority: 0 for priority in PRIORITIES}
+        self.waits = {priority: LatencyTracker() for priority in PRIORITIES}
+        self.service_time = 0.0  # 자리를 받은 호출이 끝나기까지 걸린 시간의 이동 평균(초)
+
+    def _tag(self, priority: str, game_id: Optional[str]) -> float:
+        """흐름의 다음 시작 태그를 정하고 종료 태그를 갱신"""
+        if len(self._finish_tags) > self.MAX_FLOWS:
+            # 가상 시각보다 앞선 태그는 어차피 가상 시각으로 대체되므로 정리 (끝난 게임의 흐름 등)
+            self._finish_tags = {flow: tag for flow, tag in self._finish_tags.items() if tag > self._virtual_time}
+        flow = (priority, game_id)
+        start = max(self._virtual_time, self._finish_tags.get(flow, 0.0))
+        self._finish_tags[flow] = start + 1.0 / self.weights[priority]
+        return start
+
+    async def _acquire(self, priority: str, game_id: Optional[str]):
+        start_tag = self._tag(priority, game_id)
+        if self.active < self.max_concurrency and not self._queue:
+            self._virtual_time = max(self._virtual_time, start_tag)
+            self.active += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (start_tag, next(self._order), future))
+        self.queued[priority] += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release()  # 자리를 받은 직후 취소됨
+            raise
+        finally:
+            self.queued[priority] -= 1
+
+    def _release(self):
+        """자리 하나를 반납하고 시작 태그가 가장 작은 대기 호출에 넘김"""
+        while self._queue:
+            start_tag, _, future = heapq.heappop(self._queue)
+            if not future.done():
+                self._virtual_time = max(self._virtual_time, start_tag)
+                future.set_result(None)  # 자리를 그대로 넘김 (active 유지)
+                return
+        self.active -= 1
+        if self.active == 0:
+            # 유휴 상태: 오래 쉰 흐름이 밀린 태그로 불이익을 받지 않도록 태그 정리
+            self._finish_tags.clear()
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        priority = request_priority(request)
+        start = time.perf_counter()
+        await self._acquire(priority, request.metadata.get("game_id"))
+        self.waits[priority].record(time.perf_counter() - start)
+        self.dispatched[priority] += 1
+        dispatched_at = time.perf_counter()
+        try:
+            return await self.inner.complete(request)
+        finally:
+            elapsed = time.perf_counter() - dispatched_at
+            self.service_time = elapsed if not self.service_time else 0.9 * self.service_time + 0.1 * elapsed
+            self._release()
+
+    def backlog(self) -> LLMBacklog:
+        """interactive 호출 앞에 밀린 호출 기준 대기 시간
+
+        background 호출은 새 호출에 자리를 양보하므로 세지 않음.
+        자리가 모두 차 있으면 앞에 밀린 호출이 max_concurrency개씩 빠져나간다고 보고 추정
+        """
+        ahead = self.queued["interactive"] + self.queued["near_term"]
+        inner = self.inner.backlog()
+        wait = 0.0
+        if self.active >= self.max_concurrency:
+            wait = (ahead + 1) / self.max_concurrency * self.service_time
+        # 감싼 계층(속도 제한 등)에서 기다리는 시간은 service_time에 이미 들어 있으므로 더하지 않음
+        return LLMBacklog(ahead + inner.queued, max(wait, inner.estimated_wait))
+
+    def layer_metrics(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "active": self.active,
+            "classes": {
+                priority: {
+                    "weight": self.weights[priority],
+                    "queued": self.queued[priority],
+                    "dispatched": self.dispatched[priority],
+                    "wait": self.waits[priority].to_dict(),
+                }
+                for priority in PRIORITIES
+            },
+        }
+
+    async def close(self):
+        for _, _, future in self._queue:
+            future.cancel()
+        self._queue.clear()
+        await self.inner.close()
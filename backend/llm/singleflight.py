@@ -0,0 +1,67 @@
+import asyncio
+from dataclasses import replace
+from typing import Any, Dict
+from llm.base import LLMProvider, LLMRequest, LLMResponse, ProviderLayer
+
+# 동일 요청 중복 제거 (singleflight)
+# 같은 요청(같은 fingerprint)이 처리 중이면 새로 호출하지 않고 진행 중인 호출의 결과를 함께 받음.
+# 먼저 온 요청만 제공자를 호출하고, 나중에 온 요청은 coalesced로 표시된 같은 응답을 받음.
+# 기다리는 쪽이 일부 취소되어도 공유 호출은 계속되고, 모두 취소되면 공유 호출도 취소함
+class SingleflightProvider(ProviderLayer):
+    name = "singleflight"
+
+    def __init__(self, inner: LLMProvider):
+        super().__init__(inner)
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+        self.calls = 0  # 실제로 제공자를 호출한 수
+        self.coalesced = 0  # 진행 중인 호출에 합쳐진 수
+        self.max_waiters = 0  # 호출 하나를 함께 기다린 최대 요청 수
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        key = request.fingerprint()
+        task = self._in_flight.get(key)
+        leader = task is None
+        if leader:
+            self.calls += 1
+            task = asyncio.create_task(self.inner.complete(request), name=f"llm-{request.call_type}-{key[:8]}")
+            self._in_flight[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+
+        self._waiters[key] += 1
+        self.max_waiters = max(self.max_waiters, self._waiters[key])
+        try:
+            response = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if key in self._waiters:
+                self._waiters[key] -= 1
+                if self._waiters[key] == 0:
+                    task.cancel()
+            raise
+        return response if leader else replace(response, coalesced=True)
+
+    def _forget(self, key: str, task: asyncio.Task):
+        """끝난 호출 정리 (기다리는 쪽이 모두 취소된 호출의 예외도 여기서 회수)"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+            del self._waiters[key]
+        if not task.cancelled():
+            task.exception()
+
+    def layer_metrics(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "max_waiters": self.max_waiters,
+            "in_flight": len(self._in_flight),
+        }
+
+    async def close(self):
+        for task in list(self._in_flight.values()):
+            task.cancel()
+        self._in_flight.clear()
+        self._waiters.clear()
+        await self.inner.close()
@@ -0,0 +1,117 @@
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, Union
+from llm.base import LLMProvider, LLMRequest, LLMResponse, LLMUsage, ProviderMetrics
+from utils.tokens import estimate_message_tokens, estimate_tokens
+
+# 네트워크 없이 동작하는 결정적 스텁 제공자
+# 같은 요청에는 항상 같은 응답을 돌려주며, 지연 시간과 토큰 수를 설정할 수 있어
+# 부하 테스트/벤치마크/CI에서 전체 게임 루프를 API 없이 돌릴 때 사용함
+Answer = Union[List[str], Callable[[LLMRequest], str]]
+
+DISCUSSION_LINES = [
+    "저는 {player}님의 발언이 조금 앞뒤가 맞지 않는다고 생각합니다.",
+    "{player}님, 아까 말씀하신 근거를 조금 더 설명해 주실 수 있나요?",
+    "아직 확신은 없지만 {player}님을 좀 더 지켜보겠습니다.",
+    "{player}님은 지금까지 논리적으로 말해 와서 믿을 만해 보입니다.",
+]
+INTRODUCTION_LINES = [
+    "안녕하세요! 평범한 시민으로서 마피아를 꼭 찾아내고 싶습니다.",
+    "반갑습니다. 저는 시민이고, 차분하게 대화를 지켜보며 추리해 보겠습니다.",
+    "안녕하세요, 시민입니다. 이번 게임 다 같이 잘해 봐요!",
+]
+
+class StubProvider(LLMProvider):
+    name = "stub"
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0,
+                 input_tokens: Optional[int] = None, output_tokens: Optional[int] = None,
+                 answers: Optional[Dict[str, Answer]] = None):
+        """
+        latency/jitter: 응답 지연 시간(초) = latency + [0, jitter) 범위의 결정적 값
+        input_tokens/output_tokens: 보고할 토큰 수 (None이면 요청/응답 길이로 추정)
+        answers: 호출 종류(call_type)별 고정 응답 목록 또는 응답 함수 (없으면 규칙 기반 응답)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.input_tokens = input_tokens
+        self.output_tokens = output_tokens
+        self.answers = answers or {}
+        self.metrics = ProviderMetrics()
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        start = time.perf_counter()
+        rng = random.Random(self._seed(request))
+        delay = self.latency + rng.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        text = self._answer(request, rng)
+        usage = LLMUsage(
+            input_tokens=self.input_tokens if self.input_tokens is not None else estimate_message_tokens(request.messages),
+            output_tokens=self.output_tokens if self.output_tokens is not None else max(1, estimate_tokens(text)),
+        )
+        latency = time.perf_counter() - start
+        self.metrics.record(latency)
+        return LLMResponse(text=text, usage=usage, latency=latency, provider=self.name)
+
+    @staticmethod
+    def _seed(request: LLMRequest) -> int:
+        """요청 내용으로 만든 시드 (같은 요청이면 같은 응답)"""
+        payload = json.dumps([request.model, request.messages, request.params], ensure_ascii=False, sort_keys=True)
+        return int.from_bytes(hashlib.sha256(payload.encode("utf-8")).digest()[:8], "big")
+
+    def _answer(self, request: LLMRequest, rng: random.Random) -> str:
+        """설정된 고정 응답 또는 규칙 기반 응답"""
+        answer = self.answers.get(request.call_type)
+        if callable(answer):
+            return answer(request)
+        if answer:
+            return rng.choice(answer)
+
+        # 숫자 토큰만 허용한 결정 호출: 허용된 숫자 중 하나
+        logit_bias = request.params.get("logit_bias")
+        if logit_bias:
+            return str(rng.choice(sorted(int(token_id) - 15 for token_id in logit_bias)))
+
+        # JSON 스키마로 제한한 호출
+        response_format = request.params.get("response_format") or {}
+        if response_format.get("type") == "json_schema":
+            return json.dumps(self._json_answer(response_format["json_schema"], request, rng), ensure_ascii=False)
+
+        if request.call_type == "discussion":
+            return self._discussion_line(request, rng, exclude=request.metadata.get("player"))
+        if request.call_type == "introduction":
+            return rng.choice(INTRODUCTION_LINES)
+        if request.call_type == "summary":
+            # 새 대화의 마지막 몇 줄을 요약으로 사용
+            transcript = request.messages[-1]["content"].split("새 대화:", 1)[-1].strip().splitlines()
+            return " ".join(transcript[-3:])[:300]
+        return "알겠습니다."
+
+    def _json_answer(self, json_schema: Dict[str, Any], request: LLMRequest, rng: random.Random) -> Dict[str, Any]:
+        """알려진 JSON 스키마(decision, ensemble_discussion)에 맞는 응답"""
+        properties = json_schema["schema"]["properties"]
+        if json_schema["name"] == "decision":
+            return {"target": rng.choice(properties["target"]["enum"])}
+        if json_schema["name"] == "ensemble_discussion":
+            speakers = properties["utterances"]["items"]["properties"]["speaker"]["enum"]
+            return {"utterances": [
+                {"speaker": speaker, "message": self._discussion_line(request, rng, exclude=speaker)}
+                for speaker in speakers
+            ]}
+        return {}
+
+    @staticmethod
+    def _discussion_line(request: LLMRequest, rng: random.Random, exclude: str = None) -> str:
+        """프롬프트에 등장한 다른 플레이어 한 명을 언급하는 발언"""
+        players = sorted(set(re.findall(r"플레이어\d+", request.messages[-1]["content"])) - {exclude})
+        player = rng.choice(players) if players else "여러분"
+        return rng.choice(DISCUSSION_LINES).format(player=player)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {"provider": self.name, **self.metrics.to_dict()}
@@ -10,7 +10,12 @@ from utils.config import STATIC_FILES_DIR
 from api.game_routes import router as game_router
 from api.chat_routes import router as chat_router
 from api.websocket import manager
-from models.game_state import game_state
+from models.game_session import game_registry
+from game.phase_scheduler import phase_scheduler
+from game.admission import admission
+from llm.provider import start_llm, close_llm
+from llm.circuit_breaker import llm_breaker
+from utils.latency import first_ai_message_latency
 
 # FastAPI 앱 생성
 app = FastAPI(title="Mafia Game API", version="1.0.0")
@@ -31,6 +36,17 @@ app.mount("/static", StaticFiles(directory=STATIC_FILES_DIR), name="static")
 app.include_router(game_router, prefix="/api")
 app.include_router(chat_router, prefix="/api")
 
+# 서버 시작 시 LLM 제공자 준비 (API 연결 풀을 열고 연결을 미리 맺어 둠)
+@app.on_event("startup")
+async def startup_llm():
+    await start_llm()
+
+# 서버 종료 시 예약된 페이즈 전환과 LLM 제공자 정리
+@app.on_event("shutdown")
+async def shutdown_scheduler():
+    phase_scheduler.shutdown()
+    await close_llm()
+
 # 기본 라우트
 @app.get("/")
 async def read_index():
@@ -42,7 +58,11 @@ async def get_status():
     """서버 상태 확인"""
     return {
         "status": "running",
-        "game_state": game_state.phase,
+        "active_games": len(game_registry),
+        "scheduled_timers": phase_scheduler.pending,
+        "first_ai_message": first_ai_message_latency.to_dict(),
+        "admission": admission.get_status(),
+        "llm_circuit": llm_breaker.get_metrics(),
         "timestamp": datetime.now().isoformat()
     }
 
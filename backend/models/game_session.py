@@ -0,0 +1,89 @@
+import time
+import uuid
+from typing import Dict, List, Optional
+from models.game_state import GameState
+from game.game_actor import GameActor
+from game.phase_scheduler import phase_scheduler
+from game.admission import admission
+from utils.config import SESSION_IDLE_TIMEOUT
+
+# 게임 세션 (게임 하나의 상태와 런타임 자원)
+class GameSession:
+    def __init__(self, game_id: str):
+        self.game_id = game_id
+        self.state = GameState(game_id)
+        self.actor = GameActor(game_id)  # 상태 변경은 모두 이 액터를 거침
+        self.created_at = time.monotonic()
+        self.last_active = self.created_at
+
+    def touch(self):
+        """마지막 활동 시각 갱신"""
+        self.last_active = time.monotonic()
+
+    def close(self, release_slot: bool = True):
+        """세션 종료 시 자원 정리 (release_slot이 False면 입장 자리는 반납하지 않음)"""
+        if release_slot:
+            admission.release(self.game_id)
+        phase_scheduler.cancel_game(self.game_id)
+        for task in self.state.intro_tasks.values():
+            task.cancel()
+        if self.state.agents is not None:
+            self.state.agents.release()
+        if self.state.summarizer is not None:
+            self.state.summarizer.close()
+        self.actor.close()
+
+# game_id로 게임 세션을 찾는 레지스트리
+class GameSessionRegistry:
+    def __init__(self, idle_timeout: int = SESSION_IDLE_TIMEOUT):
+        self._sessions: Dict[str, GameSession] = {}
+        self.idle_timeout = idle_timeout
+        self._last_reap = time.monotonic()
+
+    def create(self, game_id: str = None) -> GameSession:
+        """새 게임 세션 생성 (같은 game_id가 있으면 교체, 입장 자리는 새 세션이 넘겨받음)"""
+        if game_id is None:
+            game_id = uuid.uuid4().hex
+        if game_id in self._sessions:
+            self.remove(game_id, release_slot=False)
+        self.reap_idle()
+        session = GameSession(game_id)
+        self._sessions[game_id] = session
+        return session
+
+    def get(self, game_id: str) -> Optional[GameSession]:
+        """game_id로 세션 조회 (O(1))"""
+        return self._sessions.get(game_id)
+
+    def remove(self, game_id: str, release_slot: bool = True) -> bool:
+        """세션 제거 및 정리"""
+        session = self._sessions.pop(game_id, None)
+        if session is None:
+            return False
+        session.close(release_slot)
+        return True
+
+    def game_ids(self) -> List[str]:
+        """활성 게임 ID 목록"""
+        return list(self._sessions.keys())
+
+    def reap_idle(self):
+        """유휴 시간이 지난 세션 정리 (최대 1분에 한 번)"""
+        now = time.monotonic()
+        if now - self._last_reap < 60:
+            return
+        self._last_reap = now
+        expired = [game_id for game_id, session in self._sessions.items()
+                   if now - session.last_active > self.idle_timeout]
+        for game_id in expired:
+            print(f"🧹 유휴 게임 세션 정리: {game_id}")
+            self.remove(game_id)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self._sessions
+
+# 전역 게임 세션 레지스트리 인스턴스
+game_registry = GameSessionRegistry()
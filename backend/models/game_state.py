@@ -1,15 +1,19 @@
+from models.message_log import MessageLog
+
 # 게임 상태 관리
 class GameState:
-    def __init__(self):
+    def __init__(self, game_id: str = None):
         self.phase = "waiting"  # waiting, introduction, night, day, voting, gameOver
         self.turn = 0  # 1-3턴
         self.players = []  # 플레이어 목록
         self.roles = {}  # 각 플레이어의 역할
-        self.chat_history = []  # 채팅 기록
+        self.chat_history = MessageLog()  # 채팅 기록 (append-only, 메시지마다 순번)
+        self.summarizer = None  # 오래된 대화의 누적 요약 (게임 시작 때 생성, agents.conversation_summarizer.ConversationSummarizer)
         self.votes = {}  # 투표 결과
+        self.vote_context = None  # 현재 투표 페이즈에서 AI들이 공유하는 컨텍스트
         self.eliminated = []  # 탈락한 플레이어
         self.introduction_complete = False  # 자기소개 완료 여부
-        self.game_id = None
-
-# 전역 게임 상태 인스턴스
-game_state = GameState()
+        self.agents = None  # AI 에이전트 풀 (게임 시작 때 생성, agents.agent_pool.AgentPool)
+        self.intro_tasks = {}  # 미리 생성 중인 AI 자기소개 (플레이어 -> asyncio.Task)
+        self.discussion_mode = "sequential"  # AI 토론 생성 방식 (sequential, concurrent, ensemble)
+        self.game_id = game_id
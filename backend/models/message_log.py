@@ -0,0 +1,32 @@
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Union
+
+# 게임 하나의 append-only 메시지 로그
+# 메시지는 추가되는 순간 순번(seq = 로그 인덱스)을 받고 읽기 전용으로 고정됨.
+# AI 메모리는 메시지를 복사하지 않고 순번만 들고 이 로그를 참조함
+class MessageLog:
+    def __init__(self):
+        self._messages: List[Mapping] = []
+
+    def append(self, message: Dict) -> int:
+        """메시지 추가 후 순번 반환"""
+        seq = len(self._messages)
+        self._messages.append(MappingProxyType({**message, "seq": seq}))
+        return seq
+
+    def since(self, seq: int) -> List[Mapping]:
+        """seq 이후(포함)의 메시지 목록"""
+        return self._messages[seq:]
+
+    def to_list(self) -> List[Dict]:
+        """JSON 응답용 일반 dict 목록"""
+        return [dict(message) for message in self._messages]
+
+    def __getitem__(self, index: Union[int, slice]):
+        return self._messages[index]
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __iter__(self) -> Iterator[Mapping]:
+        return iter(self._messages)
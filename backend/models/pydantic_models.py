@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Literal, Optional
 
 class ChatMessage(BaseModel):
     sender: str
@@ -15,6 +15,8 @@ class GameAction(BaseModel):
 
 class GameStartRequest(BaseModel):
     player_name: str
+    game_id: Optional[str] = None  # 지정하면 해당 게임을 새로 시작
+    discussion_mode: Optional[Literal["sequential", "concurrent", "ensemble"]] = None  # AI 토론 생성 방식 (없으면 AI_DISCUSSION_MODE)
 
 class VoteRequest(BaseModel):
     voter: str
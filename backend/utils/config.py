@@ -7,18 +7,117 @@ load_dotenv()
 # OpenAI 설정
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# LLM 제공자: "openai", "stub" (네트워크 없이 동작하는 결정적 스텁) 또는 "auto" (API 키가 있으면 openai, 없으면 stub)
+LLM_PROVIDER = os.getenv("LLM_PROVIDER", "auto")
+# 스텁 제공자 설정: 응답 지연(ms) = LLM_STUB_LATENCY_MS + [0, LLM_STUB_JITTER_MS), 보고할 토큰 수 (비우면 길이로 추정)
+LLM_STUB_LATENCY_MS = float(os.getenv("LLM_STUB_LATENCY_MS", "0"))
+LLM_STUB_JITTER_MS = float(os.getenv("LLM_STUB_JITTER_MS", "0"))
+LLM_STUB_INPUT_TOKENS = int(os.getenv("LLM_STUB_INPUT_TOKENS")) if os.getenv("LLM_STUB_INPUT_TOKENS") else None
+LLM_STUB_OUTPUT_TOKENS = int(os.getenv("LLM_STUB_OUTPUT_TOKENS")) if os.getenv("LLM_STUB_OUTPUT_TOKENS") else None
+# LLM 호출 카세트: "record" (응답을 파일에 기록), "replay" (파일의 응답을 재생, API 호출 없음), 비우면 사용 안 함
+LLM_CASSETTE_MODE = os.getenv("LLM_CASSETTE_MODE", "")
+LLM_CASSETTE_PATH = os.getenv("LLM_CASSETTE_PATH", "cassettes/llm_calls.jsonl")
+# replay에서 기록된 지연 시간만큼 기다렸다가 응답
+LLM_CASSETTE_SIMULATE_LATENCY = os.getenv("LLM_CASSETTE_SIMULATE_LATENCY", "false").lower() == "true"
+# 완성 응답 캐시 (LRU + TTL): 같은 요청은 API를 다시 호출하지 않음
+# LLM_CACHE_MAX_TEMPERATURE 이하의 온도로 보낸 요청만 캐시 (기본 0: 결정적인 요청만)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true"
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024"))
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", "600"))
+LLM_CACHE_MAX_TEMPERATURE = float(os.getenv("LLM_CACHE_MAX_TEMPERATURE", "0"))
+# OpenAI API HTTP 연결 풀 (서버 시작 때 열고 종료 때 닫음)
+LLM_HTTP_MAX_CONNECTIONS = int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "20"))  # 동시 요청 수 상한 (넘으면 풀에서 대기)
+LLM_HTTP_MAX_KEEPALIVE = int(os.getenv("LLM_HTTP_MAX_KEEPALIVE", "10"))  # 유지할 유휴 연결 수
+LLM_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("LLM_HTTP_KEEPALIVE_EXPIRY", "60"))  # 유휴 연결 유지 시간(초)
+LLM_HTTP_HTTP2 = os.getenv("LLM_HTTP_HTTP2", "false").lower() == "true"  # h2 패키지 필요
+LLM_HTTP_CONNECT_TIMEOUT = float(os.getenv("LLM_HTTP_CONNECT_TIMEOUT", "5"))
+LLM_HTTP_READ_TIMEOUT = float(os.getenv("LLM_HTTP_READ_TIMEOUT", "60"))
+LLM_HTTP_POOL_TIMEOUT = float(os.getenv("LLM_HTTP_POOL_TIMEOUT", "30"))  # 풀이 가득 찼을 때 최대 대기 시간(초)
+LLM_HTTP_WARM_CONNECTIONS = int(os.getenv("LLM_HTTP_WARM_CONNECTIONS", "2"))  # 서버 시작 때 미리 맺어 둘 연결 수
+# 프로세스 전체 LLM 호출 속도 제한 (분당 요청 수/토큰 수, 0이면 제한 없음)
+# 한도에 닿으면 요청은 실패하지 않고 도착 순서대로 기다림. 기본값은 gpt-4o-mini 1등급 한도
+LLM_RATE_LIMIT_RPM = float(os.getenv("LLM_RATE_LIMIT_RPM", "500"))
+LLM_RATE_LIMIT_TPM = float(os.getenv("LLM_RATE_LIMIT_TPM", "200000"))
+# LLM 호출 스케줄러: 동시에 진행하는 호출 수 상한과 우선순위 등급별 가중치
+# 자리가 나면 등급 가중치와 게임별 공정 큐로 다음 호출을 고름 (interactive: 사람이 기다리는 호출, background: 요약 등)
+LLM_MAX_CONCURRENT_CALLS = int(os.getenv("LLM_MAX_CONCURRENT_CALLS", "16"))
+LLM_PRIORITY_WEIGHTS = {
+    "interactive": float(os.getenv("LLM_PRIORITY_WEIGHT_INTERACTIVE", "16")),
+    "near_term": float(os.getenv("LLM_PRIORITY_WEIGHT_NEAR_TERM", "4")),
+    "background": float(os.getenv("LLM_PRIORITY_WEIGHT_BACKGROUND", "1")),
+}
+# 첫 AI 발언까지 걸리는 시간의 p95 목표(ms)
+SLO_FIRST_AI_MESSAGE_P95_MS = float(os.getenv("SLO_FIRST_AI_MESSAGE_P95_MS", "3000"))
+# 헤지 요청: 호출 종류별 최근 응답 시간의 p백분위까지 답이 없으면 같은 요청을 한 번 더 보내 먼저 온 응답 사용
+LLM_HEDGE_ENABLED = os.getenv("LLM_HEDGE_ENABLED", "false").lower() == "true"
+LLM_HEDGE_CALL_TYPES = [t.strip() for t in os.getenv("LLM_HEDGE_CALL_TYPES", "discussion,ensemble,vote,night").split(",") if t.strip()]
+LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "90"))
+LLM_HEDGE_BUDGET = float(os.getenv("LLM_HEDGE_BUDGET", "0.15"))  # 헤지 요청 수 상한 (헤지 대상 호출 수 대비 비율, 100 - 백분위(%)보다 커야 꼬리를 덮음)
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))  # 호출 종류별로 이만큼 응답 시간을 모은 뒤부터 헤지
+# 처리 중인 같은 요청이 또 오면 새로 호출하지 않고 결과를 함께 받음 (singleflight)
+LLM_SINGLEFLIGHT_ENABLED = os.getenv("LLM_SINGLEFLIGHT_ENABLED", "true").lower() == "true"
+
 # AI 모델 설정
 # 사용 가능한 모델: "gpt-4o-mini", "gpt-5-mini"
 AI_MODEL = os.getenv("AI_MODEL", "gpt-4o-mini")
+# 모든 AI 호출의 샘플링 온도 고정 (비우면 호출 종류별 기본값). 0으로 두면 같은 프롬프트는 응답 캐시에서 재사용됨
+AI_TEMPERATURE = float(os.getenv("AI_TEMPERATURE")) if os.getenv("AI_TEMPERATURE") else None
+
+# AI 토론 생성 방식 기본값: "sequential" (한 명씩), "concurrent" (동시 생성),
+# "ensemble" (한 번의 JSON 응답으로 모든 AI 발언 생성)
+AI_DISCUSSION_MODE = os.getenv("AI_DISCUSSION_MODE", "sequential")
+# 한 게임에서 동시에 보내는 AI 호출 수 상한
+AI_MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", "4"))
+
+# 투표/밤 행동 결정 방식
+# "logit_bias": 숫자 토큰만 허용해 한 토큰으로 답함 (기본), "json_schema": 후보 이름 enum으로 제한한 JSON
+# (logit_bias를 지원하지 않는 모델은 json_schema 사용)
+AI_DECISION_MODE = os.getenv("AI_DECISION_MODE", "logit_bias")
+
+# 호출 종류별 프롬프트 컨텍스트(메모리 요약 + 최근 대화) 토큰 예산
+# 게임이 길어져도 입력 토큰 수가 이 값을 넘지 않음
+CONTEXT_TOKEN_BUDGETS = {
+    "discussion": int(os.getenv("AI_CONTEXT_BUDGET_DISCUSSION", "700")),
+    "vote": int(os.getenv("AI_CONTEXT_BUDGET_VOTE", "600")),
+    "night": int(os.getenv("AI_CONTEXT_BUDGET_NIGHT", "500")),
+    # ensemble 토론: 공유 대화 컨텍스트 한 번 + AI별 개인 컨텍스트
+    "ensemble_shared": int(os.getenv("AI_CONTEXT_BUDGET_ENSEMBLE_SHARED", "600")),
+    "ensemble_agent": int(os.getenv("AI_CONTEXT_BUDGET_ENSEMBLE_AGENT", "250")),
+}
+
+# 호출 종류별 응답 마감 시간 (초, 0이면 없음). 두 가지로 쓰임
+# - 페이즈 전체 마감: 라우트가 요청을 받은 시점부터 재며, 스케줄러/속도 제한 대기와 순차 토론의 모든 발언을 포함.
+#   지나면 아직 답하지 않은 AI는 로컬 휴리스틱으로 대체 (토론 라우트는 ensemble 방식이어도 discussion 값을 사용)
+# - 제공자 쪽 마감: 호출 하나를 제공자로 보낸 시점부터 재며, 넘으면 회로 차단기에 실패로 기록
+AI_DEADLINES = {
+    "discussion": float(os.getenv("AI_DEADLINE_DISCUSSION", "4")),
+    "ensemble": float(os.getenv("AI_DEADLINE_ENSEMBLE", "4")),
+    "vote": float(os.getenv("AI_DEADLINE_VOTE", "2")),
+    "night": float(os.getenv("AI_DEADLINE_NIGHT", "2")),
+    "introduction": float(os.getenv("AI_DEADLINE_INTRODUCTION", "6")),
+}
+# LLM 회로 차단기: 제공자로 보낸 최근 호출 중 실패(오류/마감 초과) 비율이 높으면 일정 시간 모든 AI가 휴리스틱을 사용
+LLM_BREAKER_ENABLED = os.getenv("LLM_BREAKER_ENABLED", "true").lower() == "true"
+LLM_BREAKER_WINDOW = int(os.getenv("LLM_BREAKER_WINDOW", "20"))  # 실패 비율을 계산하는 최근 호출 수
+LLM_BREAKER_MIN_CALLS = int(os.getenv("LLM_BREAKER_MIN_CALLS", "5"))  # 이보다 적게 호출했으면 열지 않음
+LLM_BREAKER_FAILURE_RATIO = float(os.getenv("LLM_BREAKER_FAILURE_RATIO", "0.5"))
+LLM_BREAKER_COOLDOWN = float(os.getenv("LLM_BREAKER_COOLDOWN", "15"))  # 열린 뒤 시험 호출을 보내기까지 기다리는 시간 (초)
+
+# 대화 요약 설정 (페이즈가 바뀔 때 오래된 대화를 백그라운드에서 요약)
+SUMMARY_RECENT_TAIL = int(os.getenv("SUMMARY_RECENT_TAIL", "8"))  # 요약하지 않고 프롬프트에 그대로 넣는 최근 메시지 수
+SUMMARY_MIN_NEW_MESSAGES = int(os.getenv("SUMMARY_MIN_NEW_MESSAGES", "6"))  # 새로 요약할 메시지가 이보다 적으면 건너뜀
+SUMMARY_MAX_TOKENS = int(os.getenv("SUMMARY_MAX_TOKENS", "200"))
 
 # 모델별 가격 정보 (1000 토큰당 USD)
 MODEL_PRICING = {
     "gpt-4o-mini": {
         "input": 0.00015,   # $0.00015 per 1K input tokens
+        "cached_input": 0.000075,  # $0.000075 per 1K cached input tokens (프롬프트 접두사 캐시)
         "output": 0.0006    # $0.0006 per 1K output tokens
     },
     "gpt-5o-mini": {
         "input": 0.00015,   # $0.00015 per 1K input tokens
+        "cached_input": 0.000075,  # $0.000075 per 1K cached input tokens (프롬프트 접두사 캐시)
         "output": 0.0006    # $0.0006 per 1K output tokens
     }
 }
@@ -27,5 +126,22 @@ MODEL_PRICING = {
 HOST = "0.0.0.0"
 PORT = 8000
 
+# 게임 세션 설정
+# 한 프로세스가 동시에 관리하는 게임 세션의 유휴 만료 시간 (초)
+SESSION_IDLE_TIMEOUT = int(os.getenv("SESSION_IDLE_TIMEOUT", "1800"))
+
+# 입장 제어 (과부하 때 새 게임은 줄을 세우거나 503으로 빨리 거절하고, 진행 중인 게임의 응답성을 지킴)
+ADMISSION_MAX_ACTIVE_GAMES = int(os.getenv("ADMISSION_MAX_ACTIVE_GAMES", "100"))  # 동시에 진행하는 게임 수 상한 (0이면 제한 없음)
+ADMISSION_MODE = os.getenv("ADMISSION_MODE", "queue")  # 자리가 없을 때 새 게임: "queue" (대기열에서 기다림) 또는 "reject" (바로 503)
+ADMISSION_QUEUE_SIZE = int(os.getenv("ADMISSION_QUEUE_SIZE", "50"))  # 대기열 길이 (넘으면 503)
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "10"))  # 대기열에서 기다리는 최대 시간 (초, 넘으면 503)
+# 밀려 있는 LLM 호출(background 제외) 수 기준
+ADMISSION_NEW_GAME_MAX_LLM_QUEUE = int(os.getenv("ADMISSION_NEW_GAME_MAX_LLM_QUEUE", "32"))  # 이보다 많으면 새 게임을 받지 않음
+ADMISSION_MAX_LLM_QUEUE = int(os.getenv("ADMISSION_MAX_LLM_QUEUE", "128"))  # 이보다 많으면 진행 중인 게임의 AI 요청도 503
+
+# 자동 진행 예약 시간 (초)
+DAY_TURN_ADVANCE_DELAY = float(os.getenv("DAY_TURN_ADVANCE_DELAY", "3"))  # 사용자 발언 후 다음 토론 턴
+VOTING_RESOLUTION_DELAY = float(os.getenv("VOTING_RESOLUTION_DELAY", "5"))  # 투표 결과 처리
+
 # 정적 파일 경로
 STATIC_FILES_DIR = "../ai-chat-ui"
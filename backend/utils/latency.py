@@ -0,0 +1,40 @@
+from collections import deque
+from typing import Any, Dict, Optional
+from utils.config import SLO_FIRST_AI_MESSAGE_P95_MS
+
+# 최근 지연 시간 기록과 백분위 (최근 window개만 보관)
+class LatencyTracker:
+    def __init__(self, window: int = 1000, slo: Optional[float] = None):
+        """
+        window: 백분위 계산에 쓰는 최근 측정 수
+        slo: p95 목표(초). 있으면 to_dict()에 목표와 달성 여부를 포함
+        """
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.slo = slo
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+        self.count += 1
+
+    def percentile(self, p: float) -> float:
+        """최근 측정의 p 백분위(초), 측정이 없으면 0"""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {
+            "count": self.count,
+            "p50_ms": round(self.percentile(50) * 1000, 1),
+            "p95_ms": round(self.percentile(95) * 1000, 1),
+            "max_ms": round(max(self.samples, default=0.0) * 1000, 1),
+        }
+        if self.slo is not None:
+            result["slo_p95_ms"] = round(self.slo * 1000, 1)
+            result["within_slo"] = self.percentile(95) <= self.slo
+        return result
+
+# 토론 요청부터 첫 AI 발언이 나오기까지 걸린 시간 (/game/ai-speak-first 등)
+first_ai_message_latency = LatencyTracker(slo=SLO_FIRST_AI_MESSAGE_P95_MS / 1000)
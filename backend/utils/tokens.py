@@ -0,0 +1,21 @@
+import re
+from typing import Dict, List
+
+# 토크나이저 없이 쓰는 빠른 토큰 수 추정
+# 한글/한자/가나 등 넓은 문자는 글자당 약 1토큰, 그 밖의 문자(영문, 숫자, 기호, 공백)는 4글자당 약 1토큰으로 계산.
+# 실제 토큰 수보다 약간 크게 잡히도록 올림 처리함
+_WIDE_CHARS = re.compile(r"[ᄀ-ᇿ　-鿿가-힯豈-﫿\U0001f000-\U0001faff]")
+
+# 채팅 메시지 하나에 붙는 역할/구분자 토큰
+MESSAGE_OVERHEAD_TOKENS = 4
+
+def estimate_tokens(text: str) -> int:
+    """문자열의 토큰 수 추정"""
+    if not text:
+        return 0
+    wide = len(_WIDE_CHARS.findall(text))
+    return wide + (len(text) - wide + 3) // 4
+
+def estimate_message_tokens(messages: List[Dict]) -> int:
+    """채팅 메시지 목록(OpenAI 형식)의 입력 토큰 수 추정"""
+    return sum(estimate_tokens(message.get("content") or "") + MESSAGE_OVERHEAD_TOKENS for message in messages)